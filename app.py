@@ -160,6 +160,13 @@ def display_sidebar():
             st.session_state.conversation.append({"role": "user", "message": "Show coding categories"})
             st.session_state.conversation.append({"role": "bot", "message": response})
 
+        # Question lists are answered one page at a time
+        if st.session_state.chat_bot.context.get('questions_page'):
+            if st.button("➡️ More Questions"):
+                response = st.session_state.chat_bot.process_message("more")
+                st.session_state.conversation.append({"role": "user", "message": "More questions"})
+                st.session_state.conversation.append({"role": "bot", "message": response})
+
         st.markdown("### Settings")
         if st.button("💾 Save Chat"):
             filename = save_chat_history()
@@ -0,0 +1,72 @@
+"""Benchmark near-duplicate detection on batches of scraped-looking questions
+
+Usage: python benchmark_dedup.py [batch_size] [threshold]
+"""
+import random
+import sys
+import time
+
+from interview_bot.dedup import NearDuplicateDetector, NEAR_DUPLICATE_THRESHOLD, dedupe, _load_numpy
+
+COMPANIES = ["Amazon", "Google", "TCS", "Infosys", "Microsoft", "Flipkart", "Paytm", "Amdocs"]
+ROLES = ["QA", "SDET", "Automation Tester", "Test Engineer"]
+TOPICS = ["Selenium waits", "page object model", "REST API testing", "TestNG listeners",
+          "flaky tests", "CI pipelines", "test data management", "cross-browser testing",
+          "stale element exceptions", "parallel execution", "Appium gestures", "BDD with Cucumber"]
+SITES = ["Glassdoor", "GeeksforGeeks", "AmbitionBox", "Naukri", "Indeed"]
+TEMPLATES = [
+    "How do you handle {topic} at {company}?",
+    "Explain {topic} for a {role} role",
+    "{company} {role} interview questions about {topic} | {site}",
+    "What is your approach to {topic} in a {company} {role} interview?",
+    "Describe a time you debugged {topic} issues",
+]
+REWORDINGS = [
+    lambda q: q + " - " + random.choice(SITES),
+    lambda q: q.replace(" | ", " - "),
+    lambda q: q.upper(),
+    lambda q: q.rstrip("?") + " (2024)",
+]
+
+
+def make_batch(size, duplicate_ratio=0.3, seed=7):
+    """Questions where about `duplicate_ratio` are rewordings of earlier ones"""
+    random.seed(seed)
+    questions = []
+    while len(questions) < size:
+        if questions and random.random() < duplicate_ratio:
+            questions.append(random.choice(REWORDINGS)(random.choice(questions)))
+        else:
+            questions.append(random.choice(TEMPLATES).format(
+                topic=random.choice(TOPICS) + f" #{random.randint(1, 10 ** 6)}",
+                company=random.choice(COMPANIES), role=random.choice(ROLES), site=random.choice(SITES)
+            ))
+    return questions
+
+
+def main(size=10000, threshold=NEAR_DUPLICATE_THRESHOLD):
+    questions = make_batch(size)
+    detector = NearDuplicateDetector(threshold)
+    print(f"{size} questions, threshold {threshold}, {detector.bands} bands x {detector.rows} rows, "
+          f"NumPy {'available' if _load_numpy() is not None else 'missing'}\n")
+
+    start = time.perf_counter()
+    exact = {q.lower().strip() for q in questions}
+    exact_time = time.perf_counter() - start
+    print(f"Exact lowercase dedup:  {len(exact):6d} kept  {exact_time * 1000:8.1f} ms")
+
+    start = time.perf_counter()
+    kept = dedupe(questions, threshold)
+    near_time = time.perf_counter() - start
+    print(f"MinHash LSH dedup:      {len(kept):6d} kept  {near_time * 1000:8.1f} ms"
+          f"  ({near_time / size * 1e6:.0f} us/question)")
+
+    for half in (size // 2, size):
+        start = time.perf_counter()
+        dedupe(questions[:half], threshold)
+        print(f"  {half:6d} questions: {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+         float(sys.argv[2]) if len(sys.argv) > 2 else NEAR_DUPLICATE_THRESHOLD)
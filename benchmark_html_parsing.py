@@ -0,0 +1,134 @@
+"""Benchmark scraped-page parsing: full BeautifulSoup trees vs declared extractions
+
+Usage: python benchmark_html_parsing.py [repeats]
+
+Pages shaped like each source (google, glassdoor, gfg, ambitionbox) are
+generated, so runs are repeatable without network access.
+"""
+import random
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from interview_bot.page_parser import (extract, _backends, DEFAULT_BACKEND, GOOGLE_RESULTS, GLASSDOOR_QUESTIONS,
+                                       GEEKSFORGEEKS_TEXT, AMBITIONBOX_CONTENT)
+
+
+def google_page(results=10, seed=0):
+    rng = random.Random(seed)
+    parts = ['<html><head><title>results</title><script>var a=1;</script><style>.g{}</style></head>'
+             '<body><div id="main">']
+    for i in range(results):
+        parts.append(
+            f'<div class="g tF2Cxc"><div class="yuRUbf"><a href="https://www.glassdoor.com/q{i}"><br>'
+            f'<h3 class="LC20lb">Amazon QA <b>interview</b> question {i} | Glassdoor</h3>'
+            f'<div class="TbwUpd"><cite>glassdoor.com › Interview</cite></div></a></div>'
+            f'<div class="VwiC3b yXK7lf"><span>Oct 3, 2024 — </span>How do you handle <em>selenium</em> '
+            f'waits? Answer {i} ...</div></div>'
+        )
+        parts.append('<div class="filler">' + ''.join(f'<span class="s{j}">noise {j}</span>'
+                                                      for j in range(rng.randint(20, 60))) + '</div>')
+    return ''.join(parts) + '</div></body></html>'
+
+
+def glassdoor_page(cards=30):
+    parts = ['<html><body>']
+    for i in range(cards):
+        parts.append(
+            f'<div class="card"><p class="questionText">How would you design a selenium framework {i}?</p>'
+            f'<div data-test="interview-question">Explain automation testing strategy {i}</div>'
+            f'<span class="interviewQuestion">Q{i}</span></div>'
+            '<div class="nav">' + '<i>nav</i>' * 40 + '</div>'
+        )
+    return ''.join(parts) + '</body></html>'
+
+
+def gfg_page(sections=60):
+    parts = ['<html><body><nav>' + '<a href="#">link</a>' * 200 + '</nav><article>']
+    for i in range(sections):
+        parts.append(
+            f'<h2>What is selenium webdriver {i}?</h2>'
+            f'<p>Selenium automation testing explanation <code>driver.get()</code> {i}</p>'
+            f'<ul><li>How do you handle frames in selenium {i}?</li></ul>'
+            '<div class="ad">' + '<span>ad</span>' * 20 + '</div>'
+        )
+    return ''.join(parts) + '</article></body></html>'
+
+
+def ambitionbox_page(cards=40):
+    parts = ['<html><body>']
+    for i in range(cards):
+        parts.append(
+            f'<div class="Interview-Card"><p class="question_title">Selenium automation testing question {i}</p>'
+            '<span class="meta">x</span></div>' + '<div>' + '<b>z</b>' * 30 + '</div>'
+        )
+    return ''.join(parts) + '</body></html>'
+
+
+# The full-tree code the scrapers used before declared extractions
+def soup_google(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    results = []
+    for result in soup.find_all('div', {'class': 'g'})[:10]:
+        title = result.find('h3')
+        link = result.find('a')
+        snippet = result.find('span', {'class': 'st'}) or result.find('div', {'class': 'VwiC3b'})
+        results.append({'title': title.get_text(strip=True) if title else None,
+                        'link': link.get('href') if link else None,
+                        'snippet': snippet.get_text(strip=True) if snippet else None})
+    return results
+
+
+def soup_glassdoor(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    return [element.get_text(strip=True)
+            for selector in ['.questionText', '[data-test="interview-question"]', '.interviewQuestion', '.question-text']
+            for element in soup.select(selector)]
+
+
+def soup_gfg(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    return [element.get_text(strip=True) for element in soup.find_all(['h2', 'h3', 'h4', 'p', 'li'])]
+
+
+def soup_ambitionbox(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    elements = soup.find_all(['div', 'p', 'span'],
+                             class_=lambda x: x and ('interview' in x.lower() or 'question' in x.lower()))
+    return [element.get_text(strip=True) for element in elements]
+
+
+SOURCES = {
+    'google': (google_page, soup_google, GOOGLE_RESULTS._replace(limit=10)),
+    'glassdoor': (glassdoor_page, soup_glassdoor, GLASSDOOR_QUESTIONS),
+    'gfg': (gfg_page, soup_gfg, GEEKSFORGEEKS_TEXT),
+    'ambitionbox': (ambitionbox_page, soup_ambitionbox, AMBITIONBOX_CONTENT),
+}
+
+
+def timed(func, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = func()
+    return (time.perf_counter() - start) / repeats * 1000, result
+
+
+def main(repeats=20):
+    pages = [(source, make_page()) for source, (make_page, _, _) in SOURCES.items()]
+
+    print(f"Default backend: {DEFAULT_BACKEND}, {repeats} repeats per page\n")
+    print(f"{'page':12s} {'KB':>6s} {'full soup':>10s} " + ' '.join(f'{name:>12s}' for name in _backends))
+    for source, html in pages:
+        _, baseline, extraction = SOURCES[source]
+        soup_ms, expected = timed(lambda: baseline(html), repeats)
+        row = f"{source:12s} {len(html) / 1024:6.1f} {soup_ms:8.2f}ms "
+        for name in _backends:
+            ms, found = timed(lambda: extract(html, extraction, name), repeats)
+            same = 'ok' if found == expected else 'DIFF'
+            row += f" {ms:7.2f}ms {same:4s}"
+        print(row)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
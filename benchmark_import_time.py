@@ -0,0 +1,134 @@
+"""Report import time of the app entry points and check it against a budget
+
+Usage: python benchmark_import_time.py [top_modules] [entry.py ...]
+
+Each entry point runs in a fresh interpreter under ``python -X importtime``,
+from its own directory. Only the start of the script is executed, up to and
+including its last top-level import, so no CLI loop, server or Streamlit UI
+is started. Entries whose dependencies are not installed are skipped.
+Exits with status 1 when an entry is over its budget or imports a module
+that should only be loaded when first used.
+"""
+import ast
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Budget for the measured imports, in milliseconds
+BUDGETS_MS = {
+    "interview_bot/main.py": 250,
+    "interview_bot/main_optimized.py": 250,
+    "interview_bot/web_app.py": 400,
+    "streamlit_app.py": 1500,
+    "app.py": 1500,
+}
+# Deferred until first used: the scraping stack until a page is fetched, numpy
+# until a batch of names is scored or questions are deduplicated. Streamlit
+# imports requests and numpy itself, so this is only checked for the entries
+# that do not use it.
+LAZY_MODULES = ("requests", "urllib3", "bs4", "lxml", "numpy")
+STREAMLIT_ENTRIES = ("streamlit_app.py", "app.py")
+
+START_MARKER = "--- entry imports ---"
+MISSING_MARKER = "--- missing module: "
+
+PROBE = """
+import sys, time
+source, path = sys.argv[1], sys.argv[2]
+sys.stderr.write({start!r} + "\\n")
+started = time.perf_counter()
+try:
+    exec(compile(source, path, "exec"), {{"__name__": "__import_probe__", "__file__": path}})
+except ModuleNotFoundError as e:
+    sys.stderr.write({missing!r} + str(e.name) + "\\n")
+    sys.exit(3)
+sys.stderr.write("--- wall ms: %.1f\\n" % ((time.perf_counter() - started) * 1000))
+""".format(start=START_MARKER, missing=MISSING_MARKER)
+
+
+def import_prefix(path):
+    """Source of the script up to and including its last top-level import"""
+    with open(path, 'r', encoding='utf-8') as file:
+        source = file.read()
+    body = ast.parse(source, path).body
+    last = max((i for i, node in enumerate(body) if isinstance(node, (ast.Import, ast.ImportFrom))), default=-1)
+    if last < 0:
+        return ""
+    return "\n".join(source.splitlines()[:body[last].end_lineno]) + "\n"
+
+
+def parse_importtime(stderr):
+    """(self_us, cumulative_us, depth, module) for imports made by the entry, and its wall time"""
+    rows, wall_ms, started = [], None, False
+    for line in stderr.splitlines():
+        if line == START_MARKER:
+            started = True
+        elif line.startswith("--- wall ms: "):
+            wall_ms = float(line.rsplit(" ", 1)[1])
+        elif started and line.startswith("import time:") and "self [us]" not in line:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return rows, wall_ms
+
+
+def measure(entry):
+    path = os.path.join(ROOT, entry)
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE, import_prefix(path), path],
+        cwd=os.path.dirname(path), env=env, capture_output=True, text=True,
+    )
+    if result.returncode == 3:
+        missing = result.stderr.rsplit(MISSING_MARKER, 1)[1].strip()
+        return {"skipped": f"{missing} is not installed"}
+    if result.returncode != 0:
+        return {"skipped": f"exited with {result.returncode}: {result.stderr.strip().splitlines()[-1]}"}
+    rows, wall_ms = parse_importtime(result.stderr)
+    return {
+        "total_ms": sum(cumulative for _, cumulative, depth, _ in rows if depth == 0) / 1000,
+        "wall_ms": wall_ms,
+        "rows": rows,
+        "modules": {name for _, _, _, name in rows},
+    }
+
+
+def main():
+    top = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    entries = sys.argv[2:] or list(BUDGETS_MS)
+    failures = []
+    print(f"Import time of {len(entries)} entry points ({sys.executable}, Python {sys.version.split()[0]})\n")
+    for entry in entries:
+        result = measure(entry)
+        if "skipped" in result:
+            print(f"⏭️  {entry}: skipped ({result['skipped']})\n")
+            continue
+
+        budget = BUDGETS_MS.get(entry)
+        over = budget is not None and result["total_ms"] > budget
+        lazy = []
+        if os.path.basename(entry) not in STREAMLIT_ENTRIES:
+            lazy = sorted(m for m in LAZY_MODULES if m in result["modules"])
+        status = "❌" if over or lazy else "✅"
+        budget_text = f" / budget {budget} ms" if budget is not None else ""
+        print(f"{status} {entry}: {result['total_ms']:.1f} ms imports{budget_text} "
+              f"({result['wall_ms']:.1f} ms wall, {len(result['modules'])} modules)")
+        for self_us, cumulative_us, _, name in sorted(result["rows"], reverse=True)[:top]:
+            print(f"     {self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms cumulative  {name}")
+        if over:
+            failures.append(f"{entry} is over budget")
+        if lazy:
+            failures.append(f"{entry} imports {', '.join(lazy)} at startup")
+        print()
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ All entry points within budget")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
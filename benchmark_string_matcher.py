@@ -0,0 +1,60 @@
+"""Benchmark company-name scoring: per-pair Levenshtein vs the NumPy batch path
+
+Usage: python benchmark_string_matcher.py [number_of_companies]
+"""
+import random
+import string
+import sys
+import time
+
+from interview_bot.string_matcher import (
+    CompanyIndex, batch_levenshtein, encode_names, levenshtein_distance, _load_numpy
+)
+
+
+def random_company(rng):
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+             for _ in range(rng.randint(1, 3))]
+    return " ".join(words).title()
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main(count=20000):
+    rng = random.Random(42)
+    names = list({random_company(rng) for _ in range(count)})
+    folded = [name.casefold() for name in names]
+    queries = [random_company(rng).casefold() for _ in range(5)]
+    index = CompanyIndex(names)
+
+    has_numpy = _load_numpy() is not None
+    print(f"Scoring {len(names)} company names (NumPy {'available' if has_numpy else 'missing'})\n")
+
+    loop_time, expected = timed(lambda: [levenshtein_distance(queries[0], n) for n in folded], 1)
+    print(f"Pure Python, one pair at a time:  {loop_time * 1000:9.1f} ms/query")
+
+    if has_numpy:
+        encoded = encode_names(folded)
+        batch_time, result = timed(lambda: batch_levenshtein(queries[0], folded, encoded), 5)
+        assert result == expected, "batch distances differ from levenshtein_distance"
+        print(f"NumPy batch (pre-encoded):        {batch_time * 1000:9.1f} ms/query"
+              f"  ({loop_time / batch_time:.0f}x)")
+
+    top_time, _ = timed(lambda: [index.top_matches(q, k=5) for q in queries], 1)
+    print(f"CompanyIndex.top_matches(k=5):    {top_time / len(queries) * 1000:9.1f} ms/query")
+
+    fuzzy_time, _ = timed(lambda: [index.find_closest_match(q) for q in queries], 20)
+    print(f"CompanyIndex.find_closest_match:  {fuzzy_time / len(queries) * 1000:9.3f} ms/query")
+
+    print(f"\nTop matches for '{queries[0]}':")
+    for name, score in index.top_matches(queries[0], k=5):
+        print(f"  {score:.2f}  {name}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -23,6 +23,13 @@ class ChatBot:
         with open(filename, 'w') as f:
             json.dump(self.conversation_history, f, indent=2)
             
+    def _questions_page(self, company, experience, cursor=None):
+        """Format one page of questions and remember where the next one starts"""
+        page = self.bot.get_interview_questions_page(company, experience, cursor=cursor)
+        next_cursor = page.get("next_cursor")
+        self.context['questions_page'] = (company, experience, next_cursor) if next_cursor else None
+        return self.bot.format_response(page)
+
     def process_message(self, message):
         """Process user message and return response"""
         message = message.lower().strip()
@@ -34,8 +41,18 @@ class ChatBot:
             "timestamp": datetime.now().isoformat()
         })
         
+        parsed = self.bot.get_message_parser().parse(message)
+        intents = ['greeting', 'company_questions']
+        if self.context.get('questions_page'):
+            intents.append('more')
+        intents += ['categories', 'companies', 'coding']
+        if 'current_question' in self.context:
+            intents.append('solution')
+        intents += ['help', 'goodbye']
+        intent = parsed.intent(intents)
+        
         # Initial greeting
-        if any(greeting in message for greeting in ['hi', 'hello', 'hey']):
+        if intent == 'greeting':
             response = (
                 "Hello! I'm your Interview Preparation Assistant. I can help you with:\n"
                 "1. Finding interview questions for specific companies\n"
@@ -47,22 +64,18 @@ class ChatBot:
             )
             
         # Company specific questions
-        elif "questions" in message and any(company.lower() in message for company in self.bot.get_available_companies()):
-            company = next(c for c in self.bot.get_available_companies() if c.lower() in message.lower())
-            
-            # Try to extract experience from message
-            experience = "2"  # default
-            for word in message.split():
-                if word.replace('.', '').isdigit():
-                    experience = word
-                    break
-                    
-            response = self.bot.format_response(
-                self.bot.get_interview_questions(company, experience)
-            )
+        elif intent == 'company_questions':
+            # Experience mentioned in the message, if any
+            experience = parsed.years or "2"  # default
+            response = self._questions_page(parsed.company, experience)
+
+        # Next page of the last question list
+        elif intent == 'more':
+            company, experience, cursor = self.context['questions_page']
+            response = self._questions_page(company, experience, cursor)
             
         # Show categories
-        elif "categories" in message or "topics" in message:
+        elif intent == 'categories':
             categories = self.bot.get_categories()
             if not categories:
                 response = "Sorry, I couldn't load the categories. Please try again."
@@ -74,25 +87,21 @@ class ChatBot:
                         response += f"  - {topic}\n"
                     
         # Show companies
-        elif "companies" in message:
+        elif intent == 'companies':
             companies = self.bot.get_available_companies()
             response = "Here are the companies I have questions for:\n\n"
             response += "\n".join(f"- {company}" for company in companies)
         # Handle coding questions
-        elif "coding" in message:
-            if "categories" in message:
+        elif intent == 'coding':
+            if parsed.has('categories'):
                 categories = self.bot.get_coding_categories()
                 response = "Available coding question categories:\n\n"
                 response += "\n".join(f"- {category}" for category in categories)
-            elif any(category.lower() in message for category in self.bot.get_coding_categories()):
-                category = next(c for c in self.bot.get_coding_categories() if c.lower() in message.lower())
+            elif parsed.coding_category:
+                category = parsed.coding_category
                 difficulties = self.bot.get_coding_difficulties(category)
-                if "easy" in message.lower():
-                    difficulty = "Easy"
-                elif "medium" in message.lower():
-                    difficulty = "Medium"
-                elif "hard" in message.lower():
-                    difficulty = "Hard"
+                if parsed.difficulty:
+                    difficulty = parsed.difficulty
                 else:
                     response = f"Available difficulty levels for {category}:\n\n"
                     response += "\n".join(f"- {diff}" for diff in difficulties)
@@ -121,15 +130,11 @@ class ChatBot:
                     "'Show me an easy Automation coding question' or\n" +
                     "'Give me a hard DSA question'"
                 )
-<<<<<<< HEAD
-        
-=======
 
->>>>>>> 4f8dd752c6b6d73acc9ce3a04eb8b1f91cbcdfd8
         # Show solution for current coding question
-        elif ("solution" in message or "approach" in message or "another" in message) and 'current_question' in self.context:
+        elif intent == 'solution':
             question = self.context['current_question']
-            if "another" in message or "alternative" in message or "different" in message:
+            if parsed.has('another', 'alternative', 'different'):
                 if 'alternative_solutions' in question:
                     alt_solutions = question['alternative_solutions']
                     response = f"Here are alternative approaches for: {question['question']}\n\n"
@@ -150,7 +155,7 @@ class ChatBot:
                 )
 
         # Help message
-        elif "help" in message:
+        elif intent == 'help':
             response = (
                 "Here's how you can interact with me:\n\n"
                 "Interview Questions:\n"
@@ -167,34 +172,17 @@ class ChatBot:
             )
             
         # Goodbye
-        elif any(word in message for word in ['bye', 'goodbye', 'exit', 'quit']):
+        elif intent == 'goodbye':
             self.save_conversation()
             response = "Thank you for using the Interview Bot! Your conversation has been saved. Good luck with your interview preparation!"
             
         # Default response - try internet search for technical queries
         else:
             # Identify question type and category
-            query_categories = {
-                'technical': ['how to', 'what is', 'explain', 'difference between', 'example', 'code', 'programming',
-                            'function', 'class', 'implement', 'python', 'java', 'javascript', 'selenium', 'api', 'test'],
-                'behavioral': ['tell me about', 'how did you', 'describe', 'situation', 'challenge', 'conflict',
-                             'difficult', 'team', 'leadership', 'achievement', 'mistake', 'pressure', 'deadline'],
-                'system_design': ['design', 'architecture', 'scale', 'database', 'system', 'infrastructure',
-                                'microservice', 'distributed', 'cloud', 'performance', 'optimization'],
-                'hr': ['salary', 'notice', 'joining', 'relocation', 'package', 'benefits', 'work culture',
-                      'company values', 'career growth', 'expectations', 'why join', 'why leave']
-            }
-            
-            # Determine category
-            message_lower = message.lower()
-            category = None
-            for cat, keywords in query_categories.items():
-                if any(keyword in message_lower for keyword in keywords):
-                    category = cat
-                    break
+            category = parsed.query_category
             
             # Search for answer
-            if category or 'interview' in message_lower or 'question' in message_lower:
+            if category or parsed.has('interview', 'question'):
                 search_results = self.bot.search_internet(message, category)
                 if search_results:
                     response = f"Here's what I found:\n\n{search_results}"
@@ -0,0 +1,260 @@
+"""Compiled, per-company sharded form of the question database.
+
+``compile_db`` turns a questions JSON file into a ``.qdb`` artifact in the
+user cache directory (see ``settings.get_cache_dir``): a fixed header, a small marshal manifest (everything except the
+questions, plus where each company's shard lives) and one marshal shard per
+company holding its questions and prebuilt question index postings.
+
+``open_shards`` memory-maps the artifact and reads only the manifest; a
+company's shard is unmarshalled when it is asked for. The artifact is used
+while its checksum matches the JSON source; otherwise the JSON is parsed
+and the artifact rebuilt for the next start.
+
+Run ``python -m interview_bot.compiled_db [path.json ...]`` to build the
+artifacts ahead of time.
+"""
+import hashlib
+import importlib.util
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from .question_index import INDEXED_FIELDS
+    from .settings import get_cache_dir
+except ImportError:
+    from question_index import INDEXED_FIELDS
+    from settings import get_cache_dir
+
+COMPILED_SUFFIX = '.qdb'
+FORMAT_VERSION = 2
+_MAGIC = b'IQDB'
+# magic, format version, Python bytecode magic (marshal is version-specific),
+# source size, source mtime_ns, source SHA-256, manifest CRC-32, manifest length
+_HEADER = struct.Struct('<4sH4sQq32sIQ')
+
+Postings = Dict[str, Dict[Any, Tuple[int, ...]]]
+
+
+def compiled_path(json_path: str) -> str:
+    """Artifact path for a JSON file: its name plus a hash of its full path, in the cache directory"""
+    source = os.path.realpath(json_path)
+    name = os.path.splitext(os.path.basename(source))[0]
+    digest = hashlib.sha1(source.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(get_cache_dir(), f"{name}-{digest}{COMPILED_SUFFIX}")
+
+
+def _sha256(path: str) -> bytes:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def build_postings(db: Dict[str, Any]) -> Postings:
+    """Question IDs per indexed (field, value), in QuestionIndex.from_db order"""
+    postings = {field: defaultdict(list) for field in INDEXED_FIELDS}
+    qid = 0
+    for company, exp_ranges in db.get("companies", {}).items():
+        for exp_range, questions in exp_ranges.items():
+            if not isinstance(questions, list):
+                continue
+            for question in questions:
+                postings["company"][company].append(qid)
+                postings["exp_range"][exp_range].append(qid)
+                postings["category"][question.get("category")].append(qid)
+                postings["difficulty"][question.get("difficulty")].append(qid)
+                qid += 1
+    return {field: {value: tuple(ids) for value, ids in values.items()} for field, values in postings.items()}
+
+
+def _build_artifact(json_path: str, db: Dict[str, Any]) -> bytes:
+    """Header, manifest and company shards for a parsed database"""
+    stat = os.stat(json_path)
+    meta = {key: value for key, value in db.items() if key != "companies"}
+    blobs, entries = [], []
+    for company, exp_ranges in db.get("companies", {}).items():
+        postings = build_postings({"companies": {company: exp_ranges}})
+        blob = marshal.dumps({"exp_ranges": exp_ranges, "postings": postings})
+        count = sum(len(ids) for ids in postings["company"].values())
+        # The values present let cross-company lookups skip shards that cannot match
+        values = {field: tuple(postings[field]) for field in INDEXED_FIELDS if field != "company"}
+        entries.append((company, len(blob), zlib.crc32(blob), count, values))
+        blobs.append(blob)
+
+    # Shard offsets depend on the manifest's own length: repeat until it is stable
+    manifest = b''
+    while True:
+        offset = _HEADER.size + len(manifest)
+        shards = []
+        for company, length, crc, count, values in entries:
+            shards.append((company, offset, length, crc, count, values))
+            offset += length
+        encoded = marshal.dumps({"meta": meta, "shards": tuple(shards)})
+        stable = len(encoded) == len(manifest)
+        manifest = encoded
+        if stable:
+            break
+
+    header = _HEADER.pack(_MAGIC, FORMAT_VERSION, importlib.util.MAGIC_NUMBER, stat.st_size,
+                          stat.st_mtime_ns, _sha256(json_path), zlib.crc32(manifest), len(manifest))
+    return b''.join([header, manifest] + blobs)
+
+
+def _write_artifact(json_path: str, artifact: bytes) -> str:
+    """Write to a temporary name and rename, so readers never see half a file
+    and processes that mapped the old artifact keep a consistent copy"""
+    out_path = compiled_path(json_path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(out_path) or '.', suffix=COMPILED_SUFFIX)
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(artifact)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return out_path
+
+
+def compile_db(json_path: str) -> str:
+    """Write the compiled artifact for a questions JSON file and return its path"""
+    with open(json_path, 'r', encoding='utf-8') as file:
+        db = json.load(file)
+    return _write_artifact(json_path, _build_artifact(json_path, db))
+
+
+class ShardFile:
+    """An opened artifact: its manifest, and company shards read on demand.
+
+    `buffer` is the memory-mapped file, or the artifact bytes when it could
+    not be written to disk.
+    """
+
+    def __init__(self, json_path: str, buffer, manifest: Dict[str, Any]):
+        self.json_path = json_path
+        self._buffer = buffer
+        self.meta: Dict[str, Any] = manifest["meta"]
+        self._shards = {entry[0]: entry for entry in manifest["shards"]}
+        self.companies: Tuple[str, ...] = tuple(entry[0] for entry in manifest["shards"])
+
+    def __contains__(self, company) -> bool:
+        return company in self._shards
+
+    def count(self, company: str) -> int:
+        return self._shards[company][4]
+
+    def values(self, company: str) -> Dict[str, Tuple[Any, ...]]:
+        """Distinct exp_range, category and difficulty values of a company's questions"""
+        return self._shards[company][5]
+
+    def load(self, company: str) -> Tuple[Dict[str, Any], Postings]:
+        """A company's experience ranges (as in the JSON) and its index postings"""
+        _, offset, length, crc, _, _ = self._shards[company]
+        with memoryview(self._buffer) as view, view[offset:offset + length] as blob:
+            if zlib.crc32(blob) == crc:
+                shard = marshal.loads(blob)
+                return shard["exp_ranges"], shard["postings"]
+        # Damaged after it was opened: serve this company from the JSON source
+        print(f"⚠️ Corrupt shard for {company} in {compiled_path(self.json_path)}, reading the JSON")
+        with open(self.json_path, 'r', encoding='utf-8') as file:
+            exp_ranges = json.load(file)["companies"][company]
+        return exp_ranges, build_postings({"companies": {company: exp_ranges}})
+
+    def read_all(self) -> Dict[str, Any]:
+        """The whole database as a fresh, mutable dict (same as json.load on the source)"""
+        db = dict(self.meta)
+        db["companies"] = {company: self.load(company)[0] for company in self.companies}
+        return db
+
+
+def _parse_manifest(json_path: str, buffer, check_source: bool = True) -> Optional[ShardFile]:
+    """ShardFile over an artifact that is intact and matches the JSON, or None"""
+    if len(buffer) < _HEADER.size:
+        return None
+    magic, version, py_magic, size, mtime_ns, digest, crc, length = _HEADER.unpack_from(buffer)
+    if (magic, version, py_magic) != (_MAGIC, FORMAT_VERSION, importlib.util.MAGIC_NUMBER):
+        return None
+    stat = os.stat(json_path) if check_source else None
+    if stat is not None and (size, mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+        # Touched (e.g. by a checkout) but possibly unchanged: compare contents
+        if size != stat.st_size or digest != _sha256(json_path):
+            return None
+        _update_mtime(compiled_path(json_path), buffer, stat.st_mtime_ns)
+    with memoryview(buffer) as view, view[_HEADER.size:_HEADER.size + length] as manifest:
+        if len(manifest) != length or zlib.crc32(manifest) != crc:
+            return None
+        return ShardFile(json_path, buffer, marshal.loads(manifest))
+
+
+def _open_artifact(json_path: str) -> Optional[ShardFile]:
+    path = compiled_path(json_path)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as file:
+        mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    shard_file = None
+    try:
+        shard_file = _parse_manifest(json_path, mm)
+        return shard_file
+    finally:
+        if shard_file is None:
+            mm.close()
+
+
+def _update_mtime(path: str, buffer, mtime_ns: int):
+    """Record the source's new mtime so the next open skips hashing"""
+    header = list(_HEADER.unpack_from(buffer))
+    header[4] = mtime_ns
+    try:
+        with open(path, 'r+b') as file:
+            file.write(_HEADER.pack(*header))
+    except OSError:
+        pass
+
+
+def open_shards(json_path: str) -> ShardFile:
+    """Open a questions database through its compiled artifact.
+
+    When the artifact is missing, stale, corrupt or from another Python
+    version, the JSON is parsed and the artifact rebuilt. If it cannot be
+    written, the same layout is served from memory instead.
+    """
+    try:
+        shard_file = _open_artifact(json_path)
+    except (OSError, ValueError, EOFError, TypeError, KeyError, struct.error) as e:
+        print(f"⚠️ Ignoring compiled database for {json_path}: {str(e)}")
+        shard_file = None
+    if shard_file is not None:
+        return shard_file
+
+    with open(json_path, 'r', encoding='utf-8') as file:
+        db = json.load(file)
+    if not isinstance(db, dict):
+        raise ValueError("Database is empty or invalid")
+    artifact = _build_artifact(json_path, db)
+    try:
+        _write_artifact(json_path, artifact)
+        print(f"📦 Compiled {json_path} to {compiled_path(json_path)}")
+        shard_file = _open_artifact(json_path)
+    except Exception as e:
+        print(f"⚠️ Could not write compiled database for {json_path}: {str(e)}")
+    return shard_file or _parse_manifest(json_path, artifact, check_source=False)
+
+
+def read_db(json_path: str) -> Dict[str, Any]:
+    """The database as a fresh, mutable dict (same as json.load on the source)"""
+    return open_shards(json_path).read_all()
+
+
+if __name__ == '__main__':
+    default = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'questions_db.json')
+    for source in sys.argv[1:] or [default]:
+        print(f"📦 {source} -> {compile_db(source)}")
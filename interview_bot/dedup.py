@@ -0,0 +1,144 @@
+"""Near-duplicate detection for question text using MinHash and LSH buckets"""
+import random
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+_numpy = None  # the numpy module once imported, False when it is not installed
+
+
+def _load_numpy():
+    """NumPy, imported on first use (it is slow to import); None without it.
+
+    NumPy is optional: without it signatures are computed in pure Python.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+# Jaccard similarity of word shingles above which two questions count as duplicates
+NEAR_DUPLICATE_THRESHOLD = 0.8
+NUM_PERM = 64  # MinHash signature length
+SHINGLE_WORDS = 2  # words per shingle
+
+_MASK64 = (1 << 64) - 1
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def shingles(text: str, size: int = SHINGLE_WORDS) -> FrozenSet[str]:
+    """Overlapping word n-grams of the normalized text (single words if it is shorter)"""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= size:
+        return frozenset([' '.join(words)]) if words else frozenset()
+    return frozenset(' '.join(words[i:i + size]) for i in range(len(words) - size + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def choose_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Pick (bands, rows) so pairs at the threshold almost always share a bucket.
+
+    Two signatures collide in some band with probability 1 - (1 - s^r)^b.
+    Among the layouts that catch at least 95% of pairs at the threshold,
+    the one with the most rows per band yields the fewest false candidates
+    (any leftover signature values are simply not banded).
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= 0.95:
+            best = (bands, rows)
+    return best
+
+
+class NearDuplicateDetector:
+    """Streaming near-duplicate filter.
+
+    Each text gets a MinHash signature over its word shingles. The
+    signature is split into bands, and texts that share a band bucket
+    are candidates, confirmed with the exact Jaccard similarity of their
+    shingle sets. Adding a text costs one signature plus a few bucket
+    lookups, so a whole batch runs in roughly linear time.
+    """
+
+    def __init__(self, threshold: float = NEAR_DUPLICATE_THRESHOLD, num_perm: int = NUM_PERM,
+                 seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+        rng = random.Random(seed)
+        # Hash family h(x) = a*x + b mod 2^64 with odd multipliers
+        self._perms = [(rng.getrandbits(64) | 1, rng.getrandbits(64)) for _ in range(num_perm)]
+        self._np = np = _load_numpy()
+        if np is not None:
+            self._a = np.array([a for a, _ in self._perms], dtype=np.uint64)
+            self._b = np.array([b for _, b in self._perms], dtype=np.uint64)
+        self._buckets: Dict[Tuple, List[int]] = {}
+        self._shingles: List[FrozenSet[str]] = []
+        self._exact = set()  # texts without any words are compared verbatim
+
+    def __len__(self):
+        return len(self._shingles)
+
+    def signature(self, shingle_set: FrozenSet[str]) -> List[int]:
+        hashes = [hash(s) & _MASK64 for s in shingle_set]
+        np = self._np
+        if np is not None:
+            values = np.array(hashes, dtype=np.uint64)[:, None] * self._a + self._b
+            return values.min(axis=0).tolist()
+        return [min((a * h + b) & _MASK64 for h in hashes) for a, b in self._perms]
+
+    def find(self, text: str) -> Optional[int]:
+        """Index of an already added near-duplicate of `text`, or None"""
+        shingle_set = shingles(text)
+        if not shingle_set:
+            return None
+        return self._find(shingle_set, self._band_keys(self.signature(shingle_set)))
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple]:
+        rows = self.rows
+        return [(band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(self.bands)]
+
+    def _find(self, shingle_set, keys) -> Optional[int]:
+        checked = set()
+        for key in keys:
+            for doc_id in self._buckets.get(key, ()):
+                if doc_id in checked:
+                    continue
+                checked.add(doc_id)
+                if jaccard(shingle_set, self._shingles[doc_id]) >= self.threshold:
+                    return doc_id
+        return None
+
+    def add(self, text: str) -> bool:
+        """Remember `text` and return True, or return False if it is a near-duplicate"""
+        shingle_set = shingles(text)
+        if not shingle_set:
+            key = text.strip().lower()
+            if key in self._exact:
+                return False
+            self._exact.add(key)
+            return True
+        keys = self._band_keys(self.signature(shingle_set))
+        if self._find(shingle_set, keys) is not None:
+            return False
+        doc_id = len(self._shingles)
+        self._shingles.append(shingle_set)
+        for key in keys:
+            self._buckets.setdefault(key, []).append(doc_id)
+        return True
+
+
+def dedupe(texts, threshold: float = NEAR_DUPLICATE_THRESHOLD) -> List[int]:
+    """Indexes of the texts to keep: the first of every near-duplicate group"""
+    detector = NearDuplicateDetector(threshold)
+    return [i for i, text in enumerate(texts) if detector.add(text)]
@@ -0,0 +1,86 @@
+"""Keyword-based company domain classification with precompiled patterns"""
+import re
+from typing import Dict, List, Optional
+
+# Keywords that hint at a company's domain; earlier domains win ties
+DOMAIN_KEYWORDS: Dict[str, List[str]] = {
+    'ecommerce': ['shop', 'retail', 'mart', 'buy', 'store', 'commerce', 'market', 'shopping', 'online'],
+    'fintech': ['pay', 'finance', 'money', 'wallet', 'fin', 'cash', 'credit', 'card', 'payment', 'transaction'],
+    'banking': ['bank', 'banking', 'investment', 'trading', 'financial', 'capital', 'asset', 'wealth', 'securities'],
+    'food_delivery': ['food', 'delivery', 'restaurant', 'kitchen', 'meal', 'dining', 'cuisine', 'order'],
+    'technology': ['tech', 'soft', 'it', 'system', 'digital', 'computer', 'software', 'labs', 'consulting', 'solutions', 'services'],
+    'telecom': ['telecom', 'communication', 'network', 'mobile', 'wireless', 'broadband', 'telephony', 'cellular'],
+    'automotive': ['auto', 'car', 'vehicle', 'motor', 'automotive', 'mobility', 'transport'],
+    'healthcare': ['health', 'medical', 'hospital', 'care', 'pharma', 'diagnostic', 'clinical', 'biotech']
+}
+
+
+class TermMatcher:
+    """Finds which group of substrings occurs in a text, in group priority order.
+
+    All terms are compiled into one regex. It is wrapped in a lookahead so
+    matches may overlap, and alternatives are listed by group priority, so
+    the first alternative to match at any position is the best group that
+    starts there. A single scan then yields the highest-priority group
+    present anywhere in the text.
+    """
+
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.groups = list(groups)
+        self.rank: Dict[str, int] = {}
+        terms = []
+        for rank, group in enumerate(self.groups):
+            for term in groups[group]:
+                term = term.lower()
+                if term and term not in self.rank:
+                    self.rank[term] = rank
+                    terms.append(term)
+        self.pattern = re.compile(
+            '(?=(' + '|'.join(re.escape(t) for t in terms) + '))' if terms else r'(?!)'
+        )
+
+    def match(self, text: str) -> Optional[str]:
+        """Return the highest-priority group with a term inside `text`"""
+        best = None
+        for found in self.pattern.finditer(text.lower()):
+            rank = self.rank[found.group(1)]
+            if best is None or rank < best:
+                best = rank
+                if best == 0:
+                    break
+        return None if best is None else self.groups[best]
+
+
+class DomainClassifier:
+    """Maps company names to domains using aliases, known companies and keywords"""
+
+    def __init__(self, aliases: Dict[str, str], known_companies: Dict[str, List[str]],
+                 keywords: Dict[str, List[str]] = DOMAIN_KEYWORDS):
+        self.aliases = aliases
+        self.known_companies = TermMatcher(known_companies)
+        self.keywords = TermMatcher(keywords)
+        self.memo: Dict[str, str] = {}
+
+    def classify(self, company_name: str) -> str:
+        """Determine the domain of a company based on its name or existing mappings"""
+        domain = self.memo.get(company_name)
+        if domain is not None:
+            return domain
+
+        # Check company aliases first (first word of the company name)
+        words = company_name.lower().split()
+        if words and words[0] in self.aliases:
+            return self.aliases[words[0]]
+
+        # Then companies we already know, then keyword hints
+        return (self.known_companies.match(company_name)
+                or self.keywords.match(company_name)
+                or 'general')
+
+    def precompute(self, companies: List[str]) -> Dict[str, List[str]]:
+        """Memoize the domain of every company and return them grouped by domain"""
+        groups: Dict[str, List[str]] = {}
+        for company in companies:
+            domain = self.memo[company] = self.classify(company)
+            groups.setdefault(domain, []).append(company)
+        return groups
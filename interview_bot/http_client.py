@@ -0,0 +1,150 @@
+"""Pooled keep-alive HTTP client shared by all scrapers"""
+import random
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from .rate_limiter import get_rate_limiter
+    from .scrape_cache import get_scrape_cache
+except ImportError:
+    from rate_limiter import get_rate_limiter
+    from scrape_cache import get_scrape_cache
+
+# urllib3 decodes brotli transparently when one of these is installed
+try:
+    import brotli  # noqa: F401
+    _BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _BROTLI = True
+    except ImportError:
+        _BROTLI = False
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate, br' if _BROTLI else 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+DEFAULT_TIMEOUT: Tuple[float, float] = (5, 10)  # (connect, read) seconds
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.5  # seconds; doubled on every retry
+MAX_BACKOFF = 8.0
+POOL_CONNECTIONS = 16  # number of hosts with a cached connection pool
+POOL_MAXSIZE = 16  # keep-alive connections kept per host
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+PAGE_CACHE_NAMESPACE = 'pages'  # validators and parsed content of fetched pages
+# Page entries are always revalidated, so they expire at once and are purged
+# by cache compaction once they have not been refreshed for MAX_STALE
+PAGE_CACHE_TTL = 0
+
+
+class HttpClient:
+    """Thin wrapper around a pooled requests.Session.
+
+    Every request goes through the shared per-host rate limiter, gets a
+    default (connect, read) timeout and is retried with exponential backoff
+    plus jitter on connection errors, timeouts and retryable status codes.
+    """
+
+    def __init__(self, timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES, backoff: float = DEFAULT_BACKOFF,
+                 rate_limiter=None):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                              pool_maxsize=POOL_MAXSIZE, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _backoff_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), MAX_BACKOFF)
+        delay = min(self.backoff * (2 ** attempt), MAX_BACKOFF)
+        return delay + random.uniform(0, self.backoff)
+
+    def get(self, url: str, timeout=None, **kwargs) -> requests.Response:
+        """GET a URL, retrying transient failures.
+
+        Returns the last response once retries are exhausted (callers check
+        ``status_code`` as before) and re-raises the last network error if no
+        response was ever received.
+        """
+        timeout = timeout or self.timeout
+        for attempt in range(self.retries + 1):
+            self.rate_limiter.acquire(url)
+            try:
+                response = self.session.get(url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+                continue
+            if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                return response
+            response.close()
+            time.sleep(self._backoff_delay(attempt, response))
+
+    def get_parsed(self, url: str, name: str, parse: Callable[[str], Any], cache=None, **kwargs) -> Any:
+        """GET a page and return ``parse(response.text)``, or None unless it is 200 or 304.
+
+        The parsed result is cached per (`name`, url) together with the
+        page's ETag/Last-Modified validators, which are sent back as
+        If-None-Match/If-Modified-Since. On a 304 Not Modified the cached
+        result is returned without downloading or parsing the page again.
+        """
+        cache = cache or get_scrape_cache()
+        key = f"{name} {url}"
+        entry = cache.get(PAGE_CACHE_NAMESPACE, key)
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None:
+            if entry.value.get('etag'):
+                headers['If-None-Match'] = entry.value['etag']
+            if entry.value.get('last_modified'):
+                headers['If-Modified-Since'] = entry.value['last_modified']
+
+        response = self.get(url, headers=headers, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            cache.set(PAGE_CACHE_NAMESPACE, key, entry.value, ttl=PAGE_CACHE_TTL)
+            return entry.value['parsed']
+        if response.status_code != 200:
+            return None
+
+        parsed = parse(response.text)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            cache.set(PAGE_CACHE_NAMESPACE, key,
+                      {'etag': etag, 'last_modified': last_modified, 'parsed': parsed},
+                      ttl=PAGE_CACHE_TTL)
+        elif entry is not None:
+            # The page no longer sends validators; don't keep stale ones around
+            cache.delete(PAGE_CACHE_NAMESPACE, key)
+        return parsed
+
+    def close(self):
+        self.session.close()
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide HTTP client"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
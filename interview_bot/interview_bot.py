@@ -11,126 +11,37 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.append(current_dir)
 
-from string_matcher import find_closest_match
+from string_matcher import CompanyIndex
 from question_aggregator import QuestionAggregator
 from search_engine import SearchEngine
+from scrape_cache import get_scrape_cache
+from question_store import get_question_store
+from domain_classifier import DomainClassifier
+from message_parser import MessageParser
+from pagination import DEFAULT_PAGE_SIZE, ResultsChanged, paginate_response
+from renderer import get_renderer
+from question_model import question_dicts
 
-class InterviewBot:
-    def __init__(self):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        self.db_path = os.path.join(current_dir, 'questions_db.json')
-        self.questions_db = None
-        self.companies_cache = None
-        self.categories_cache = None
-        self.search_engine = SearchEngine()
-        self.search_history = {}
-        # Load questions directly from local file
-        self.load_questions()
-        
-    def search_internet(self, query, category=None):
-        """Search internet for additional information based on query type"""
-        try:
-            # Check if we already have cached results
-            cache_key = f"{category}_{query}" if category else query
-            if cache_key in self.search_history:
-                return self.search_history[cache_key]
-            
-            # Define search sources based on category
-            sources = {
-                'technical': [
-                    ('stackoverflow.com', 'programming solutions'),
-                    ('github.com', 'code examples'),
-                    ('medium.com', 'programming tutorials')
-                ],
-                'behavioral': [
-                    ('indeed.com', 'interview questions'),
-                    ('glassdoor.com', 'interview experiences'),
-                    ('linkedin.com', 'career advice')
-                ],
-                'system_design': [
-                    ('highscalability.com', 'system design'),
-                    ('github.com', 'architecture examples'),
-                    ('medium.com', 'system design interview')
-                ],
-                'hr': [
-                    ('indeed.com', 'HR interview questions'),
-                    ('glassdoor.com', 'HR round'),
-                    ('thebalancecareers.com', 'HR interview')
-                ],
-                'general': [
-                    ('indeed.com', 'interview questions'),
-                    ('glassdoor.com', 'interview'),
-                    ('linkedin.com', 'career advice')
-                ]
-            }
-            
-            # Determine the type of question
-            question_type = category if category in sources else 'general'
-            if not category:
-                # Try to infer category from query
-                tech_keywords = ['code', 'program', 'algorithm', 'function', 'api', 'test', 'debug', 'implement']
-                behavioral_keywords = ['challenge', 'conflict', 'team', 'leadership', 'mistake', 'achievement']
-                system_keywords = ['design', 'architecture', 'scale', 'database', 'microservice', 'system']
-                hr_keywords = ['salary', 'notice', 'joining', 'relocation', 'package', 'benefits']
-                
-                query_lower = query.lower()
-                if any(keyword in query_lower for keyword in tech_keywords):
-                    question_type = 'technical'
-                elif any(keyword in query_lower for keyword in behavioral_keywords):
-                    question_type = 'behavioral'
-                elif any(keyword in query_lower for keyword in system_keywords):
-                    question_type = 'system_design'
-                elif any(keyword in query_lower for keyword in hr_keywords):
-                    question_type = 'hr'
-            
-            # Build search URLs based on question type
-            search_urls = []
-            for site, context in sources[question_type]:
-                search_urls.append(f"https://www.google.com/search?q={query}+{context}+site:{site}")
-            
-            # Add company-specific search if company name is in query
-            company_name = None
-            for company in self.get_companies():
-                if company.lower() in query.lower():
-                    company_name = company
-                    company_search = f"https://www.google.com/search?q={query}+{company}+interview+experience"
-                    search_urls.insert(0, company_search)  # Prioritize company-specific results
-                    break
-            
-            results = fetch_webpage(urls=search_urls, query=query)
-            if results:
-                formatted_results = self._format_search_results(results, company_name)
-                self.search_history[cache_key] = formatted_results
-                return formatted_results
-            return None
-        except Exception as e:
-            print(f"Error searching internet: {str(e)}")
-            return None
-            
-    def _format_search_results(self, results, company_name=None):
-        """Format search results with relevant sections and highlights"""
-        formatted = ""
-        
-        if company_name:
-            formatted += f"Information specific to {company_name}:\n"
-            formatted += "-" * 40 + "\n"
-        
-        formatted += "Key Points:\n"
-        formatted += results + "\n\n"
-        
-        formatted += "Note: This information is gathered from public sources and should be used as a general guide."
-        return formatted
-        self.coding_questions = {
-            "Automation": {
-                "Easy": [
-                    {
-                        "question": "Write a function to handle dynamic waits in Selenium",
-                        "category": "Automation",
-                        "difficulty": "Easy",
-                        "code_template": """def wait_for_element(driver, locator, timeout=10):
+SEARCH_HISTORY_NAMESPACE = 'search_internet'
+SEARCH_HISTORY_TTL = 24 * 60 * 60  # Online answers are refreshed daily
+
+# Pseudo-companies holding generic questions, skipped when suggesting other companies
+GENERIC_COMPANIES = ("Popular Interview Questions", "Common Coding Challenges", "System Design Questions")
+# Questions from other companies given for an unknown company when no domain or generic ones exist
+FALLBACK_QUESTION_LIMIT = 10
+
+# Built-in coding practice questions by category and difficulty
+CODING_QUESTIONS = {
+    "Automation": {
+        "Easy": [
+            {
+                "question": "Write a function to handle dynamic waits in Selenium",
+                "category": "Automation",
+                "difficulty": "Easy",
+                "code_template": """def wait_for_element(driver, locator, timeout=10):
     # TODO: Implement dynamic wait logic
     pass""",
-                        "solution": """from selenium.webdriver.support.ui import WebDriverWait
+                "solution": """from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 def wait_for_element(driver, locator, timeout=10):
@@ -141,10 +52,10 @@ def wait_for_element(driver, locator, timeout=10):
         return element
     except TimeoutException:
         return None""",
-                        "alternative_solutions": [
-                            {
-                                "description": "Using custom polling function",
-                                "code": """def wait_for_element(driver, locator, timeout=10, poll_frequency=0.5):
+                "alternative_solutions": [
+                    {
+                        "description": "Using custom polling function",
+                        "code": """def wait_for_element(driver, locator, timeout=10, poll_frequency=0.5):
     end_time = time.time() + timeout
     while time.time() < end_time:
         try:
@@ -155,10 +66,10 @@ def wait_for_element(driver, locator, timeout=10):
             pass
         time.sleep(poll_frequency)
     return None"""
-                            },
-                            {
-                                "description": "Using multiple conditions",
-                                "code": """def wait_for_element(driver, locator, timeout=10):
+                    },
+                    {
+                        "description": "Using multiple conditions",
+                        "code": """def wait_for_element(driver, locator, timeout=10):
     try:
         element = WebDriverWait(driver, timeout).until(
             lambda d: d.find_element(*locator) and 
@@ -168,19 +79,19 @@ def wait_for_element(driver, locator, timeout=10):
         return element
     except TimeoutException:
         return None"""
-                            }
-                        ],
-                        "test_cases": ["Basic element wait", "Timeout scenario", "Multiple elements"],
-                        "hints": ["Use WebDriverWait", "Consider expected_conditions", "Handle TimeoutException"]
-                    },
-                    {
-                        "question": "Create a function to handle file uploads in automation",
-                        "category": "Automation",
-                        "difficulty": "Easy",
-                        "code_template": """def upload_file(driver, file_input_locator, file_path):
+                    }
+                ],
+                "test_cases": ["Basic element wait", "Timeout scenario", "Multiple elements"],
+                "hints": ["Use WebDriverWait", "Consider expected_conditions", "Handle TimeoutException"]
+            },
+            {
+                "question": "Create a function to handle file uploads in automation",
+                "category": "Automation",
+                "difficulty": "Easy",
+                "code_template": """def upload_file(driver, file_input_locator, file_path):
     # TODO: Implement file upload logic
     pass""",
-                        "solution": """def upload_file(driver, file_input_locator, file_path):
+                "solution": """def upload_file(driver, file_input_locator, file_path):
     try:
         file_input = driver.find_element(*file_input_locator)
         file_input.send_keys(file_path)
@@ -188,20 +99,20 @@ def wait_for_element(driver, locator, timeout=10):
     except Exception as e:
         print(f"Error uploading file: {str(e)}")
         return False""",
-                        "test_cases": ["Valid file upload", "Invalid file path", "Non-existent element"],
-                        "hints": ["Use send_keys()", "Verify file path exists", "Handle exceptions"]
-                    }
-                ],
-                "Medium": [
-                    {
-                        "question": "Implement a custom retry mechanism for flaky tests",
-                        "category": "Automation",
-                        "difficulty": "Medium",
-                        "code_template": """class RetryAnalyzer:
+                "test_cases": ["Valid file upload", "Invalid file path", "Non-existent element"],
+                "hints": ["Use send_keys()", "Verify file path exists", "Handle exceptions"]
+            }
+        ],
+        "Medium": [
+            {
+                "question": "Implement a custom retry mechanism for flaky tests",
+                "category": "Automation",
+                "difficulty": "Medium",
+                "code_template": """class RetryAnalyzer:
     def __init__(self, max_retry=3):
         # TODO: Implement retry logic
         pass""",
-                        "solution": """class RetryAnalyzer:
+                "solution": """class RetryAnalyzer:
     def __init__(self, max_retry=3):
         self.max_retry = max_retry
         self.count = 0
@@ -212,20 +123,20 @@ def wait_for_element(driver, locator, timeout=10):
             print(f"Retrying test, attempt {self.count}")
             return True
         return False""",
-                        "test_cases": ["Successful retry", "Max retries exceeded", "Reset counter"],
-                        "hints": ["Track retry count", "Set max retries", "Consider test result"]
-                    }
-                ],
-                "Hard": [
-                    {
-                        "question": "Design a test data generator for API testing",
-                        "category": "Automation",
-                        "difficulty": "Hard",
-                        "code_template": """class TestDataGenerator:
+                "test_cases": ["Successful retry", "Max retries exceeded", "Reset counter"],
+                "hints": ["Track retry count", "Set max retries", "Consider test result"]
+            }
+        ],
+        "Hard": [
+            {
+                "question": "Design a test data generator for API testing",
+                "category": "Automation",
+                "difficulty": "Hard",
+                "code_template": """class TestDataGenerator:
     def __init__(self):
         # TODO: Implement data generation logic
         pass""",
-                        "solution": """import random
+                "solution": """import random
 import string
 from datetime import datetime, timedelta
 
@@ -257,22 +168,22 @@ class TestDataGenerator:
         for field, field_type in schema.items():
             result[field] = self.data_types[field_type]()
         return result""",
-                        "test_cases": ["Generate string data", "Generate date data", "Complex schema"],
-                        "hints": ["Use data type handlers", "Consider edge cases", "Validate output"]
-                    }
-                ]
-            },
-            "DSA": {
-                "Easy": [
-                    {
-                        "question": "Implement a stack for storing test results",
-                        "category": "DSA",
-                        "difficulty": "Easy",
-                        "code_template": """class TestResultStack:
+                "test_cases": ["Generate string data", "Generate date data", "Complex schema"],
+                "hints": ["Use data type handlers", "Consider edge cases", "Validate output"]
+            }
+        ]
+    },
+    "DSA": {
+        "Easy": [
+            {
+                "question": "Implement a stack for storing test results",
+                "category": "DSA",
+                "difficulty": "Easy",
+                "code_template": """class TestResultStack:
     def __init__(self):
         # TODO: Initialize stack
         pass""",
-                        "solution": """class TestResultStack:
+                "solution": """class TestResultStack:
     def __init__(self):
         self.stack = []
     
@@ -294,21 +205,21 @@ class TestDataGenerator:
     
     def size(self):
         return len(self.stack)""",
-                        "test_cases": ["Push elements", "Pop elements", "Empty stack"],
-                        "hints": ["Use list operations", "Check empty condition", "LIFO principle"]
-                    }
-                ]
-            },
-            "API Testing": {
-                "Easy": [
-                    {
-                        "question": "Write a function to validate API response schema",
-                        "category": "API Testing",
-                        "difficulty": "Easy",
-                        "code_template": """def validate_response_schema(response, expected_schema):
+                "test_cases": ["Push elements", "Pop elements", "Empty stack"],
+                "hints": ["Use list operations", "Check empty condition", "LIFO principle"]
+            }
+        ]
+    },
+    "API Testing": {
+        "Easy": [
+            {
+                "question": "Write a function to validate API response schema",
+                "category": "API Testing",
+                "difficulty": "Easy",
+                "code_template": """def validate_response_schema(response, expected_schema):
     # TODO: Implement schema validation
     pass""",
-                        "solution": """def validate_response_schema(response, expected_schema):
+                "solution": """def validate_response_schema(response, expected_schema):
     try:
         response_json = response.json()
         for field, field_type in expected_schema.items():
@@ -319,87 +230,125 @@ class TestDataGenerator:
         return True
     except Exception:
         return False""",
-                        "test_cases": ["Valid schema", "Missing fields", "Invalid types"],
-                        "hints": ["Check field presence", "Verify data types", "Handle JSON parsing"]
-                    }
-                ]
+                "test_cases": ["Valid schema", "Missing fields", "Invalid types"],
+                "hints": ["Check field presence", "Verify data types", "Handle JSON parsing"]
             }
-        }
-        self.domains_cache = {
-            'ecommerce': ['Amazon India', 'Flipkart', 'Walmart'],
-            'fintech': ['PhonePe', 'Paytm', 'Mastercard', 'Visa'],
-            'banking': ['Barclays', 'Citi Bank', 'HSBC', 'Deutsche Bank', 'Goldman Sachs', 'JPMorgan'],
-            'food_delivery': ['Swiggy', 'Zomato', 'UberEats'],
-            'technology': ['Microsoft India', 'TCS', 'Infosys', 'Wipro', 'Amdocs', 'Accenture', 'Nagarro', 'Cognizant', 'HCL', 'IBM'],
-            'telecom': ['Amdocs', 'Ericsson', 'Nokia', 'Vodafone', 'AT&T'],
-            'automotive': ['BMW', 'Mercedes', 'Bosch', 'Continental'],
-            'healthcare': ['Philips', 'Siemens Healthineers', 'GE Healthcare'],
-            'general': ['Popular Interview Questions', 'Common Coding Challenges']
-        }
-        self.company_aliases = {
-            # Technology Companies
-            'amdocs': 'technology',
-            'tcs': 'technology',
-            'infosys': 'technology',
-            'wipro': 'technology',
-            'microsoft': 'technology',
-            'accenture': 'technology',
-            'nagarro': 'technology',
-            'cognizant': 'technology',
-            'capgemini': 'technology',
-            'hcl': 'technology',
-            'ibm': 'technology',
-            'oracle': 'technology',
-            'sap': 'technology',
-            'dell': 'technology',
-            'hp': 'technology',
-            
-            # Ecommerce
-            'amazon': 'ecommerce',
-            'flipkart': 'ecommerce',
-            'walmart': 'ecommerce',
-            'target': 'ecommerce',
-            
-            # Fintech & Banking
-            'mastercard': 'fintech',
-            'visa': 'fintech',
-            'phonepe': 'fintech',
-            'paytm': 'fintech',
-            'razorpay': 'fintech',
-            'barclays': 'banking',
-            'citi': 'banking',
-            'hsbc': 'banking',
-            'deutsche': 'banking',
-            'goldman': 'banking',
-            'jpmorgan': 'banking',
-            'morgan': 'banking',
-            
-            # Food Delivery
-            'swiggy': 'food_delivery',
-            'zomato': 'food_delivery',
-            'uber': 'food_delivery',
-            
-            # Automotive
-            'bmw': 'automotive',
-            'mercedes': 'automotive',
-            'bosch': 'automotive',
-            'continental': 'automotive',
-            
-            # Healthcare
-            'philips': 'healthcare',
-            'siemens': 'healthcare',
-            'ge': 'healthcare'
-        }
+        ]
+    }
+}
+
+# Known companies per domain
+COMPANY_DOMAINS = {
+    'ecommerce': ['Amazon India', 'Flipkart', 'Walmart'],
+    'fintech': ['PhonePe', 'Paytm', 'Mastercard', 'Visa'],
+    'banking': ['Barclays', 'Citi Bank', 'HSBC', 'Deutsche Bank', 'Goldman Sachs', 'JPMorgan'],
+    'food_delivery': ['Swiggy', 'Zomato', 'UberEats'],
+    'technology': ['Microsoft India', 'TCS', 'Infosys', 'Wipro', 'Amdocs', 'Accenture', 'Nagarro', 'Cognizant', 'HCL', 'IBM'],
+    'telecom': ['Amdocs', 'Ericsson', 'Nokia', 'Vodafone', 'AT&T'],
+    'automotive': ['BMW', 'Mercedes', 'Bosch', 'Continental'],
+    'healthcare': ['Philips', 'Siemens Healthineers', 'GE Healthcare'],
+    'general': ['Popular Interview Questions', 'Common Coding Challenges']
+}
+
+# Domain of a company, keyed by the first word of its name
+COMPANY_ALIASES = {
+    # Technology Companies
+    'amdocs': 'technology',
+    'tcs': 'technology',
+    'infosys': 'technology',
+    'wipro': 'technology',
+    'microsoft': 'technology',
+    'accenture': 'technology',
+    'nagarro': 'technology',
+    'cognizant': 'technology',
+    'capgemini': 'technology',
+    'hcl': 'technology',
+    'ibm': 'technology',
+    'oracle': 'technology',
+    'sap': 'technology',
+    'dell': 'technology',
+    'hp': 'technology',
+    
+    # Ecommerce
+    'amazon': 'ecommerce',
+    'flipkart': 'ecommerce',
+    'walmart': 'ecommerce',
+    'target': 'ecommerce',
+    
+    # Fintech & Banking
+    'mastercard': 'fintech',
+    'visa': 'fintech',
+    'phonepe': 'fintech',
+    'paytm': 'fintech',
+    'razorpay': 'fintech',
+    'barclays': 'banking',
+    'citi': 'banking',
+    'hsbc': 'banking',
+    'deutsche': 'banking',
+    'goldman': 'banking',
+    'jpmorgan': 'banking',
+    'morgan': 'banking',
+    
+    # Food Delivery
+    'swiggy': 'food_delivery',
+    'zomato': 'food_delivery',
+    'uber': 'food_delivery',
+    
+    # Automotive
+    'bmw': 'automotive',
+    'mercedes': 'automotive',
+    'bosch': 'automotive',
+    'continental': 'automotive',
+    
+    # Healthcare
+    'philips': 'healthcare',
+    'siemens': 'healthcare',
+    'ge': 'healthcare'
+}
+
+class InterviewBot:
+    def __init__(self):
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        self.db_path = os.path.join(current_dir, 'questions_db.json')
+        self.store = None
+        self.questions_db = None
+        self.companies_cache = None
+        self.categories_cache = None
+        self.search_engine = SearchEngine()
+        self.search_history = get_scrape_cache()  # Persistent, shared with the scrapers
+        self._aggregator = None
+        # Module-level data shared by every instance; treat as read-only
+        self.coding_questions = CODING_QUESTIONS
+        self.domains_cache = COMPANY_DOMAINS
+        self.company_aliases = COMPANY_ALIASES
         self.load_questions()
 
+    @property
+    def aggregator(self):
+        """Question generator for unknown companies, created on first use"""
+        if self._aggregator is None:
+            self._aggregator = QuestionAggregator()
+        return self._aggregator
+
     def load_questions(self):
         """Load questions from the JSON database"""
         if not self.questions_db:  # Load only if not already loaded
-            with open(self.db_path, 'r') as file:
-                self.questions_db = json.load(file)
+            # Parsed once per process; every bot and session shares the store
+            self.store = get_question_store(self.db_path)
+            self.questions_db = self.store.db
             # Cache commonly accessed data
-            self.companies_cache = list(self.questions_db["companies"].keys())
-            self.categories_cache = self.questions_db.get("categories", {})
+            self.companies_cache = self.store.companies
+            self.categories_cache = self.store.categories
+            # Precomputed company/experience/category/difficulty lookups
+            self.question_index = self.store.question_index
+            self.company_index = self.store.derived('company_index', lambda: CompanyIndex(self.companies_cache))
+            # Domain of every known company, computed once per process
+            self.domain_classifier = self.store.derived(
+                'domain_classifier', lambda: DomainClassifier(COMPANY_ALIASES, COMPANY_DOMAINS)
+            )
+            self.domain_groups = self.store.derived(
+                'domain_groups', lambda: self.domain_classifier.precompute(self.companies_cache)
+            )
 
     def get_experience_range(self, years):
         """Determine the experience range category"""
@@ -413,36 +362,14 @@ class TestDataGenerator:
 
     def get_company_domain(self, company_name):
         """Determine the domain of a company based on its name or existing mappings"""
-        company_key = company_name.lower().split()[0]  # Get first word of company name
-        
-        # Check company aliases first
-        if company_key in self.company_aliases:
-            return self.company_aliases[company_key]
-        
-        # Check if company exists in our domain mappings
-        for domain, companies in self.domains_cache.items():
-            if any(c.lower() in company_name.lower() for c in companies):
-                return domain
-        
-        # Use keyword matching for unknown companies
-        keywords = {
-            'ecommerce': ['shop', 'retail', 'mart', 'buy', 'store', 'commerce', 'market', 'shopping', 'online'],
-            'fintech': ['pay', 'finance', 'money', 'wallet', 'fin', 'cash', 'credit', 'card', 'payment', 'transaction'],
-            'banking': ['bank', 'banking', 'investment', 'trading', 'financial', 'capital', 'asset', 'wealth', 'securities'],
-            'food_delivery': ['food', 'delivery', 'restaurant', 'kitchen', 'meal', 'dining', 'cuisine', 'order'],
-            'technology': ['tech', 'soft', 'it', 'system', 'digital', 'computer', 'software', 'labs', 'consulting', 'solutions', 'services'],
-            'telecom': ['telecom', 'communication', 'network', 'mobile', 'wireless', 'broadband', 'telephony', 'cellular'],
-            'automotive': ['auto', 'car', 'vehicle', 'motor', 'automotive', 'mobility', 'transport'],
-            'healthcare': ['health', 'medical', 'hospital', 'care', 'pharma', 'diagnostic', 'clinical', 'biotech']
-        }
-        
-        for domain, words in keywords.items():
-            if any(word.lower() in company_name.lower() for word in words):
-                return domain
-        return 'general'
+        return self.domain_classifier.classify(company_name)
 
     def get_interview_questions(self, company, years_of_experience, category=None, difficulty=None):
         """Get relevant interview questions based on company and experience with optional filters"""
+        return question_dicts(self._question_result(company, years_of_experience, category, difficulty))
+
+    def _question_result(self, company, years_of_experience, category, difficulty):
+        """get_interview_questions with the stored questions left as shared Question records"""
         try:
             # Input validation
             if not company or not isinstance(company, str):
@@ -459,13 +386,13 @@ class TestDataGenerator:
                 self.aggregator.add_company_questions(company)
             
             # Handle exact matches first (case-insensitive)
-            exact_match = next((c for c in self.questions_db["companies"].keys() 
-                              if c.lower() == company.lower()), None)
+            exact_match = self.company_index.exact_match(company)
             if exact_match:
                 company = exact_match
+                matched_company, similarity = exact_match, 1.0
             else:
                 # Try fuzzy matching
-                matched_company, similarity = find_closest_match(company, self.questions_db["companies"].keys())
+                matched_company, similarity = self.company_index.find_closest_match(company)
             
             # Determine company domain
             company_domain = self.get_company_domain(company)
@@ -479,12 +406,20 @@ class TestDataGenerator:
                     if comp in self.questions_db["companies"]:
                         questions.extend(self.questions_db["companies"][comp].get(exp_range, []))
                 
-                # Add general questions
-                questions.extend(self.questions_db["companies"]["Popular Interview Questions"].get(exp_range, []))
+                # Add general questions (the bundled database may not have these sections)
+                companies = self.questions_db["companies"]
+                questions.extend(companies.get("Popular Interview Questions", {}).get(exp_range, []))
                 
                 # Add coding challenges for tech companies
                 if company_domain == 'technology':
-                    questions.extend(self.questions_db["companies"]["Common Coding Challenges"].get(exp_range, []))
+                    questions.extend(companies.get("Common Coding Challenges", {}).get(exp_range, []))
+
+                # Nothing for this domain in the database: fall back to other companies' questions
+                if not questions:
+                    questions = self.question_index.lookup(
+                        exp_range=exp_range, category=category or None, difficulty=difficulty or None,
+                        limit=FALLBACK_QUESTION_LIMIT
+                    ) or self.question_index.lookup(exp_range=exp_range, limit=FALLBACK_QUESTION_LIMIT)
                 
                 # Search internet for additional company-specific questions
                 search_query = f"{company} interview questions {exp_range} years experience"
@@ -522,43 +457,35 @@ class TestDataGenerator:
             
             company = matched_company
 
-            questions = self.questions_db["companies"][company].get(exp_range, [])
-            
-            original_questions = questions[:]
-            
-            # Apply filters if provided
-            if category:
-                questions = self.filter_questions_by_category(questions, category)
-            if difficulty:
-                questions = self.filter_questions_by_difficulty(questions, difficulty)
+            # Apply filters if provided; the index intersects precomputed ID sets
+            index = self.question_index
+            questions = index.lookup(company, exp_range, category or None, difficulty or None)
             
             if not questions:
                 alternative_suggestions = {
                     "same_category": [],
                     "same_difficulty": [],
-                    "same_company": original_questions[:2]  # First 2 questions from same company
+                    "same_company": index.lookup(company, exp_range, limit=2)  # First 2 questions from same company
                 }
                 
                 # Find questions with same category but different difficulty
                 if category:
-                    same_cat = self.filter_questions_by_category(original_questions, category)
-                    alternative_suggestions["same_category"] = same_cat[:2]
+                    alternative_suggestions["same_category"] = index.lookup(
+                        company, exp_range, category=category, limit=2)
                 
                 # Find questions with same difficulty but different category
                 if difficulty:
-                    same_diff = self.filter_questions_by_difficulty(original_questions, difficulty)
-                    alternative_suggestions["same_difficulty"] = same_diff[:2]
+                    alternative_suggestions["same_difficulty"] = index.lookup(
+                        company, exp_range, difficulty=difficulty, limit=2)
                 
                 # Find similar questions from other companies
-                other_company_questions = []
-                for comp in self.questions_db["companies"]:
-                    if comp != company and comp not in ["Popular Interview Questions", "Common Coding Challenges", "System Design Questions"]:
-                        questions_list = self.questions_db["companies"][comp].get(exp_range, [])
-                        if category:
-                            questions_list = self.filter_questions_by_category(questions_list, category)
-                        if difficulty:
-                            questions_list = self.filter_questions_by_difficulty(questions_list, difficulty)
-                        other_company_questions.extend(questions_list)
+                other_company_questions = index.lookup(
+                    exp_range=exp_range,
+                    category=category or None,
+                    difficulty=difficulty or None,
+                    exclude_companies=(company,) + GENERIC_COMPANIES,
+                    limit=2
+                )
                 
                 filters = []
                 if category:
@@ -606,61 +533,43 @@ class TestDataGenerator:
                     "category": category,
                     "difficulty": difficulty
                 }
-=======
+            }
+        except Exception as e:
+            return {"status": "error", "message": f"Error fetching questions: {str(e)}"}
 
-def wait_for_element(driver, locator, timeout=10):
-    try:
-        element = WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located(locator)
-        )
-        return element
-    except TimeoutException:
-        return None""",
-                        "alternative_solutions": [
-                            {
-                                "description": "Using custom polling function",
-                                "code": """def wait_for_element(driver, locator, timeout=10, poll_frequency=0.5):
-    end_time = time.time() + timeout
-    while time.time() < end_time:
+    def get_interview_questions_page(self, company, years_of_experience, category=None, difficulty=None,
+                                     cursor=None, page_size=DEFAULT_PAGE_SIZE):
+        """One page of get_interview_questions; pass back ``next_cursor`` for the next one.
+
+        Each page is rebuilt from a fresh result. If that result no longer
+        matches the one the cursor was cut from (new web results), an error
+        with code "results_changed" is returned instead of a shifted page.
+        """
+        response = self._question_result(company, years_of_experience, category, difficulty)
         try:
-            element = driver.find_element(*locator)
-            if element.is_displayed():
-                return element
-        except:
-            pass
-        time.sleep(poll_frequency)
-    return None"""
-                            },
-                            {
-                                "description": "Using multiple conditions",
-                                "code": """def wait_for_element(driver, locator, timeout=10):
-    try:
-        element = WebDriverWait(driver, timeout).until(
-            lambda d: d.find_element(*locator) and 
-                      d.find_element(*locator).is_displayed() and 
-                      d.find_element(*locator).is_enabled()
-        )
-        return element
-    except TimeoutException:
-        return None"""
-                            }
-                        ],
-                        "test_cases": ["Basic element wait", "Timeout scenario", "Multiple elements"],
-                        "hints": ["Use WebDriverWait", "Consider expected_conditions", "Handle TimeoutException"]
-                    }
-                ]
->>>>>>> 4f8dd752c6b6d73acc9ce3a04eb8b1f91cbcdfd8
-            }
-        }
+            return question_dicts(paginate_response(response, cursor, page_size))
+        except ResultsChanged as e:
+            return {"status": "error", "code": "results_changed", "message": str(e)}
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
         
     def search_internet(self, query, category=None):
         """Search internet for additional information based on query type"""
         try:
-            # Check if we already have cached results
+            # Check if we already have cached results; stale ones refresh in the background
             cache_key = f"{category}_{query}" if category else query
-            if cache_key in self.search_history:
-                return self.search_history[cache_key]
-            
+            return self.search_history.get_or_load(
+                SEARCH_HISTORY_NAMESPACE, cache_key,
+                lambda: self._search_internet(query, category),
+                ttl=SEARCH_HISTORY_TTL
+            )
+        except Exception as e:
+            print(f"Error searching internet: {str(e)}")
+            return None
+
+    def _search_internet(self, query, category=None):
+        """Run the web searches behind search_internet, bypassing the cache"""
+        try:
             # Define search sources based on category
             sources = {
                 'technical': [
@@ -712,22 +621,22 @@ def wait_for_element(driver, locator, timeout=10):
             # Build search URLs based on question type
             search_urls = []
             for site, context in sources[question_type]:
-                search_urls.append(f"https://www.google.com/search?q={query}+{context}+site:{site}")
+                search_urls.append((f"https://www.google.com/search?q={query}+{context}+site:{site}", site))
             
             # Add company-specific search if company name is in query
             company_name = None
-            for company in self.get_companies():
+            for company in self.get_available_companies():
                 if company.lower() in query.lower():
                     company_name = company
                     company_search = f"https://www.google.com/search?q={query}+{company}+interview+experience"
-                    search_urls.insert(0, company_search)  # Prioritize company-specific results
+                    search_urls.insert(0, (company_search, "google.com"))  # Prioritize company-specific results
                     break
             
-            results = fetch_webpage(urls=search_urls, query=query)
+            results = []
+            for url, site in search_urls:
+                results.extend(self.search_engine.fetch_results(url, site))
             if results:
-                formatted_results = self._format_search_results(results, company_name)
-                self.search_history[cache_key] = formatted_results
-                return formatted_results
+                return self._format_search_results(self.search_engine.format_results(results), company_name)
             return None
         except Exception as e:
             print(f"Error searching internet: {str(e)}")
@@ -765,17 +674,19 @@ def wait_for_element(driver, locator, timeout=10):
         """Get list of all companies in the database"""
         return self.companies_cache
 
-    def filter_questions_by_category(self, questions, category):
-        """Filter questions by category"""
-        return [q for q in questions if q["category"] == category]
-
-    def filter_questions_by_difficulty(self, questions, difficulty):
-        """Filter questions by difficulty level"""
-        return [q for q in questions if q["difficulty"] == difficulty]
-
     def get_coding_categories(self):
         """Get list of all coding question categories"""
         return list(self.coding_questions.keys())
+
+    def get_message_parser(self):
+        """Parser for chat messages, built once per store and shared by every front end
+
+        Every keyword and company name goes into a single automaton; a
+        reloaded store gets its own parser with its companies.
+        """
+        return self.store.derived('message_parser', lambda: MessageParser(
+            self.get_available_companies(), self.get_coding_categories()
+        ))
     
     def get_coding_difficulties(self, category):
         """Get list of difficulties for a category"""
@@ -792,42 +703,6 @@ def wait_for_element(driver, locator, timeout=10):
                 return random.choice(questions)
         return None
 
-    def format_response(self, response):
-        """Format the response in a readable way"""
-        if response["status"] in ["error", "partial"]:
-            error_msg = response["message"]
-            help_msg = "\nYou can:\n- Ask for company specific questions\n- View question categories\n- List available companies\n- Type 'help' for more details"
-            return f"{error_msg}\n{help_msg}"
-
-        output = f"\nInterview Questions for {response['company']} ({response['experience_range']} years experience)\n"
-        output += "=" * 80 + "\n\n"
-
-        for i, q in enumerate(response["questions"], 1):
-            output += f"Question #{i}:\n"
-            output += f"==========\n"
-            output += f"Topic: {q['question']}\n"
-            output += f"Category: {q['category']}\n"
-            output += f"Difficulty: {q['difficulty']}\n"
-            output += f"Asked in: {q['date_asked']}\n"
-            if "type" in q:
-                output += f"Type: {q['type']}\n"
-            if "answer" in q:
-                output += f"\nAnswer:\n-------\n{q['answer']}\n"
-            if "source" in q:
-                output += f"Source: {q['source']}\n"
-            if "company_reported" in q:
-                output += f"Reported by candidates at: {', '.join(q['company_reported'])}\n"
-            if "followup" in q:
-                output += f"\nFollow-up Question:\n------------------\n{q['followup']}\n"
-            if "followup_answer" in q:
-                output += f"\nFollow-up Answer:\n---------------\n{q['followup_answer']}\n"
-            output += "\n" + "=" * 80 + "\n\n"
-
-        # Add category information
-        categories = self.get_categories()
-        if categories:
-            output += "\nAvailable Categories:\n"
-            for category, topics in categories.items():
-                output += f"{category}: {', '.join(topics)}\n"
-
-        return output
+    def format_response(self, response, mode='text'):
+        """Format the response in a readable way ('text', 'markdown', 'html' or 'json')"""
+        return get_renderer('legacy').render(response, mode, categories=self.get_categories())
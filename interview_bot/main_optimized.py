@@ -29,19 +29,10 @@ def main():
             
             if choice == "1":
                 # Show available companies for reference
-                companies = bot.get_available_companies()
                 print("\nAvailable Companies by Domain:")
                 
-                # Group companies by domain
-                domain_companies = {}
-                for company in companies:
-                    domain = bot.get_company_domain(company)
-                    if domain not in domain_companies:
-                        domain_companies[domain] = []
-                    domain_companies[domain].append(company)
-                
-                # Print companies by domain
-                for domain, comp_list in domain_companies.items():
+                # Companies are grouped by domain once, when the bot loads
+                for domain, comp_list in bot.domain_groups.items():
                     print(f"\n{domain.upper()}:")
                     print("  " + ", ".join(comp_list))
                 
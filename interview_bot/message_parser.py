@@ -0,0 +1,195 @@
+"""Single-pass keyword and entity extraction for chat messages"""
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+GREETINGS = ['hi', 'hello', 'hey']
+GOODBYES = ['bye', 'goodbye', 'exit', 'quit']
+SOLUTION_WORDS = ['solution', 'approach', 'another']
+# Whole messages asking for the next page of a question list. Matched
+# exactly, so "furthermore explain..." or "what is more efficient" are not paging
+PAGING_MESSAGES = frozenset(['more', 'next', 'more questions', 'next page', 'show more'])
+
+# Plain substrings whose presence drives the chat flow
+COMMAND_WORDS = [
+    'questions', 'question', 'interview', 'categories', 'topics', 'companies', 'coding',
+    'solution', 'approach', 'another', 'alternative', 'different', 'help'
+] + GOODBYES
+
+# Coding difficulty words, in the order they are checked
+DIFFICULTY_WORDS = [('easy', 'Easy'), ('medium', 'Medium'), ('hard', 'Hard')]
+
+# Keywords used to guess the kind of free-form question; earlier categories win
+QUERY_CATEGORIES: Dict[str, List[str]] = {
+    'technical': ['how to', 'what is', 'explain', 'difference between', 'example', 'code', 'programming',
+                  'function', 'class', 'implement', 'python', 'java', 'javascript', 'selenium', 'api', 'test'],
+    'behavioral': ['tell me about', 'how did you', 'describe', 'situation', 'challenge', 'conflict',
+                   'difficult', 'team', 'leadership', 'achievement', 'mistake', 'pressure', 'deadline'],
+    'system_design': ['design', 'architecture', 'scale', 'database', 'system', 'infrastructure',
+                      'microservice', 'distributed', 'cloud', 'performance', 'optimization'],
+    'hr': ['salary', 'notice', 'joining', 'relocation', 'package', 'benefits', 'work culture',
+           'company values', 'career growth', 'expectations', 'why join', 'why leave']
+}
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton reporting every keyword occurrence in one scan.
+
+    Matching walks the text once, one dict lookup per character, so the
+    cost depends on the text length and not on how many keywords exist.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[str]] = [[]]
+        for keyword in keywords:
+            self._add(keyword)
+        self._link()
+
+    def _add(self, keyword: str):
+        if not keyword:
+            return
+        state = 0
+        for char in keyword:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[state][char] = next_state
+            state = next_state
+        if keyword not in self.output[state]:
+            self.output[state].append(keyword)
+
+    def _link(self):
+        """Breadth-first pass setting failure links and merged outputs"""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def step(self, state: int, char: str) -> int:
+        while state and char not in self.goto[state]:
+            state = self.fail[state]
+        return self.goto[state].get(char, 0)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (end_index, keyword) for every occurrence, overlaps included"""
+        state = 0
+        for index, char in enumerate(text):
+            state = self.step(state, char)
+            for keyword in self.output[state]:
+                yield index + 1, keyword
+
+
+class ParsedMessage(NamedTuple):
+    keywords: FrozenSet[str]
+    greeting: bool
+    company: Optional[str]
+    years: Optional[str]
+    coding_category: Optional[str]
+    difficulty: Optional[str]
+    query_category: Optional[str]
+    paging: bool = False
+
+    def has(self, *words: str) -> bool:
+        return any(word in self.keywords for word in words)
+
+    def intent(self, order: Sequence[str]) -> str:
+        """First intent from `order` the message qualifies for, else 'default'"""
+        checks = {
+            'greeting': lambda: self.greeting,
+            'company_questions': lambda: self.company is not None and self.has('questions'),
+            'categories': lambda: self.has('categories', 'topics'),
+            'companies': lambda: self.has('companies'),
+            'coding': lambda: self.has('coding'),
+            'solution': lambda: self.has(*SOLUTION_WORDS),
+            'more': lambda: self.paging,
+            'help': lambda: self.has('help'),
+            'goodbye': lambda: self.has(*GOODBYES),
+        }
+        for name in order:
+            if checks[name]():
+                return name
+        return 'default'
+
+
+class MessageParser:
+    """Extracts intent keywords, company, years, categories and difficulty at once.
+
+    Every keyword, company name and coding category goes into one
+    automaton. Where several entities of a kind appear, the one listed
+    first wins, just like the ``next(...)`` scans this replaces.
+    """
+
+    def __init__(self, companies: Iterable[str] = (), coding_categories: Iterable[str] = ()):
+        # keyword -> [(kind, rank, value)]
+        self.roles: Dict[str, List[Tuple[str, int, str]]] = {}
+        for word in COMMAND_WORDS:
+            self._register(word, 'command', 0, word)
+        for word in GREETINGS:
+            self._register(word, 'greeting', 0, word)
+        for rank, (word, level) in enumerate(DIFFICULTY_WORDS):
+            self._register(word, 'difficulty', rank, level)
+        for rank, (category, words) in enumerate(QUERY_CATEGORIES.items()):
+            for word in words:
+                self._register(word, 'query_category', rank, category)
+        for rank, company in enumerate(companies):
+            self._register(company.lower(), 'company', rank, company)
+        for rank, category in enumerate(coding_categories):
+            self._register(category.lower(), 'coding_category', rank, category)
+        self.automaton = KeywordAutomaton(self.roles)
+
+    def _register(self, keyword: str, kind: str, rank: int, value: str):
+        self.roles.setdefault(keyword, []).append((kind, rank, value))
+
+    def parse(self, message: str) -> ParsedMessage:
+        """Parse an already lowercased message"""
+        keywords = set()
+        greeting = False
+        years = None
+        best: Dict[str, Tuple[int, str]] = {}
+        state = 0
+        word_start = 0
+        for index, char in enumerate(message + ' '):
+            if char.isspace():
+                # Experience is the first whitespace-separated number, e.g. "3" or "2.5"
+                if years is None and message[word_start:index].replace('.', '').isdigit():
+                    years = message[word_start:index]
+                word_start = index + 1
+
+            state = self.automaton.step(state, char)
+            for keyword in self.automaton.output[state]:
+                for kind, rank, value in self.roles[keyword]:
+                    if kind == 'command':
+                        keywords.add(value)
+                    elif kind == 'greeting':
+                        # Whole words only, so "this" or "which" is not a greeting
+                        start = index + 1 - len(keyword)
+                        if (start == 0 or not message[start - 1].isalnum()) and \
+                                (index + 1 == len(message) or not message[index + 1].isalnum()):
+                            greeting = True
+                    elif kind not in best or rank < best[kind][0]:
+                        best[kind] = (rank, value)
+
+        def pick(kind):
+            return best[kind][1] if kind in best else None
+
+        return ParsedMessage(
+            keywords=frozenset(keywords),
+            greeting=greeting,
+            company=pick('company'),
+            years=years,
+            coding_category=pick('coding_category'),
+            difficulty=pick('difficulty'),
+            query_category=pick('query_category'),
+            paging=' '.join(message.strip(' .!?').split()) in PAGING_MESSAGES,
+        )
@@ -0,0 +1,219 @@
+"""Declarative, backend-pluggable extraction of scraped HTML pages
+
+Each source declares once which elements it needs (an ``Extraction``).
+With lxml installed the page is parsed by libxml2 and the elements are
+selected with compiled XPath; otherwise BeautifulSoup's html.parser is
+used, with a SoupStrainer when the elements are picked by tag alone.
+"""
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+_UPPER = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_LOWER = 'abcdefghijklmnopqrstuvwxyz'
+
+
+class Selector(NamedTuple):
+    """Elements with one of `tags` (any tag if empty) and all given conditions"""
+    tags: Tuple[str, ...] = ()
+    classes: Tuple[str, ...] = ()  # has one of these class names
+    class_contains: Tuple[str, ...] = ()  # a class name contains one of these, ignoring case
+    attrs: Tuple[Tuple[str, str], ...] = ()  # exact attribute values
+
+    def xpath(self, prefix: str = '//') -> str:
+        conditions = []
+        if self.tags:
+            conditions.append(' or '.join(f'self::{tag}' for tag in self.tags))
+        if self.classes:
+            conditions.append(' or '.join(
+                f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')" for name in self.classes
+            ))
+        if self.class_contains:
+            lowered = f"translate(@class, '{_UPPER}', '{_LOWER}')"
+            conditions.append(' or '.join(f"contains({lowered}, '{part.lower()}')"
+                                          for part in self.class_contains))
+        for name, value in self.attrs:
+            conditions.append(f"@{name}='{value}'")
+        return prefix + '*' + ''.join(f'[{condition}]' for condition in conditions)
+
+    def strainer(self) -> Optional[SoupStrainer]:
+        """SoupStrainer keeping only our elements, or None to parse the whole page.
+
+        Only selectors that pick elements by tag alone get one. With
+        attribute conditions in the strainer, html.parser drops a matching
+        tag nested in a rejected tag of the same name (e.g. ``div.g`` inside
+        a plain ``div``); without them it keeps every ``div``, ``span``...
+        and costs more than a full parse.
+        """
+        if not self.tags or self.classes or self.class_contains or self.attrs:
+            return None
+        return SoupStrainer(list(self.tags))
+
+    def matches(self, name: str, attrs: Dict) -> bool:
+        """Test a tag by name and attributes (BeautifulSoup backend)"""
+        if self.tags and name not in self.tags:
+            return False
+        class_value = attrs.get('class') or ''
+        class_names = class_value.split() if isinstance(class_value, str) else list(class_value)
+        if self.classes and not any(c in class_names for c in self.classes):
+            return False
+        if self.class_contains and not any(part.lower() in c.lower()
+                                           for c in class_names for part in self.class_contains):
+            return False
+        return all(attrs.get(key) == value for key, value in self.attrs)
+
+
+class Field(NamedTuple):
+    """Text (or an attribute) of the first descendant matching any of `selectors`"""
+    selectors: Tuple[Selector, ...]
+    attr: Optional[str] = None
+    strip: bool = True  # strip every text node like get_text(strip=True); else strip the whole text once
+
+
+class Extraction(NamedTuple):
+    """What one source needs from a page.
+
+    Elements matching `items` are returned in selector order, then
+    document order. Without `fields` each element becomes its text;
+    with them, a dict of field values (None when missing).
+    """
+    items: Tuple[Selector, ...]
+    fields: Optional[Dict[str, Field]] = None
+    limit: Optional[int] = None
+
+
+def _soup_text(element, strip: bool) -> str:
+    return element.get_text(strip=True) if strip else element.get_text().strip()
+
+
+def _lxml_text(element, strip: bool) -> str:
+    texts = element.xpath('.//text()')
+    if strip:
+        return ''.join(t.strip() for t in texts)
+    return ''.join(texts).strip()
+
+
+class LxmlBackend:
+    """Parses with lxml and selects with precompiled XPath"""
+    name = 'lxml'
+
+    def __init__(self):
+        self._compiled = {}
+
+    def _xpath(self, selector: Selector, prefix: str):
+        key = (selector, prefix)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compiled[key] = etree.XPath(selector.xpath(prefix))
+        return compiled
+
+    def extract(self, html: str, extraction: Extraction) -> List:
+        try:
+            root = lxml.html.fromstring(html)
+        except (etree.ParserError, ValueError):
+            return []
+        results = []
+        for selector in extraction.items:
+            for element in self._xpath(selector, '//')(root):
+                results.append(self._item(element, extraction))
+                if extraction.limit is not None and len(results) >= extraction.limit:
+                    return results
+        return results
+
+    def _item(self, element, extraction):
+        if extraction.fields is None:
+            return _lxml_text(element, True)
+        item = {}
+        for key, field in extraction.fields.items():
+            item[key] = None
+            for selector in field.selectors:
+                found = self._xpath(selector, './/')(element)
+                if found:
+                    first = found[0]
+                    item[key] = first.get(field.attr) if field.attr else _lxml_text(first, field.strip)
+                    break
+        return item
+
+
+class SoupBackend:
+    """BeautifulSoup fallback: a full html.parser tree unless a strainer can narrow it"""
+    name = 'html.parser'
+
+    def extract(self, html: str, extraction: Extraction) -> List:
+        # A strainer can express one selector; several alternatives need the full tree
+        strainer = extraction.items[0].strainer() if len(extraction.items) == 1 else None
+        soup = BeautifulSoup(html, 'html.parser', parse_only=strainer)
+        results = []
+        for selector in extraction.items:
+            for element in soup.find_all(lambda tag: selector.matches(tag.name, tag.attrs)):
+                results.append(self._item(element, extraction))
+                if extraction.limit is not None and len(results) >= extraction.limit:
+                    return results
+        return results
+
+    def _item(self, element, extraction):
+        if extraction.fields is None:
+            return _soup_text(element, True)
+        item = {}
+        for key, field in extraction.fields.items():
+            item[key] = None
+            for selector in field.selectors:
+                first = element.find(lambda tag: selector.matches(tag.name, tag.attrs))
+                if first is not None:
+                    item[key] = first.get(field.attr) if field.attr else _soup_text(first, field.strip)
+                    break
+        return item
+
+
+_backends = {'html.parser': SoupBackend()}
+if lxml is not None:
+    _backends['lxml'] = LxmlBackend()
+
+DEFAULT_BACKEND = 'lxml' if lxml is not None else 'html.parser'
+
+
+def extract(html: str, extraction: Extraction, backend: Union[str, None] = None) -> List:
+    """Run a declared extraction over a page with the fastest available parser"""
+    return _backends[backend or DEFAULT_BACKEND].extract(html, extraction)
+
+
+# --- Per-source extractions -------------------------------------------------
+
+# A Google result: the title, first link and snippet of each div.g
+GOOGLE_RESULTS = Extraction(
+    items=(Selector(('div',), classes=('g',)),),
+    fields={
+        'title': Field((Selector(('h3',)),)),
+        'link': Field((Selector(('a',)),), attr='href'),
+        'snippet': Field((Selector(('span',), classes=('st',)), Selector(('div',), classes=('VwiC3b',)))),
+    },
+)
+
+GLASSDOOR_QUESTIONS = Extraction(items=(
+    Selector(classes=('questionText',)),
+    Selector(attrs=(('data-test', 'interview-question'),)),
+    Selector(classes=('interviewQuestion',)),
+    Selector(classes=('question-text',)),
+))
+
+GEEKSFORGEEKS_TEXT = Extraction(items=(Selector(('h2', 'h3', 'h4', 'p', 'li')),))
+
+AMBITIONBOX_CONTENT = Extraction(items=(
+    Selector(('div', 'p', 'span'), class_contains=('interview', 'question')),
+))
+
+# Google results that carry an answer snippet (div.VwiC3b), whole text stripped once
+GOOGLE_ANSWERS = Extraction(
+    items=(Selector(('div',), classes=('g',)),),
+    fields={
+        'title': Field((Selector(('h3',)),), strip=False),
+        'link': Field((Selector(('a',)),), attr='href'),
+        'snippet': Field((Selector(('div',), classes=('VwiC3b',)),), strip=False),
+    },
+)
@@ -0,0 +1,99 @@
+"""Cursor-based paging of question results"""
+import base64
+import hashlib
+from typing import Dict, Optional, Sequence, Tuple
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+
+
+class ResultsChanged(ValueError):
+    """A cursor points into a result list that no longer exists"""
+
+
+def snapshot_id(questions: Sequence) -> str:
+    """Short digest of a result list, so a cursor only ever indexes the list it came from"""
+    digest = hashlib.blake2b(digest_size=8)
+    for q in questions:
+        digest.update(f"{q.get('question', '')}\x1f{q.get('source', '')}\x1e".encode('utf-8', 'replace'))
+    return digest.hexdigest()
+
+
+def encode_cursor(offset: int, snapshot: Optional[str] = None) -> str:
+    """Opaque cursor pointing at the question with index `offset` of the result `snapshot`"""
+    payload = f"o:{offset}:{snapshot}" if snapshot else f"o:{offset}"
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Tuple[int, Optional[str]]:
+    """Offset and result snapshot a cursor points at; an empty cursor is the first page"""
+    if not cursor:
+        return 0, None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        prefix, offset, *snapshot = base64.urlsafe_b64decode(padded.encode()).decode().split(':')
+        snapshot = snapshot[0] if len(snapshot) == 1 and snapshot[0] else None
+        # Only the first page can be asked for without knowing which result it belongs to
+        if prefix != 'o' or int(offset) < 0 or (int(offset) > 0 and snapshot is None):
+            raise ValueError
+        return int(offset), snapshot
+    except ValueError:
+        raise ValueError(f"Invalid page cursor: {cursor!r}")
+
+
+def clamp_page_size(page_size) -> int:
+    try:
+        page_size = int(page_size)
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def paginate_response(response: Dict, cursor: Optional[str] = None,
+                      page_size: int = DEFAULT_PAGE_SIZE) -> Dict:
+    """Copy of a question response holding only one page of its questions.
+
+    Adds ``offset``, ``page_size``, ``total``, ``next_cursor`` (None on
+    the last page) and ``prev_cursor`` (None on the first). Only the sliced
+    questions are copied into the new list. Responses without questions
+    (errors, suggestions) pass through unchanged.
+
+    Cursors carry the snapshot_id of the list they were cut from; raises
+    ResultsChanged when `response` holds a different list, rather than
+    slicing it at an offset that no longer means the same thing.
+    """
+    if response.get("status") != "success" or "questions" not in response:
+        return response
+    offset, snapshot = decode_cursor(cursor)
+    page_size = clamp_page_size(page_size)
+    questions = response["questions"]
+    current = snapshot_id(questions)
+    if snapshot is not None and snapshot != current:
+        raise ResultsChanged("The results for this search changed since the last page. "
+                             "Search again to start from the first page.")
+    total = len(questions)
+    end = min(offset + page_size, total)
+    page = dict(response)
+    page.update({
+        "questions": list(questions[offset:end]),
+        "offset": offset,
+        "page_size": page_size,
+        "total": total,
+        "next_cursor": encode_cursor(end, current) if end < total else None,
+        "prev_cursor": encode_cursor(max(offset - page_size, 0), current) if offset > 0 else None,
+    })
+    return page
+
+
+def page_footer(response: Dict) -> str:
+    """'Showing questions 11-20 of 57' line for a paged response ('' if unpaged)"""
+    if "total" not in response:
+        return ""
+    offset = response["offset"]
+    shown = len(response["questions"])
+    if not shown:
+        return f"No more questions (total {response['total']}).\n"
+    footer = f"Showing questions {offset + 1}-{offset + shown} of {response['total']}."
+    if response.get("next_cursor"):
+        footer += " Say 'more' for the next page."
+    return footer + "\n"
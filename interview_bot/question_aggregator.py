@@ -2,6 +2,11 @@ import json
 import os
 from datetime import datetime
 
+try:
+    from .compiled_db import read_db
+except ImportError:
+    from compiled_db import read_db
+
 class QuestionAggregator:
     def __init__(self):
         self.db_path = os.path.join(os.path.dirname(__file__), 'questions_db_fixed.json')
@@ -41,20 +46,19 @@ class QuestionAggregator:
     def load_questions(self):
         """Load existing questions database"""
         if os.path.exists(self.db_path):
-            with open(self.db_path, 'r', encoding='utf-8') as file:
-                data = file.read()
-                try:
-                    self.questions_db = json.loads(data)
-                except json.JSONDecodeError as e:
-                    print(f"Error loading JSON at position {e.pos}: {e.msg}")
-                    # Initialize empty database if loading fails
-                    self.questions_db = {
-                        "sources": {},
-                        "companies": {},
-                        "categories": {},
-                        "difficulty_levels": {},
-                        "experience_ranges": {}
-                    }
+            # Read from the compiled artifact while it matches the JSON
+            try:
+                self.questions_db = read_db(self.db_path)
+            except json.JSONDecodeError as e:
+                print(f"Error loading JSON at position {e.pos}: {e.msg}")
+                # Initialize empty database if loading fails
+                self.questions_db = {
+                    "sources": {},
+                    "companies": {},
+                    "categories": {},
+                    "difficulty_levels": {},
+                    "experience_ranges": {}
+                }
         else:
             self.questions_db = {
                 "sources": {},
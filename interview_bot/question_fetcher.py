@@ -1,44 +1,48 @@
-import requests
-from bs4 import BeautifulSoup
 import re
-from typing import List, Dict
-import json
-import os
-from datetime import datetime
+from typing import List, Dict, Optional
+
+try:
+    from .scrape_cache import get_scrape_cache, EMPTY_TTL
+    from .scraping_stack import scraping_stack
+except ImportError:
+    from scrape_cache import get_scrape_cache, EMPTY_TTL
+    from scraping_stack import scraping_stack
+
+CACHE_NAMESPACE = 'question_fetcher'
+CACHE_TTL = 7 * 24 * 60 * 60  # Cache for 7 days
 
 class InterviewQuestionsFetcher:
     def __init__(self):
-        self.cache_file = 'interview_questions_cache.json'
-        self.cache = self._load_cache()
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-
-    def _load_cache(self) -> dict:
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
-
-    def _save_cache(self):
-        with open(self.cache_file, 'w') as f:
-            json.dump(self.cache, f, indent=2)
+        self.cache = get_scrape_cache()
+        self._http = None
+
+    @property
+    def http(self):
+        """Pooled, rate-limited client with timeouts; requests is imported on first use"""
+        if self._http is None:
+            self._http = scraping_stack().http_client.get_http_client()
+        return self._http
 
     def fetch_questions(self, company_name: str, category: str = None) -> List[Dict]:
         """Fetch interview questions for a specific company and category"""
         cache_key = f"{company_name}_{category}" if category else company_name
-        
-        # Check cache first
-        if cache_key in self.cache:
-            cache_entry = self.cache[cache_key]
-            # Cache for 7 days
-            if (datetime.now() - datetime.fromisoformat(cache_entry['timestamp'])).days < 7:
-                return cache_entry['data']
 
+        # Served from cache when possible; stale entries refresh in the background.
+        # Empty results are retried after EMPTY_TTL and failed fetches are not cached.
+        questions = self.cache.get_or_load(
+            CACHE_NAMESPACE, cache_key,
+            lambda: self._fetch_questions(company_name, category),
+            ttl=CACHE_TTL, empty_ttl=EMPTY_TTL
+        )
+        return questions if questions is not None else []
+
+    def _fetch_questions(self, company_name: str, category: str = None) -> Optional[List[Dict]]:
+        """Scrape and clean questions for a company, bypassing the cache
+
+        Returns None when no search page could be fetched at all.
+        """
         results = []
+        fetched = False
         
         # Define search queries
         search_queries = [
@@ -66,31 +70,30 @@ class InterviewQuestionsFetcher:
                 try:
                     # Construct search URL
                     url = f"https://www.google.com/search?q=site:{source}+{query}"
-                    response = requests.get(url, headers=self.headers, timeout=10)
-                    
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'lxml')
-                        
-                        # Extract search results
-                        search_results = soup.find_all('div', class_='g')
-                        
+                    # Extract search results; an unchanged page (304) reuses the last parse
+                    page_parser = scraping_stack().page_parser
+                    search_results = self.http.get_parsed(
+                        url, 'google_answers', lambda html: page_parser.extract(html, page_parser.GOOGLE_ANSWERS)
+                    )
+
+                    if search_results is not None:
+                        fetched = True
                         for result in search_results:
-                            # Extract title and snippet
-                            title = result.find('h3')
-                            snippet = result.find('div', class_='VwiC3b')
-                            link = result.find('a')
-                            
-                            if title and snippet and link:
+                            if None not in (result['title'], result['snippet'], result['link']):
                                 results.append({
-                                    'question': title.text.strip(),
-                                    'answer': snippet.text.strip(),
-                                    'source': link['href'],
+                                    'question': result['title'],
+                                    'answer': result['snippet'],
+                                    'source': result['link'],
                                     'category': category
                                 })
 
                 except Exception as e:
                     continue
 
+        if not fetched:
+            print(f"⚠️ No search page could be fetched for {company_name}")
+            return None
+
         # Process and clean results
         cleaned_results = []
         for result in results:
@@ -106,13 +109,6 @@ class InterviewQuestionsFetcher:
                     'category': result['category']
                 })
 
-        # Cache the results
-        self.cache[cache_key] = {
-            'timestamp': datetime.now().isoformat(),
-            'data': cleaned_results
-        }
-        self._save_cache()
-
         return cleaned_results
 
     def _is_valid_question(self, text: str) -> bool:
@@ -0,0 +1,139 @@
+"""Secondary indexes over the question database for fast filtering"""
+from collections import defaultdict
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+# Fields every question can be filtered on
+INDEXED_FIELDS = ("company", "exp_range", "category", "difficulty")
+
+
+class QuestionIndex:
+    """Maps each (field, value) pair to the set of question IDs that have it.
+
+    Question IDs are positions in ``self.questions``, assigned in database
+    order, so a filter combination resolves to the intersection of a few
+    precomputed sets and sorting the result restores the original order.
+    """
+
+    def __init__(self):
+        self.questions: List[dict] = []
+        self.companies: List[str] = []
+        self._postings: Dict[str, Dict[str, FrozenSet[int]]] = {}
+
+    @classmethod
+    def from_db(cls, questions_db: dict) -> "QuestionIndex":
+        """Index every question of a loaded questions_db.json"""
+        index = cls()
+        postings = {field: defaultdict(set) for field in INDEXED_FIELDS}
+        for company, exp_ranges in questions_db.get("companies", {}).items():
+            index.companies.append(company)
+            for exp_range, questions in exp_ranges.items():
+                if not isinstance(questions, (list, tuple)):
+                    continue
+                for question in questions:
+                    qid = len(index.questions)
+                    index.questions.append(question)
+                    postings["company"][company].add(qid)
+                    postings["exp_range"][exp_range].add(qid)
+                    postings["category"][question.get("category")].add(qid)
+                    postings["difficulty"][question.get("difficulty")].add(qid)
+        index._postings = {
+            field: {value: frozenset(ids) for value, ids in values.items()}
+            for field, values in postings.items()
+        }
+        return index
+
+    @classmethod
+    def from_compiled(cls, questions_db: dict, postings: Dict[str, Dict[str, Iterable[int]]]) -> "QuestionIndex":
+        """Index a database using postings prebuilt by compiled_db"""
+        index = cls()
+        for company, exp_ranges in questions_db.get("companies", {}).items():
+            index.companies.append(company)
+            for questions in exp_ranges.values():
+                if isinstance(questions, (list, tuple)):
+                    index.questions.extend(questions)
+        index._postings = {
+            field: {value: frozenset(ids) for value, ids in postings.get(field, {}).items()}
+            for field in INDEXED_FIELDS
+        }
+        return index
+
+    def __len__(self):
+        return len(self.questions)
+
+    def ids(self, field: str, value) -> FrozenSet[int]:
+        """IDs of the questions whose `field` equals `value`"""
+        return self._postings[field].get(value, frozenset())
+
+    def lookup_ids(self, company: Optional[str] = None, exp_range: Optional[str] = None,
+                   category: Optional[str] = None, difficulty: Optional[str] = None,
+                   exclude_companies: Iterable[str] = ()) -> FrozenSet[int]:
+        """Intersect the postings of every given filter; None means "any" """
+        filters = [
+            self.ids(field, value)
+            for field, value in zip(INDEXED_FIELDS, (company, exp_range, category, difficulty))
+            if value is not None
+        ]
+        if filters:
+            # Start from the smallest set so every intersection stays small
+            filters.sort(key=len)
+            ids = filters[0].intersection(*filters[1:])
+        else:
+            ids = frozenset(range(len(self.questions)))
+        for excluded in exclude_companies:
+            if ids:
+                ids = ids - self.ids("company", excluded)
+        return ids
+
+    def lookup(self, company: Optional[str] = None, exp_range: Optional[str] = None,
+               category: Optional[str] = None, difficulty: Optional[str] = None,
+               exclude_companies: Iterable[str] = (), limit: Optional[int] = None) -> List[dict]:
+        """Return the matching questions in database order"""
+        ids = sorted(self.lookup_ids(company, exp_range, category, difficulty, exclude_companies))
+        if limit is not None:
+            ids = ids[:limit]
+        return [self.questions[qid] for qid in ids]
+
+
+class ShardedQuestionIndex:
+    """The QuestionIndex lookups over one index per company, loaded on demand.
+
+    `index_for(company)` returns a company's QuestionIndex. A lookup for one
+    company touches only that company; a lookup across companies visits them
+    in database order, skipping those whose `values` (the exp_range,
+    category and difficulty values they contain) cannot match.
+    """
+
+    def __init__(self, companies: Sequence[str], counts: Dict[str, int],
+                 values: Callable[[str], Dict[str, Iterable]], index_for: Callable[[str], QuestionIndex]):
+        self.companies: List[str] = list(companies)
+        self._counts = counts
+        self._values = values
+        self._index_for = index_for
+
+    def __len__(self):
+        return sum(self._counts.values())
+
+    def _may_match(self, company: str, filters: Dict[str, object]) -> bool:
+        values = self._values(company)
+        return all(value in values.get(field, ()) for field, value in filters.items())
+
+    def lookup(self, company: Optional[str] = None, exp_range: Optional[str] = None,
+               category: Optional[str] = None, difficulty: Optional[str] = None,
+               exclude_companies: Iterable[str] = (), limit: Optional[int] = None) -> List[dict]:
+        """Return the matching questions in database order"""
+        excluded = set(exclude_companies)
+        filters = {
+            field: value
+            for field, value in (("exp_range", exp_range), ("category", category), ("difficulty", difficulty))
+            if value is not None
+        }
+        companies = self.companies if company is None else [company]
+        results: List[dict] = []
+        for name in companies:
+            if limit is not None and len(results) >= limit:
+                break
+            if name in excluded or name not in self._counts or not self._may_match(name, filters):
+                continue
+            remaining = None if limit is None else limit - len(results)
+            results.extend(self._index_for(name).lookup(name, exp_range, category, difficulty, limit=remaining))
+        return results
@@ -0,0 +1,139 @@
+"""Compact, immutable question records"""
+import sys
+from typing import Any, Dict, Iterator
+
+# Fields with a slot of their own; any other key is kept in `extra`
+FIELDS = (
+    'question', 'answer', 'category', 'difficulty', 'type', 'source', 'experience_range',
+    'date_asked', 'followup', 'followup_answer', 'company', 'company_reported', 'original_company',
+)
+# Low-cardinality metadata: interned, so all records share one string per value
+INTERNED_FIELDS = frozenset((
+    'category', 'difficulty', 'type', 'source', 'experience_range', 'date_asked', 'company', 'original_company',
+))
+_FIELD_SET = frozenset(FIELDS)
+_MISSING = object()
+
+
+def _intern(field: str, value):
+    if field in INTERNED_FIELDS and type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+class Question:
+    """One interview question, stored in slots instead of a per-question dict.
+
+    Records are read-only and shared (by the question store, the result
+    cache and every bot), so changing a field means building a new record
+    with ``replace``. A field that was never set is absent, as a missing
+    dict key would be. ``get``, ``[]`` and ``in`` work like they do on the
+    dicts this replaces; ``to_dict`` builds the plain dict handed to
+    callers outside the bot.
+    """
+
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, fields: Dict[str, Any]):
+        extra = None
+        for field, value in fields.items():
+            if field in _FIELD_SET:
+                object.__setattr__(self, field, _intern(field, value))
+            else:
+                if extra is None:
+                    extra = {}
+                extra[field] = value
+        object.__setattr__(self, 'extra', extra)
+
+    @classmethod
+    def from_dict(cls, data, **overrides) -> "Question":
+        """Record for a question dict (a record is returned as is unless overridden)"""
+        if isinstance(data, Question):
+            return data.replace(**overrides) if overrides else data
+        if overrides:
+            data = dict(data, **overrides)
+        return cls(data)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Question records are read-only; use replace()")
+
+    def __delattr__(self, name):
+        raise AttributeError("Question records are read-only; use replace()")
+
+    def get(self, key: str, default=None):
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def __getitem__(self, key: str):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def keys(self) -> Iterator[str]:
+        for field in FIELDS:
+            if hasattr(self, field):
+                yield field
+        if self.extra is not None:
+            yield from self.extra
+
+    __iter__ = keys
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {field: getattr(self, field) for field in FIELDS if hasattr(self, field)}
+        if self.extra is not None:
+            data.update(self.extra)
+        return data
+
+    def replace(self, **changes) -> "Question":
+        """New record with `changes` applied"""
+        return Question(dict(self.to_dict(), **changes))
+
+    def with_defaults(self, defaults: Dict[str, Any], **overrides) -> "Question":
+        """Record whose empty `defaults` fields are filled in and `overrides` set.
+
+        Returns the record itself when nothing would change, so records
+        that already carry their metadata are never copied.
+        """
+        changes = {field: value for field, value in defaults.items() if not self.get(field)}
+        for field, value in overrides.items():
+            if self.get(field, _MISSING) != value:
+                changes[field] = value
+        return self.replace(**changes) if changes else self
+
+    def __repr__(self):
+        return f"Question({self.to_dict()!r})"
+
+
+def question_dicts(response: Dict) -> Dict:
+    """Copy of a response whose question records are plain dicts, for callers outside the bot"""
+    questions = response.get("questions")
+    if questions is None:
+        return response
+    return dict(response, questions=[
+        q.to_dict() if isinstance(q, Question) else q for q in questions
+    ])
+
+
+def compact_companies(companies: Dict[str, Any]) -> Dict[str, Any]:
+    """The "companies" section of questions_db.json with each question list as a tuple of records.
+
+    Every record also carries the experience range it is listed under.
+    """
+    compact = {}
+    for company, exp_ranges in companies.items():
+        if not isinstance(exp_ranges, dict):
+            compact[company] = exp_ranges
+            continue
+        compact[company] = {
+            exp_range: tuple(Question.from_dict(q, experience_range=exp_range) for q in questions)
+            if isinstance(questions, list) else questions
+            for exp_range, questions in exp_ranges.items()
+        }
+    return compact
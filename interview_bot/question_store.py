@@ -0,0 +1,159 @@
+"""Process-wide, read-only question database shared by every bot instance"""
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Callable, Dict, NamedTuple, Tuple
+
+try:
+    from .compiled_db import ShardFile, open_shards
+    from .question_index import QuestionIndex, ShardedQuestionIndex
+    from .question_model import compact_companies
+    from .single_flight import SingleFlight
+except ImportError:
+    from compiled_db import ShardFile, open_shards
+    from question_index import QuestionIndex, ShardedQuestionIndex
+    from question_model import compact_companies
+    from single_flight import SingleFlight
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'questions_db.json')
+# Company shards kept loaded per store; the least recently used is dropped first
+DEFAULT_SHARD_CACHE_SIZE = int(os.environ.get('INTERVIEW_BOT_SHARD_CACHE', '64'))
+
+
+class Shard(NamedTuple):
+    """One company's questions as records, with its own question index"""
+    exp_ranges: Mapping  # exp_range -> tuple of Question records
+    index: QuestionIndex
+
+
+class CompanyShards(Mapping):
+    """company -> {exp_range: questions}, loading each company on first access.
+
+    Membership, iteration and length come from the manifest, so listing
+    companies loads nothing. Loaded shards live in an LRU of `maxsize`
+    entries; concurrent first accesses to a company share one load.
+    """
+
+    def __init__(self, shard_file: ShardFile, maxsize: int = DEFAULT_SHARD_CACHE_SIZE):
+        self._file = shard_file
+        self.maxsize = maxsize
+        self._loaded: "OrderedDict[str, Shard]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loads = SingleFlight()
+        self.loads = 0
+
+    def shard(self, company: str) -> Shard:
+        with self._lock:
+            shard = self._loaded.get(company)
+            if shard is not None:
+                self._loaded.move_to_end(company)
+                return shard
+        if company not in self._file:
+            raise KeyError(company)
+        shard = self._loads.do(company, lambda: self._load(company))
+        with self._lock:
+            self._loaded[company] = shard
+            self._loaded.move_to_end(company)
+            while len(self._loaded) > self.maxsize:
+                self._loaded.popitem(last=False)
+        return shard
+
+    def _load(self, company: str) -> Shard:
+        exp_ranges, postings = self._file.load(company)
+        # Questions become compact read-only records, built once per load
+        records = compact_companies({company: exp_ranges})[company]
+        index = QuestionIndex.from_compiled({"companies": {company: records}}, postings)
+        self.loads += 1
+        return Shard(MappingProxyType(records), index)
+
+    def loaded(self) -> Tuple[str, ...]:
+        """Companies currently held in memory, least recently used first"""
+        with self._lock:
+            return tuple(self._loaded)
+
+    def __getitem__(self, company: str) -> Mapping:
+        return self.shard(company).exp_ranges
+
+    def __contains__(self, company) -> bool:
+        return company in self._file
+
+    def __iter__(self):
+        return iter(self._file.companies)
+
+    def __len__(self):
+        return len(self._file.companies)
+
+
+class QuestionStore:
+    """questions_db.json loaded once, plus the lookups derived from it.
+
+    A store is shared by every InterviewBot, ChatBot and browser session
+    in the process, so nothing reachable from it may be modified. Each
+    question is an immutable ``Question`` record and each question list a
+    tuple; the bots' public methods hand callers plain dicts. The top-level
+    mappings are read-only views and the company list is a tuple.
+    ``db["companies"]`` is a ``CompanyShards`` mapping: a company's questions
+    are only loaded when it is looked up, so memory follows the companies
+    actually asked about rather than the whole catalog. Structures that
+    only some bots need (search index, company matcher, message parser)
+    are built on first request through ``derived`` and then shared too.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, shard_cache_size: int = DEFAULT_SHARD_CACHE_SIZE):
+        self.db_path = db_path
+        self.mtime = _mtime(db_path)
+        print(f"Loading questions from: {db_path}")
+        # Only the manifest is read here; company shards load on first access
+        shard_file = open_shards(db_path)
+        self.shards = CompanyShards(shard_file, shard_cache_size)
+        self.db = MappingProxyType(dict(shard_file.meta, companies=self.shards))
+        self.companies: Tuple[str, ...] = shard_file.companies
+        self.categories = MappingProxyType(shard_file.meta.get("categories", {}))
+        self.question_index = ShardedQuestionIndex(
+            self.companies,
+            {company: shard_file.count(company) for company in self.companies},
+            shard_file.values,
+            lambda company: self.shards.shard(company).index,
+        )
+        self._derived: Dict[str, Any] = {}
+        self._derived_lock = threading.Lock()
+
+    def derived(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return the structure registered under `name`, building it once per process"""
+        value = self._derived.get(name)
+        if value is None:
+            with self._derived_lock:
+                value = self._derived.get(name)
+                if value is None:
+                    value = self._derived[name] = build()
+        return value
+
+
+def _mtime(path: str):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+_stores: Dict[str, QuestionStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_question_store(db_path: str = DEFAULT_DB_PATH) -> QuestionStore:
+    """Return the shared store for a database file, loading it on first use.
+
+    If the file has been modified since it was loaded, a fresh store is
+    loaded for new callers; bots already holding the old one keep it. A
+    load that fails raises and is retried by the next caller.
+    """
+    key = os.path.abspath(db_path)
+    store = _stores.get(key)
+    if store is None or store.mtime != _mtime(key):
+        with _stores_lock:
+            store = _stores.get(key)
+            if store is None or store.mtime != _mtime(key):
+                store = _stores[key] = QuestionStore(key)
+    return store
@@ -0,0 +1,117 @@
+"""Per-host token-bucket rate limiting shared by all scrapers"""
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# (requests per second, burst) for each host we scrape
+DEFAULT_HOST_LIMITS: Dict[str, Tuple[float, int]] = {
+    'google.com': (1.0, 3),
+    'glassdoor.com': (0.5, 1),
+    'geeksforgeeks.org': (1.0, 2),
+    'ambitionbox.com': (1.0, 1),
+    'naukri.com': (1.0, 1),
+    'indeed.com': (1.0, 1),
+}
+
+# Limit applied to hosts without an explicit entry
+DEFAULT_LIMIT: Tuple[float, int] = (1.0, 2)
+
+
+class TokenBucket:
+    """Classic token bucket: refills at `rate` tokens/second up to `burst`"""
+
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait for it.
+
+        Tokens may go negative, which queues concurrent callers one refill
+        interval apart instead of letting them all wake up at once.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """Block only as long as needed to stay within the rate"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+def normalize_host(url_or_host: str) -> str:
+    """Reduce a URL or hostname to the registrable host used as limiter key"""
+    host = urlsplit(url_or_host).hostname if '://' in url_or_host else url_or_host
+    host = (host or '').lower().rstrip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+    return host
+
+
+class RateLimiter:
+    """Registry of token buckets keyed by host.
+
+    Subdomains share their parent's bucket when the parent is configured,
+    so ``www.google.com`` and ``google.com`` draw from the same budget.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 default: Tuple[float, int] = DEFAULT_LIMIT):
+        self.limits = dict(DEFAULT_HOST_LIMITS if limits is None else limits)
+        self.default = default
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host: str, rate: float, burst: int):
+        """Set (or replace) the rate and burst for a host"""
+        host = normalize_host(host)
+        with self._lock:
+            self.limits[host] = (rate, burst)
+            self._buckets.pop(host, None)
+
+    def _resolve(self, host: str) -> str:
+        parts = host.split('.')
+        for i in range(len(parts) - 1):
+            candidate = '.'.join(parts[i:])
+            if candidate in self.limits:
+                return candidate
+        return host
+
+    def bucket_for(self, url_or_host: str) -> TokenBucket:
+        key = self._resolve(normalize_host(url_or_host))
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate, burst = self.limits.get(key, self.default)
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+            return bucket
+
+    def acquire(self, url_or_host: str):
+        """Wait for permission to send one request to the given host"""
+        self.bucket_for(url_or_host).acquire()
+
+
+_default_limiter = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter"""
+    global _default_limiter
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter()
+        return _default_limiter
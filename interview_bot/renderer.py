@@ -0,0 +1,341 @@
+"""Single-pass rendering of question responses as text, Markdown, HTML or JSON"""
+import html
+import json
+import threading
+from collections import OrderedDict
+from string import Formatter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    from .pagination import page_footer
+except ImportError:
+    from pagination import page_footer
+
+MODES = ('text', 'markdown', 'html', 'json')
+DEFAULT_MEMO_SIZE = 4096  # rendered question bodies kept across responses
+
+_MISSING = object()
+
+
+def _json_default(value):
+    # Question records serialize as their dict view
+    to_dict = getattr(value, 'to_dict', None)
+    return to_dict() if to_dict is not None else str(value)
+
+
+def _to_text(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return ', '.join(str(v) for v in value)
+    return str(value)
+
+
+class Template:
+    """A format string split once into literal text and field names.
+
+    Rendering appends the pieces to an output list instead of building
+    intermediate strings, so a whole response is joined exactly once.
+    Missing fields use `defaults` (or 'None', like ``str(q.get(...))``);
+    list values are joined with commas.
+    """
+
+    def __init__(self, source: str, **defaults):
+        self.parts: List[Tuple[str, Optional[str]]] = [
+            (literal, field) for literal, field, _, _ in Formatter().parse(source)
+        ]
+        self.defaults = defaults
+
+    def render_into(self, out: List[str], values: Dict, escape=None):
+        append = out.append
+        for literal, field in self.parts:
+            if literal:
+                append(literal)
+            if field is not None:
+                value = values.get(field, _MISSING)
+                if value is _MISSING:
+                    value = self.defaults.get(field)
+                text = value if type(value) is str else _to_text(value)
+                append(escape(text) if escape else text)
+
+    def render(self, values: Dict, escape=None) -> str:
+        out: List[str] = []
+        self.render_into(out, values, escape)
+        return ''.join(out)
+
+
+class Line(NamedTuple):
+    """One template of a question layout and when it applies"""
+    template: Template
+    field: Optional[str] = None
+    when: Optional[str] = None  # None: always; 'in': field present; 'truthy': field set and non-empty
+
+
+def _applies(line: Line, q: Dict) -> bool:
+    if line.when is None:
+        return True
+    if line.when == 'in':
+        return line.field in q
+    return bool(q.get(line.field))
+
+
+def _alternatives(entry) -> Tuple[Line, ...]:
+    return entry if isinstance(entry[0], Line) else (entry,)
+
+
+class Layout(NamedTuple):
+    """Precompiled templates for one output style"""
+    header: Template
+    question_title: Template
+    question: Tuple[Any, ...]  # Lines, or tuples of Lines where the first that applies wins
+    question_end: Template
+    error: Template
+    categories_title: Optional[Template] = None
+    category: Optional[Template] = None
+    footer: Template = Template('{footer}\n')
+    escape: Any = None
+    close: str = ''
+
+
+_TEXT_HEADER = Template("\nInterview Questions for {company} ({experience_range} years experience)\n" + "=" * 80 + "\n\n")
+
+LAYOUTS: Dict[Tuple[str, str], Layout] = {
+    # InterviewBot in bot.py
+    ('bot', 'text'): Layout(
+        header=_TEXT_HEADER,
+        question_title=Template("Question #{number}:\n"),
+        question=(
+            (Line(Template("[Found in {original_company} interviews]\n"), 'original_company', 'in'),
+             Line(Template("[Found from online source]\n"), 'source', 'in')),
+            Line(Template("Category: {category}\n", category='General')),
+            Line(Template("Q: {question}\n")),
+            Line(Template("A: {answer}\n"), 'answer', 'truthy'),
+            Line(Template("Follow-up: {followup}\n"), 'followup', 'truthy'),
+            Line(Template("Follow-up Answer: {followup_answer}\n"), 'followup_answer', 'truthy'),
+        ),
+        question_end=Template("-" * 40 + "\n\n"),
+        error=Template("Error: {message}", message='Unknown error occurred'),
+    ),
+    # InterviewBot in interview_bot.py (chat and web apps)
+    ('legacy', 'text'): Layout(
+        header=_TEXT_HEADER,
+        question_title=Template("Question #{number}:\n==========\n"),
+        question=(
+            Line(Template("Topic: {question}\n")),
+            Line(Template("Category: {category}\n")),
+            Line(Template("Difficulty: {difficulty}\n")),
+            Line(Template("Asked in: {date_asked}\n", date_asked='N/A')),
+            Line(Template("Type: {type}\n"), 'type', 'in'),
+            Line(Template("\nAnswer:\n-------\n{answer}\n"), 'answer', 'in'),
+            Line(Template("Source: {source}\n"), 'source', 'in'),
+            Line(Template("Reported by candidates at: {company_reported}\n"), 'company_reported', 'in'),
+            Line(Template("\nFollow-up Question:\n------------------\n{followup}\n"), 'followup', 'in'),
+            Line(Template("\nFollow-up Answer:\n---------------\n{followup_answer}\n"), 'followup_answer', 'in'),
+        ),
+        question_end=Template("\n" + "=" * 80 + "\n\n"),
+        error=Template("{message}\n\nYou can:\n- Ask for company specific questions\n- View question categories\n"
+                       "- List available companies\n- Type 'help' for more details"),
+        categories_title=Template("\nAvailable Categories:\n"),
+        category=Template("{name}: {topics}\n"),
+    ),
+}
+
+_MARKDOWN = Layout(
+    header=Template("## Interview Questions for {company} ({experience_range} years experience)\n\n"),
+    question_title=Template("### Question {number}\n\n"),
+    question=(
+        Line(Template("**Q:** {question}\n\n")),
+        Line(Template("**Category:** {category} | **Difficulty:** {difficulty}\n\n",
+                      category='General', difficulty='Medium')),
+        Line(Template("**Answer:**\n\n{answer}\n\n"), 'answer', 'truthy'),
+        Line(Template("**Follow-up:** {followup}\n\n"), 'followup', 'truthy'),
+        Line(Template("**Follow-up Answer:**\n\n{followup_answer}\n\n"), 'followup_answer', 'truthy'),
+        Line(Template("_Source: {source}_\n\n"), 'source', 'truthy'),
+    ),
+    question_end=Template("---\n\n"),
+    error=Template("**Error:** {message}", message='Unknown error occurred'),
+    categories_title=Template("\n#### Available Categories\n\n"),
+    category=Template("- **{name}:** {topics}\n"),
+    footer=Template("_{footer}_\n"),
+)
+
+_HTML = Layout(
+    header=Template('<div class="questions"><h2>Interview Questions for {company} '
+                    '({experience_range} years experience)</h2>\n'),
+    question_title=Template('<div class="question"><h3>Question {number}</h3>'),
+    question=(
+        Line(Template('<p class="question-text">{question}</p>')),
+        Line(Template('<p class="meta">Category: {category} | Difficulty: {difficulty}</p>',
+                      category='General', difficulty='Medium')),
+        Line(Template('<pre class="answer">{answer}</pre>'), 'answer', 'truthy'),
+        Line(Template('<p class="followup">Follow-up: {followup}</p>'), 'followup', 'truthy'),
+        Line(Template('<pre class="followup-answer">{followup_answer}</pre>'), 'followup_answer', 'truthy'),
+        Line(Template('<p class="source">Source: {source}</p>'), 'source', 'truthy'),
+    ),
+    question_end=Template('</div>\n'),
+    error=Template('<p class="error">{message}</p>', message='Unknown error occurred'),
+    categories_title=Template('<h4>Available Categories</h4>\n<ul class="categories">'),
+    category=Template('<li><b>{name}:</b> {topics}</li>'),
+    footer=Template('<p class="page">{footer}</p>'),
+    escape=html.escape,
+    close='</div>',
+)
+
+for _style in ('bot', 'legacy'):
+    LAYOUTS[(_style, 'markdown')] = _MARKDOWN
+    LAYOUTS[(_style, 'html')] = _HTML
+
+_JSON_FIELDS = ('company', 'experience_range', 'offset', 'page_size', 'total', 'next_cursor', 'filters_applied')
+
+
+class ResponseRenderer:
+    """Renders bot responses in one pass, reusing already rendered questions.
+
+    Each question body is memoized under its ID: the ``id`` field when
+    there is one, otherwise the question's own rendered fields. Paging
+    through or re-requesting a result therefore only renders questions
+    not seen before; the rest are copied from the memo. The category
+    listing is rendered once per categories mapping.
+    """
+
+    def __init__(self, style: str = 'bot', memo_size: int = DEFAULT_MEMO_SIZE):
+        self.style = style
+        self.memo_size = memo_size
+        self._memo: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._categories = {}  # mode -> (categories, rendered)
+        self._fields = {
+            mode: self._layout_fields(LAYOUTS[(style, mode)]) for mode in MODES if (style, mode) in LAYOUTS
+        }
+        # Each question entry as a tuple of alternatives, so rendering needs no type checks
+        self._plans = {
+            mode: tuple(_alternatives(entry) for entry in LAYOUTS[(style, mode)].question) for mode in self._fields
+        }
+
+    @staticmethod
+    def _layout_fields(layout: Layout) -> Tuple[str, ...]:
+        fields = []
+        for entry in layout.question:
+            for line in _alternatives(entry):
+                for _, field in line.template.parts:
+                    if field and field not in fields:
+                        fields.append(field)
+                if line.field and line.field not in fields:
+                    fields.append(line.field)
+        return tuple(fields)
+
+    def question_id(self, q: Dict, mode: str):
+        if q.get('id') is not None:
+            return mode, q['id']
+        get = q.get
+        key = (mode,) + tuple([get(field, _MISSING) for field in self._fields[mode]])
+        try:
+            hash(key)
+        except TypeError:  # list values such as company_reported
+            key = tuple(tuple(v) if isinstance(v, list) else v for v in key)
+        return key
+
+    def _question_body(self, q: Dict, mode: str) -> str:
+        key = self.question_id(q, mode)
+        memo = self._memo
+        with self._lock:
+            body = memo.get(key)
+            if body is not None:
+                memo.move_to_end(key)
+                return body
+        escape = LAYOUTS[(self.style, mode)].escape
+        out: List[str] = []
+        for alternatives in self._plans[mode]:
+            for line in alternatives:
+                if _applies(line, q):
+                    line.template.render_into(out, q, escape)
+                    break
+        body = ''.join(out)
+        with self._lock:
+            memo[key] = body
+            if len(memo) > self.memo_size:
+                memo.popitem(last=False)
+        return body
+
+    def _category_listing(self, categories, mode: str) -> str:
+        cached = self._categories.get(mode)
+        if cached is not None and cached[0] is categories:
+            return cached[1]
+        layout = LAYOUTS[(self.style, mode)]
+        out: List[str] = []
+        layout.categories_title.render_into(out, {})
+        for name, topics in categories.items():
+            layout.category.render_into(out, {'name': name, 'topics': topics}, layout.escape)
+        if mode == 'html':
+            out.append('</ul>\n')
+        rendered = self._categories[mode] = (categories, ''.join(out))
+        return rendered[1]
+
+    def render(self, response: Dict, mode: str = 'text', categories=None) -> str:
+        """Render a (possibly paged) response; `categories` adds the category listing"""
+        if mode not in MODES:
+            raise ValueError(f"Unknown output mode: {mode!r} (expected one of {', '.join(MODES)})")
+        if mode == 'json':
+            return self._render_json(response)
+
+        layout = LAYOUTS[(self.style, mode)]
+        out: List[str] = []
+        if response.get("status") in ["error", "partial"]:
+            layout.error.render_into(out, response, layout.escape)
+            return ''.join(out)
+
+        layout.header.render_into(out, response, layout.escape)
+        question_end = layout.question_end.render({})
+        number = response.get("offset", 0)
+        for q in response.get("questions", []):
+            number += 1
+            layout.question_title.render_into(out, {'number': number})
+            out.append(self._question_body(q, mode))
+            out.append(question_end)
+
+        footer = page_footer(response)
+        if footer:
+            layout.footer.render_into(out, {'footer': footer.rstrip('\n')}, layout.escape)
+        if categories and layout.category is not None:
+            out.append(self._category_listing(categories, mode))
+        out.append(layout.close)
+        return ''.join(out)
+
+    def _render_json(self, response: Dict) -> str:
+        if response.get("status") != "success":
+            return json.dumps({"status": response.get("status"), "message": response.get("message")})
+        out = ['{"status": "success"']
+        for field in _JSON_FIELDS:
+            if field in response:
+                out.append(f', {json.dumps(field)}: {json.dumps(response[field], default=_json_default)}')
+        out.append(', "questions": [')
+        out.append(', '.join(self._question_json(q) for q in response.get("questions", [])))
+        out.append(']}')
+        return ''.join(out)
+
+    def _question_json(self, q: Dict) -> str:
+        # Without an ID field the dict itself identifies the question
+        has_id = q.get('id') is not None
+        key = ('json', q['id']) if has_id else ('json', id(q))
+        with self._lock:
+            cached = self._memo.get(key)
+            if cached is not None and (has_id or cached[0] is q):
+                self._memo.move_to_end(key)
+                return cached[1]
+        text = json.dumps(q, default=_json_default)
+        with self._lock:
+            self._memo[key] = (q, text)
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return text
+
+
+_renderers: Dict[str, ResponseRenderer] = {}
+_renderers_lock = threading.Lock()
+
+
+def get_renderer(style: str = 'bot') -> ResponseRenderer:
+    """Return the process-wide renderer for a layout style ('bot' or 'legacy')"""
+    with _renderers_lock:
+        renderer = _renderers.get(style)
+        if renderer is None:
+            renderer = _renderers[style] = ResponseRenderer(style)
+        return renderer
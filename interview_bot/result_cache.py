@@ -0,0 +1,70 @@
+"""Bounded in-memory LRU cache with per-entry TTLs and hit/miss counters"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+DEFAULT_MAXSIZE = 256  # entries kept before the least recently used is evicted
+DEFAULT_TTL = 5 * 60  # seconds an entry may be served
+
+
+class ResultCache:
+    """Thread-safe LRU cache for computed results.
+
+    Every entry is stored with a `version` describing the data it was
+    computed from (for example a database mtime and a scrape-cache
+    timestamp). A lookup passes the current version and an entry built
+    from anything else counts as a miss, so results are invalidated as
+    soon as their inputs change, without any explicit notification.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, version, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0  # misses caused by expiry or a changed version
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable, version: Hashable = None) -> Optional[Any]:
+        """Return the cached value for `key` at `version`, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, entry_version, value = entry
+                if expires_at > time.monotonic() and entry_version == version:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.invalidations += 1
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any, version: Hashable = None):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
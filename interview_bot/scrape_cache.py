@@ -0,0 +1,231 @@
+"""SQLite-backed cache shared by every scraper and web search"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+try:
+    from .settings import get_cache_dir
+    from .single_flight import SingleFlight
+except ImportError:
+    from settings import get_cache_dir
+    from single_flight import SingleFlight
+
+CACHE_FILENAME = 'scrape_cache.db'
+DEFAULT_TTL = 24 * 60 * 60  # one day, in seconds
+EMPTY_TTL = 60  # a load that found nothing is retried after a minute
+COMPACT_EVERY = 500  # writes between automatic compactions
+MAX_STALE = 30 * 24 * 60 * 60  # stale entries older than this are purged on compaction
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries (expires_at);
+"""
+
+
+def default_cache_path() -> str:
+    """INTERVIEW_BOT_CACHE_DB when set, otherwise scrape_cache.db in the user cache directory"""
+    return os.environ.get('INTERVIEW_BOT_CACHE_DB') or os.path.join(get_cache_dir(), CACHE_FILENAME)
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    created_at: float
+    expires_at: float
+
+    @property
+    def is_stale(self) -> bool:
+        return time.time() >= self.expires_at
+
+
+class ScrapeCache:
+    """Persistent key/value cache with per-entry TTLs.
+
+    Entries live in a SQLite database in WAL mode so several processes can
+    read while one writes. Lookups go through the (namespace, key) primary
+    key. ``get_or_load`` serves stale entries immediately and refreshes them
+    on a background thread, and concurrent misses for the same key share a
+    single load.
+    """
+
+    def __init__(self, path: Optional[str] = None, default_ttl: float = DEFAULT_TTL):
+        self.path = path = path or default_cache_path()
+        self.default_ttl = default_ttl
+        self._local = threading.local()
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        self._refresher = None
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+        self._loads = SingleFlight()
+        try:
+            self._connect().executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            # Read-only or missing directory: keep working from memory
+            print(f"Scrape cache unavailable at {path} ({str(e)}), using in-memory cache")
+            self.path = 'file:scrape_cache?mode=memory&cache=shared'
+            self._local = threading.local()
+            self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, uri=self.path.startswith('file:'),
+                                   isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def get(self, namespace: str, key: str) -> Optional[CacheEntry]:
+        """Return the entry for a key, stale or not, or None if missing"""
+        row = self._connect().execute(
+            'SELECT value, created_at, expires_at FROM cache_entries WHERE namespace = ? AND key = ?',
+            (namespace, key)
+        ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(json.loads(row[0]), row[1], row[2])
+
+    def stamp(self, namespace: str, key: str) -> Optional[float]:
+        """When the entry for a key was last written, or None if missing.
+
+        Cheaper than ``get`` (no value is read or decoded), so callers can
+        tell whether derived data is still current.
+        """
+        row = self._connect().execute(
+            'SELECT created_at FROM cache_entries WHERE namespace = ? AND key = ?', (namespace, key)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a JSON-serializable value for `ttl` seconds.
+
+        Each write is a single-row upsert appended to the WAL, independent
+        of how many entries the cache holds.
+        """
+        now = time.time()
+        ttl = self.default_ttl if ttl is None else ttl
+        self._connect().execute(
+            'INSERT OR REPLACE INTO cache_entries (namespace, key, value, created_at, expires_at) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (namespace, key, json.dumps(value), now, now + ttl)
+        )
+        self._count_writes(1)
+
+    def import_entries(self, namespace: str, items: Dict[str, Any], ttl: Optional[float] = None) -> int:
+        """Bulk-load entries in one transaction without overwriting existing keys"""
+        now = time.time()
+        ttl = self.default_ttl if ttl is None else ttl
+        conn = self._connect()
+        with conn:
+            conn.execute('BEGIN')
+            cursor = conn.executemany(
+                'INSERT OR IGNORE INTO cache_entries (namespace, key, value, created_at, expires_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                [(namespace, key, json.dumps(value), now, now + ttl) for key, value in items.items()]
+            )
+        self._count_writes(cursor.rowcount)
+        return cursor.rowcount
+
+    def _count_writes(self, count: int):
+        with self._writes_lock:
+            self._writes += count
+            due = self._writes >= COMPACT_EVERY
+            if due:
+                self._writes = 0
+        if due:
+            self.compact()
+
+    def compact(self, max_stale: float = MAX_STALE):
+        """Purge long-expired entries and fold the WAL back into the database"""
+        conn = self._connect()
+        conn.execute('DELETE FROM cache_entries WHERE expires_at < ?', (time.time() - max_stale,))
+        try:
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        except sqlite3.OperationalError as e:
+            # Another process holds a read lock; the next compaction retries
+            print(f"Scrape cache checkpoint skipped: {str(e)}")
+
+    def delete(self, namespace: str, key: str):
+        self._connect().execute(
+            'DELETE FROM cache_entries WHERE namespace = ? AND key = ?', (namespace, key)
+        )
+
+    def _load_and_store(self, namespace, key, loader, ttl, empty_ttl=None):
+        value = loader()
+        if value is None:
+            return value
+        if not value and empty_ttl is not None:
+            # Keep earlier results rather than replace them with nothing
+            entry = self.get(namespace, key)
+            if entry is not None and entry.value:
+                return entry.value
+            ttl = empty_ttl
+        self.set(namespace, key, value, ttl)
+        return value
+
+    def _refresh(self, namespace, key, loader, ttl, empty_ttl=None):
+        try:
+            self._load_and_store(namespace, key, loader, ttl, empty_ttl)
+        except Exception as e:
+            print(f"Background refresh failed for {namespace}/{key}: {str(e)}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard((namespace, key))
+
+    def refresh_in_background(self, namespace: str, key: str, loader: Callable[[], Any],
+                              ttl: Optional[float] = None, empty_ttl: Optional[float] = None):
+        """Re-run `loader` off the request path unless a refresh is already running"""
+        with self._refresh_lock:
+            if (namespace, key) in self._refreshing:
+                return
+            self._refreshing.add((namespace, key))
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+            refresher = self._refresher
+        refresher.submit(self._refresh, namespace, key, loader, ttl, empty_ttl)
+
+    def get_or_load(self, namespace: str, key: str, loader: Callable[[], Any],
+                    ttl: Optional[float] = None, empty_ttl: Optional[float] = None) -> Any:
+        """Return the cached value, loading it on a miss.
+
+        Fresh hits return immediately. Stale hits also return immediately,
+        while a background refresh replaces the entry. Callers that miss
+        while another caller is already loading the same key wait for that
+        load instead of running their own. A loader result of None (a
+        failed load) is returned but never cached. With `empty_ttl`, an
+        empty result is only cached for that long and never replaces an
+        earlier non-empty one.
+        """
+        entry = self.get(namespace, key)
+        if entry is None:
+            return self._loads.do((namespace, key),
+                                  lambda: self._load_and_store(namespace, key, loader, ttl, empty_ttl))
+        if entry.is_stale:
+            self.refresh_in_background(namespace, key, loader, ttl, empty_ttl)
+        return entry.value
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_scrape_cache() -> ScrapeCache:
+    """Return the process-wide scrape cache"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ScrapeCache()
+        return _default_cache
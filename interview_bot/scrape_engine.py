@@ -0,0 +1,140 @@
+"""Concurrent fan-out engine for the web scrapers"""
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+# Upper bound on scraper requests in flight at once
+DEFAULT_MAX_WORKERS = 12
+
+
+class ScrapeEngine:
+    """Runs scraper jobs on a bounded thread pool and yields results as they finish.
+
+    A job is a ``(source, func, args)`` tuple; ``func(*args)`` must return a
+    list of question dicts, or None if it failed.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self._in_flight = {}  # key -> {future: source} of a shared run
+        self._in_flight_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="scrape"
+                )
+            return self._executor
+
+    def submit(self, jobs):
+        """Schedule every job and return a {future: source} mapping"""
+        executor = self._get_executor()
+        return {executor.submit(func, *args): source for source, func, args in jobs}
+
+    def submit_shared(self, key, jobs, on_complete=None):
+        """Schedule `jobs` unless a run with the same key is still in flight.
+
+        Returns ``(futures, joined)``. A caller that joins an in-flight run
+        gets its futures instead of scheduling the jobs again; only the
+        first caller's `on_complete` is registered. The key is released
+        once every job has finished and `on_complete` has run.
+        """
+        with self._in_flight_lock:
+            futures = self._in_flight.get(key)
+            if futures is not None:
+                return futures, True
+            futures = self._in_flight[key] = self.submit(jobs)
+
+        def finish(job_results):
+            try:
+                if on_complete is not None:
+                    on_complete(job_results)
+            finally:
+                with self._in_flight_lock:
+                    self._in_flight.pop(key, None)
+
+        self._call_when_done(futures, finish)
+        return futures, False
+
+    @staticmethod
+    def _job_results(future, source, report=False):
+        """A job's results, or None if it raised or reported failure"""
+        try:
+            return future.result()
+        except Exception as e:
+            if report:
+                print(f"Error in {source} scraper: {str(e)}")
+            return None
+
+    def _call_when_done(self, futures, callback):
+        """Call callback([(source, results), ...]) once every future has finished"""
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def on_done(_):
+            with lock:
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if finished:
+                try:
+                    callback([(source, self._job_results(f, source)) for f, source in futures.items()])
+                except Exception as e:
+                    print(f"Error in scrape completion callback: {str(e)}")
+
+        for future in futures:
+            future.add_done_callback(on_done)
+
+    def run(self, jobs, timeout=None, on_complete=None, key=None):
+        """Yield (source, results) pairs in completion order.
+
+        A failing job is reported and yields None (an empty list means it
+        ran and found nothing), so one broken source never takes down the
+        whole search and callers can still tell when every source failed. With a `timeout` (seconds)
+        iteration simply stops at the deadline; unfinished jobs keep running
+        in the background. `on_complete`, if given, receives every job's
+        (source, results) in submission order once all of them have finished,
+        including those that outlived the deadline.
+
+        Runs given the same `key` while one is in flight share its jobs
+        (see ``submit_shared``); each caller still iterates with its own
+        timeout.
+        """
+        if key is None:
+            futures = self.submit(jobs)
+            if on_complete is not None:
+                self._call_when_done(futures, on_complete)
+        else:
+            futures, joined = self.submit_shared(key, jobs, on_complete)
+            if joined:
+                print(f"🔗 Joining the scrape already in flight for {key}")
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                source = futures[future]
+                yield source, self._job_results(future, source, report=True)
+        except FuturesTimeoutError:
+            pending = sum(1 for future in futures if not future.done())
+            print(f"⏱️ Deadline reached with {pending} scrape jobs still running in the background")
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pool; it is recreated on the next submit"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_default_engine = None
+_default_engine_lock = threading.Lock()
+
+
+def get_engine() -> ScrapeEngine:
+    """Return the process-wide scrape engine"""
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = ScrapeEngine()
+        return _default_engine
@@ -0,0 +1,30 @@
+"""Deferred import of the scraping stack.
+
+http_client and page_parser pull in requests, urllib3, bs4 and lxml, which
+dominate the package's import time. Sessions that only browse the local
+database never need them, so scrapers call ``scraping_stack()`` when they
+are about to fetch a page instead of importing them at module level.
+"""
+from types import ModuleType
+from typing import NamedTuple
+
+
+class ScrapingStack(NamedTuple):
+    http_client: ModuleType
+    page_parser: ModuleType
+
+
+_stack = None
+
+
+def scraping_stack() -> ScrapingStack:
+    """The http_client and page_parser modules, imported on first call"""
+    global _stack
+    if _stack is None:
+        try:
+            from . import http_client, page_parser
+        except ImportError:
+            import http_client
+            import page_parser
+        _stack = ScrapingStack(http_client, page_parser)
+    return _stack
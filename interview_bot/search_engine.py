@@ -1,30 +1,50 @@
-import requests
-from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
-import time
 import json
 import os
+import threading
+
+try:
+    from .scrape_cache import get_scrape_cache
+    from .scraping_stack import scraping_stack
+except ImportError:
+    from scrape_cache import get_scrape_cache
+    from scraping_stack import scraping_stack
+
+CACHE_NAMESPACE = 'search_engine'
+CACHE_TTL = 24 * 60 * 60  # Search results are refreshed daily
+LEGACY_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'search_cache.json')
+
+_legacy_lock = threading.Lock()
 
 class SearchEngine:
     def __init__(self):
-        self.cache_file = os.path.join(os.path.dirname(__file__), 'search_cache.json')
-        self.cache = self._load_cache()
-        self.search_delay = 1  # Delay between searches to respect rate limits
+        self.cache = get_scrape_cache()
+        self._http = None
 
-    def _load_cache(self) -> Dict:
-        """Load search cache from file"""
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+    @property
+    def http(self):
+        """Pooled, rate-limited client with timeouts; requests is imported on first use"""
+        if self._http is None:
+            self._http = scraping_stack().http_client.get_http_client()
+        return self._http
+
+    def _import_legacy_cache(self):
+        """One-time import of the old whole-file search_cache.json.
 
-    def _save_cache(self):
-        """Save search cache to file"""
-        with open(self.cache_file, 'w') as f:
-            json.dump(self.cache, f)
+        Runs on the first search rather than at startup; the file is renamed
+        afterwards so it is never read again.
+        """
+        with _legacy_lock:
+            if not os.path.exists(LEGACY_CACHE_FILE):
+                return
+            try:
+                with open(LEGACY_CACHE_FILE, 'r') as f:
+                    legacy = json.load(f)
+                imported = self.cache.import_entries(CACHE_NAMESPACE, legacy, ttl=CACHE_TTL)
+                print(f"Imported {imported} entries from {LEGACY_CACHE_FILE}")
+            except Exception as e:
+                print(f"Skipping unreadable legacy search cache: {str(e)}")
+            os.replace(LEGACY_CACHE_FILE, LEGACY_CACHE_FILE + '.migrated')
 
     def search(self, query: str, category: Optional[str] = None) -> List[Dict]:
         """
@@ -32,11 +52,17 @@ class SearchEngine:
         Returns a list of relevant results
         """
         cache_key = f"{category}_{query}" if category else query
-        
-        # Check cache first
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        self._import_legacy_cache()
 
+        # Served from cache when possible; stale entries refresh in the background
+        return self.cache.get_or_load(
+            CACHE_NAMESPACE, cache_key,
+            lambda: self._search_sources(query, category),
+            ttl=CACHE_TTL
+        )
+
+    def _search_sources(self, query: str, category: Optional[str] = None) -> List[Dict]:
+        """Run the site-restricted searches for a query"""
         sources = []
         if category == "coding":
             sources = [
@@ -66,40 +92,36 @@ class SearchEngine:
         results = []
         for source in sources:
             search_url = f"https://www.google.com/search?q=site:{source} {query}"
-            
+
             try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                response = requests.get(search_url, headers=headers)
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract search results
-                search_results = soup.find_all('div', class_='g')
-                
-                for result in search_results[:3]:  # Get top 3 results from each source
-                    title_elem = result.find('h3')
-                    link_elem = result.find('a')
-                    snippet_elem = result.find('div', class_='VwiC3b')
-                    
-                    if title_elem and link_elem and snippet_elem:
-                        results.append({
-                            'title': title_elem.text,
-                            'link': link_elem['href'],
-                            'snippet': snippet_elem.text,
-                            'source': source
-                        })
-                
-                time.sleep(self.search_delay)  # Respect rate limits
-                
+                results.extend(self.fetch_results(search_url, source))
             except Exception as e:
                 print(f"Error searching {source}: {str(e)}")
                 continue
 
-        # Cache the results
-        self.cache[cache_key] = results
-        self._save_cache()
-        
+        return results
+
+    def fetch_results(self, search_url: str, source: str, limit: int = 3) -> List[Dict]:
+        """
+        Fetch one Google results page and extract the top results
+        """
+        # Extract search results; an unchanged page (304) reuses the last parse
+        page_parser = scraping_stack().page_parser
+        search_results = self.http.get_parsed(
+            search_url, f'google_answers_{limit}',
+            lambda html: page_parser.extract(html, page_parser.GOOGLE_ANSWERS._replace(limit=limit))
+        ) or []
+
+        results = []
+        for result in search_results:  # Get top results from each source
+            if None not in (result['title'], result['link'], result['snippet']):
+                results.append({
+                    'title': result['title'],
+                    'link': result['link'],
+                    'snippet': result['snippet'],
+                    'source': source
+                })
+
         return results
 
     def get_coding_solutions(self, question: str) -> List[Dict]:
@@ -114,12 +136,12 @@ class SearchEngine:
         """
         if not results:
             return "No results found."
-        
+
         formatted = "Search Results:\n\n"
-        
+
         for idx, result in enumerate(results, 1):
             formatted += f"{idx}. {result['title']}\n"
             formatted += f"   Source: {result['source']}\n"
             formatted += f"   {result['snippet']}\n\n"
-            
+
         return formatted
\ No newline at end of file
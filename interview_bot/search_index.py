@@ -0,0 +1,117 @@
+"""Inverted index with BM25 ranking for full-text question search"""
+import heapq
+import itertools
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# BM25 parameters (the usual defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+DEFAULT_TOP_K = 20
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[+#][+#]?)?")
+
+STOP_WORDS = frozenset("""
+a an and are as at be by can do does for from how i if in is it its of on or
+the this to what when which why with you your
+""".split())
+
+# Checked in order; the first suffix that leaves a long enough stem wins
+_SUFFIXES = ("ations", "ation", "ings", "ing", "ies", "ed", "es", "ly", "s")
+_MIN_STEM = 3
+
+
+def stem(token: str) -> str:
+    """Strip a common English suffix so 'waits', 'waiting' and 'wait' match"""
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= _MIN_STEM:
+            token = token[:-len(suffix)]
+            if suffix == "ies":
+                token += "y"
+            break
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split into words, drop stop words and stem the rest"""
+    return [stem(t) for t in _TOKEN_RE.findall(text.lower()) if t not in STOP_WORDS]
+
+
+class SearchIndex:
+    """Inverted index over question texts, ranked with Okapi BM25.
+
+    Postings map each term to ``(doc_id, term_frequency)`` pairs, so a query
+    only touches the documents that contain at least one of its terms
+    instead of scanning the whole question database.
+    """
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self.doc_lengths: List[int] = []
+        self.docs: List[dict] = []
+        self.texts: List[str] = []
+        self.total_length = 0
+
+    def __len__(self):
+        return len(self.docs)
+
+    def add(self, text: str, doc: dict) -> int:
+        """Index `text` and remember `doc` as the payload returned on a match"""
+        doc_id = len(self.docs)
+        terms = tokenize(text)
+        for term, tf in Counter(terms).items():
+            self.postings[term].append((doc_id, tf))
+        self.docs.append(doc)
+        self.texts.append(text.lower())
+        self.doc_lengths.append(len(terms))
+        self.total_length += len(terms)
+        return doc_id
+
+    def add_many(self, items: Iterable[Tuple[str, dict]]):
+        for text, doc in items:
+            self.add(text, doc)
+
+    def idf(self, term: str) -> float:
+        df = len(self.postings.get(term, ()))
+        n = len(self.docs)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, top_k: Optional[int] = DEFAULT_TOP_K) -> List[Tuple[float, dict]]:
+        """Return up to `top_k` (score, doc) pairs, best match first.
+
+        Every query term contributes independently, so multi-term queries
+        rank documents that contain more (and rarer) terms higher.
+        `top_k=None` returns every matching document.
+        """
+        if not self.docs:
+            return []
+        avg_length = self.total_length / len(self.docs) or 1.0
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for doc_id, tf in postings:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+        if top_k is None:
+            best = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        else:
+            best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [(score, self.docs[doc_id]) for doc_id, score in best]
+
+    def substring_search(self, query: str, top_k: Optional[int] = None) -> List[dict]:
+        """Docs whose text contains `query` as a plain substring, in index order.
+
+        This is the linear scan search_questions used before the index, kept
+        for queries BM25 cannot answer: parts of words ('graph' in
+        'paragraph') and queries made only of stop words.
+        """
+        query = query.lower()
+        matches = (doc for text, doc in zip(self.texts, self.docs) if query in text)
+        return list(matches if top_k is None else itertools.islice(matches, top_k))
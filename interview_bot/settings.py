@@ -1,18 +1,44 @@
 import os
-import json
+import tempfile
 
 def get_db_path():
-    """Get the path to the questions database"""
+    """Get the path to the questions database
+
+    The file is only checked for existence here; its contents are
+    validated when the question store loads it (from the compiled
+    artifact when that is current), so startup never parses it twice.
+    """
     path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'questions_db.json')
     
     if os.path.exists(path):
         print(f"Found database at: {path}")
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                # Verify it's valid JSON
-                json.load(f)
-            return path
-        except json.JSONDecodeError:
-            raise ValueError("Invalid JSON format in questions_db.json")
+        return path
     
     raise FileNotFoundError("Could not find questions_db.json")
+
+
+def get_cache_dir():
+    """Get the directory for data the bot can rebuild (scrape cache, compiled databases)
+
+    INTERVIEW_BOT_CACHE_DIR when set, otherwise interview_bot under
+    $XDG_CACHE_HOME or ~/.cache. When that cannot be created or written
+    to, a per-user directory under the system temp directory is used.
+    """
+    configured = os.environ.get('INTERVIEW_BOT_CACHE_DIR')
+    if configured:
+        candidates = [configured]
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        candidates = [os.path.join(base, 'interview_bot')]
+    user = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    candidates.append(os.path.join(tempfile.gettempdir(), f'interview_bot-{user}'))
+
+    for path in candidates:
+        try:
+            os.makedirs(path, exist_ok=True)
+            if os.access(path, os.W_OK):
+                return path
+        except OSError:
+            pass
+        print(f"Cache directory {path} is not writable")
+    return candidates[-1]
@@ -1,3 +1,32 @@
+from collections import Counter, defaultdict
+
+_numpy = None  # the numpy module once imported, False when it is not installed
+
+
+def _load_numpy():
+    """NumPy, imported on first use (it is slow to import); None without it.
+
+    NumPy is optional: without it batch scoring falls back to pure Python.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+# Names are compared as padded character trigrams
+NGRAM = 3
+_PAD = "\x00" * (NGRAM - 1)
+
+# Below this many candidates the per-pair loop beats building NumPy arrays
+BATCH_MIN_CANDIDATES = 64
+# Names up to this long fit one machine word in the bit-parallel batch path
+WORD_BITS = 64
+
+
 def levenshtein_distance(s1, s2):
     """Calculate the Levenshtein distance between two strings"""
     if len(s1) < len(s2):
@@ -18,37 +47,321 @@ def levenshtein_distance(s1, s2):
 
     return previous_row[-1]
 
+def bounded_levenshtein(s1, s2, max_distance):
+    """Levenshtein distance, or None as soon as it must exceed max_distance
+
+    Only the diagonal band of width 2*max_distance+1 is computed and the
+    loop stops early once every cell in a row is over the bound.
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    if len(s1) - len(s2) > max_distance:
+        return None
+    if len(s2) == 0:
+        return len(s1)
+
+    big = max_distance + 1
+    previous_row = [j if j <= max_distance else big for j in range(len(s2) + 1)]
+    for i, c1 in enumerate(s1, 1):
+        lo = max(1, i - max_distance)
+        hi = min(len(s2), i + max_distance)
+        current_row = [big] * (len(s2) + 1)
+        if i <= max_distance:
+            current_row[0] = i
+        row_min = current_row[0]
+        for j in range(lo, hi + 1):
+            cost = previous_row[j - 1] + (c1 != s2[j - 1])
+            if previous_row[j] + 1 < cost:
+                cost = previous_row[j] + 1
+            if current_row[j - 1] + 1 < cost:
+                cost = current_row[j - 1] + 1
+            current_row[j] = cost if cost < big else big
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_distance:
+            return None
+        previous_row = current_row
+
+    distance = previous_row[-1]
+    return distance if distance <= max_distance else None
+
+def encode_names(names):
+    """Pack names into a padded code-point matrix plus their lengths
+
+    Rows are WORD_BITS wide; padding cells hold -1, which never equals a
+    real code point. Longer names are truncated here and scored
+    separately by batch_levenshtein.
+    """
+    np = _load_numpy()
+    lengths = np.fromiter((len(name) for name in names), dtype=np.int64, count=len(names))
+    matrix = np.full((len(names), WORD_BITS), -1, dtype=np.int32)
+    for row, name in enumerate(names):
+        if name:
+            name = name[:WORD_BITS]
+            matrix[row, :len(name)] = np.frombuffer(name.encode('utf-32-le'), dtype=np.int32)
+    return matrix, lengths
+
+def batch_levenshtein(query, names, encoded=None):
+    """Levenshtein distance from `query` to every name at once
+
+    Uses the bit-parallel algorithm of Myers (global variant by Hyyro):
+    each name is a 64-bit vector of DP column deltas and every character
+    of the query updates all names with a handful of NumPy word
+    operations. Names longer than WORD_BITS fall back to
+    levenshtein_distance, as does everything when NumPy is missing.
+    Returns a list of ints.
+    """
+    np = _load_numpy()
+    if np is None:
+        return [levenshtein_distance(query, name) for name in names]
+    if encoded is None:
+        if not len(names):
+            return []
+        encoded = encode_names(names)
+    matrix, lengths = encoded
+
+    one = np.uint64(1)
+    # Bit of each name's last character; carries the running distance
+    last_bit = np.left_shift(one, (np.clip(lengths, 1, WORD_BITS) - 1).astype(np.uint64))
+    positive = np.full(len(lengths), ~np.uint64(0))
+    negative = np.zeros(len(lengths), dtype=np.uint64)
+    distances = lengths.copy()
+    char_masks = {}
+    for char in query:
+        match = char_masks.get(char)
+        if match is None:
+            # Bit j set where the name's j-th character equals `char`
+            match = char_masks[char] = np.packbits(
+                matrix == ord(char), axis=1, bitorder='little'
+            ).view('<u8').ravel()
+        vertical = match | negative
+        horizontal = (((match & positive) + positive) ^ positive) | match
+        plus = negative | ~(horizontal | positive)
+        minus = positive & horizontal
+        distances += (plus & last_bit) != 0
+        distances -= (minus & last_bit) != 0
+        plus = (plus << one) | one
+        minus = minus << one
+        positive = minus | ~(vertical | plus)
+        negative = plus & vertical
+
+    distances[lengths == 0] = len(query)
+    distances = distances.tolist()
+    if names is not None:
+        for row in np.flatnonzero(lengths > WORD_BITS):
+            distances[row] = levenshtein_distance(query, names[row])
+    return distances
+
+def _ngrams(text):
+    """Padded trigrams, numbered by occurrence so repeats count separately"""
+    padded = _PAD + text + _PAD
+    seen = Counter()
+    grams = []
+    for i in range(len(padded) - NGRAM + 1):
+        gram = padded[i:i + NGRAM]
+        seen[gram] += 1
+        grams.append((gram, seen[gram]))
+    return grams
+
+
+class CompanyIndex:
+    """Lookup structure for fuzzy company-name matching
+
+    Holds a casefolded exact-match map, a trigram index used to find
+    substring and near-miss candidates, and the names grouped by length.
+    Only candidates that share enough trigrams with the query to possibly
+    reach the similarity threshold are scored with the bounded
+    Levenshtein distance.
+    """
+
+    def __init__(self, names):
+        self.names = []
+        self.folded = []
+        self.exact = {}  # casefolded name -> id of its first occurrence
+        self.postings = defaultdict(list)  # (trigram, occurrence) -> name ids
+        self.by_length = defaultdict(list)
+        self._encoded = None
+        for name in names:
+            name_id = len(self.names)
+            folded = name.casefold()
+            self.names.append(name)
+            self.folded.append(folded)
+            self.exact.setdefault(folded, name_id)
+            self.by_length[len(folded)].append(name_id)
+            for gram in _ngrams(folded):
+                self.postings[gram].append(name_id)
+
+    def __len__(self):
+        return len(self.names)
+
+    def exact_match(self, query):
+        """Return the stored name equal to `query` ignoring case, or None"""
+        name_id = self.exact.get(query.casefold())
+        return None if name_id is None else self.names[name_id]
+
+    def _encode(self):
+        if self._encoded is None:
+            self._encoded = encode_names(self.folded)
+        return self._encoded
+
+    def _distances(self, query, name_ids):
+        """Edit distances from `query` to the given names, batched when worthwhile"""
+        np = _load_numpy() if len(name_ids) >= BATCH_MIN_CANDIDATES else None
+        if np is None:
+            return [levenshtein_distance(query, self.folded[i]) for i in name_ids]
+        matrix, lengths = self._encode()
+        rows = np.asarray(name_ids, dtype=np.intp)
+        return batch_levenshtein(query, [self.folded[i] for i in name_ids],
+                                 (matrix[rows], lengths[rows]))
+
+    def top_matches(self, query, k=5):
+        """Return the k most similar names as (name, similarity), best first
+
+        Every name is scored in one batch; ties keep insertion order.
+        """
+        query = query.casefold()
+        if not self.names or k <= 0:
+            return []
+        np = _load_numpy()
+        if np is None:
+            distances = [levenshtein_distance(query, name) for name in self.folded]
+            scored = []
+            for name_id, distance in enumerate(distances):
+                max_len = max(len(query), len(self.folded[name_id]))
+                if max_len:
+                    scored.append((1 - distance / max_len, name_id))
+            scored.sort(key=lambda item: (-item[0], item[1]))
+            return [(self.names[name_id], similarity) for similarity, name_id in scored[:k]]
+
+        matrix, lengths = self._encode()
+        distances = np.asarray(batch_levenshtein(query, self.folded, (matrix, lengths)))
+        max_lens = np.maximum(lengths, len(query))
+        valid = np.flatnonzero(max_lens > 0)
+        similarities = 1 - distances[valid] / max_lens[valid]
+        # Partial sort for the k best, then order those by score and insertion order
+        if len(valid) > k:
+            keep = np.argpartition(-similarities, k - 1)[:k]
+            # argpartition breaks ties arbitrarily: pull in every name tied with the k-th
+            keep = np.flatnonzero(similarities >= similarities[keep].min())
+        else:
+            keep = np.arange(len(valid))
+        order = keep[np.lexsort((valid[keep], -similarities[keep]))][:k]
+        return [(self.names[valid[i]], float(similarities[i])) for i in order]
+
+    def _shared_ngrams(self, query):
+        shared = Counter()
+        for gram in _ngrams(query):
+            shared.update(self.postings.get(gram, ()))
+        return shared
+
+    def substring_match(self, query):
+        """First name (in insertion order) containing or contained in `query`"""
+        query = query.casefold()
+        best = None
+        # Names contained in the query are substrings of it: look them up directly
+        for start in range(len(query)):
+            for end in range(start + 1, len(query) + 1):
+                name_id = self.exact.get(query[start:end])
+                if name_id is not None:
+                    if best is None or name_id < best:
+                        best = name_id
+        # Names containing the query must contain every inner trigram of it
+        if len(query) >= NGRAM:
+            inner = Counter(query[i:i + NGRAM] for i in range(len(query) - NGRAM + 1))
+            candidates = None
+            for gram, count in inner.items():
+                ids = set(self.postings.get((gram, count), ()))
+                candidates = ids if candidates is None else candidates & ids
+                if not candidates:
+                    break
+            candidates = candidates or ()
+        else:
+            candidates = range(len(self.names))
+        for name_id in sorted(candidates):
+            if best is not None and name_id >= best:
+                break
+            if query in self.folded[name_id]:
+                best = name_id
+                break
+        return None if best is None else self.names[best]
+
+    def fuzzy_match(self, query, threshold=0.7):
+        """Best (name, similarity) by normalized edit distance, or (None, best_score)
+
+        A name of length L can only reach the threshold with at most
+        k = (1 - threshold) * max(len(query), L) edits, and k edits destroy
+        at most k * NGRAM padded trigrams, which gives a lower bound on the
+        trigrams it must share with the query.
+        """
+        query = query.casefold()
+        if not query:
+            return None, 0
+
+        bounds = {}  # name length -> (max_distance, min_shared), or None if out of reach
+        for length in self.by_length:
+            max_len = max(len(query), length)
+            max_distance = int((1 - threshold) * max_len + 1e-9)
+            if abs(length - len(query)) <= max_distance:
+                bounds[length] = (max_distance, max_len + NGRAM - 1 - NGRAM * max_distance)
+
+        # Names sharing trigrams with the query, plus whole length buckets
+        # where the bound is too weak to rule out names sharing none
+        shared = self._shared_ngrams(query)
+        candidates = [name_id for name_id, count in shared.items()
+                      if len(self.folded[name_id]) in bounds
+                      and count >= bounds[len(self.folded[name_id])][1]]
+        for length, (_, min_shared) in bounds.items():
+            if min_shared <= 0:
+                candidates.extend(i for i in self.by_length[length] if i not in shared)
+
+        candidates.sort()
+        if len(candidates) >= BATCH_MIN_CANDIDATES and _load_numpy() is not None:
+            # Weak bounds left many candidates: score them in one vectorized pass
+            distances = self._distances(query, candidates)
+        else:
+            distances = [bounded_levenshtein(query, self.folded[i], bounds[len(self.folded[i])][0])
+                         for i in candidates]
+
+        best_id, best_score = None, 0
+        for name_id, distance in zip(candidates, distances):
+            name = self.folded[name_id]
+            if distance is None or distance > bounds[len(name)][0]:
+                continue
+            similarity = 1 - (distance / max(len(query), len(name)))
+            if similarity > best_score:
+                best_id, best_score = name_id, similarity
+        if best_id is not None and best_score >= threshold:
+            return self.names[best_id], best_score
+        return None, best_score
+
+    def find_closest_match(self, input_str, threshold=0.7):
+        """Same contract as the module-level find_closest_match"""
+        exact = self.exact_match(input_str)
+        if exact is not None:
+            return exact, 1.0
+        match = self.substring_match(input_str)
+        if match is not None:
+            return match, 0.9
+        return self.fuzzy_match(input_str, threshold)
+
+
+_index_cache = {}
+
+def get_company_index(valid_strings):
+    """Return a CompanyIndex for these names, reusing one built earlier"""
+    key = tuple(valid_strings)
+    index = _index_cache.get(key)
+    if index is None:
+        if len(_index_cache) >= 8:
+            _index_cache.clear()
+        index = _index_cache[key] = CompanyIndex(key)
+    return index
+
 def find_closest_match(input_str, valid_strings, threshold=0.7):
     """Find the closest matching string from a list of valid strings
     Returns (best_match, similarity_score)"""
-    input_str = input_str.lower()
-    
-    # First try exact match after normalization
-    for valid in valid_strings:
-        if valid.lower() == input_str:
-            return valid, 1.0
-            
-    # Direct substring match
-    matches = [v for v in valid_strings if input_str in v.lower() or v.lower() in input_str]
-    if matches:
-        return matches[0], 0.9
-        
-    # Try fuzzy matching
-    best_match = None
-    best_score = 0
-    
-    for valid in valid_strings:
-        # Calculate normalized similarity score
-        max_len = max(len(input_str), len(valid.lower()))
-        if max_len == 0:
-            continue
-        distance = levenshtein_distance(input_str, valid.lower())
-        similarity = 1 - (distance / max_len)
-        
-        if similarity > best_score:
-            best_score = similarity
-            best_match = valid
-    
-    if best_score >= threshold:
-        return best_match, best_score
-    return None, best_score
\ No newline at end of file
+    return get_company_index(valid_strings).find_closest_match(input_str, threshold)
+
+def find_top_matches(input_str, valid_strings, k=5):
+    """Return the k most similar strings as [(match, similarity_score)], best first"""
+    return get_company_index(valid_strings).top_matches(input_str, k)
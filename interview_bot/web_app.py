@@ -1,5 +1,7 @@
 from flask import Flask, render_template, request, jsonify
 from interview_bot import InterviewBot
+from pagination import DEFAULT_PAGE_SIZE
+from renderer import MODES
 import os
 
 app = Flask(__name__)
@@ -13,19 +15,29 @@ def home():
 def chat():
     data = request.json
     user_message = data.get('message', '')
+    # Question lists are paged: send back a reply's next_cursor with the same message
+    cursor = data.get('cursor')
+    page_size = data.get('page_size', DEFAULT_PAGE_SIZE)
+    # Question lists can be rendered as 'text' (default), 'markdown', 'html' or 'json'
+    output_format = data.get('format', 'text')
+    if output_format not in MODES:
+        return jsonify({'error': f"Unknown format: {output_format}"}), 400
     
     try:
         # Process the message using our existing bot logic
-        response = process_message(user_message)
+        response = process_message(user_message, cursor, page_size, output_format)
         return jsonify({'response': response})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-def process_message(message):
+def process_message(message, cursor=None, page_size=DEFAULT_PAGE_SIZE, output_format='text'):
     message = message.lower().strip()
+    # Shared with the CLI chat through the question store
+    parsed = bot.get_message_parser().parse(message)
+    intent = parsed.intent(['greeting', 'company_questions', 'categories', 'companies', 'help'])
     
     # Initial greeting
-    if any(greeting in message for greeting in ['hi', 'hello', 'hey']):
+    if intent == 'greeting':
         return {
             "type": "text",
             "content": (
@@ -39,25 +51,24 @@ def process_message(message):
         }
     
     # Company specific questions
-    elif "questions" in message and any(company.lower() in message for company in bot.get_available_companies()):
-        company = next(c for c in bot.get_available_companies() if c.lower() in message.lower())
+    elif intent == 'company_questions':
+        # Experience mentioned in the message, if any
+        experience = parsed.years or "2"  # default
         
-        # Try to extract experience from message
-        experience = "2"  # default
-        for word in message.split():
-            if word.replace('.', '').isdigit():
-                experience = word
-        
-        response = bot.get_interview_questions(company, experience)
-        formatted = bot.format_response(response)
+        response = bot.get_interview_questions_page(
+            parsed.company, experience, cursor=cursor, page_size=page_size
+        )
+        formatted = bot.format_response(response, output_format)
         
         return {
             "type": "questions",
-            "content": formatted
+            "content": formatted,
+            "total": response.get("total"),
+            "next_cursor": response.get("next_cursor")
         }
     
     # Show categories
-    elif "categories" in message or "topics" in message:
+    elif intent == 'categories':
         categories = bot.get_categories()
         response = "Here are the available categories and their topics:\n\n"
         for category, topics in categories.items():
@@ -71,7 +82,7 @@ def process_message(message):
         }
     
     # Show companies
-    elif "companies" in message:
+    elif intent == 'companies':
         companies = bot.get_available_companies()
         response = "Here are the companies I have questions for:\n\n"
         response += "\n".join(f"- {company}" for company in companies)
@@ -82,7 +93,7 @@ def process_message(message):
         }
     
     # Help message
-    elif "help" in message:
+    elif intent == 'help':
         return {
             "type": "help",
             "content": (
@@ -1,13 +1,390 @@
-import requests
-from bs4 import BeautifulSoup
-import time
 import random
 from urllib.parse import quote
+from .scrape_cache import get_scrape_cache, EMPTY_TTL
+from .scrape_engine import get_engine
+from .dedup import NearDuplicateDetector, NEAR_DUPLICATE_THRESHOLD
+# requests, bs4 and lxml are only imported once a page is actually fetched
+from .scraping_stack import scraping_stack
 
-def search_interview_questions(company_name, role="automation tester", category="selenium", max_questions=50):
-    """Search for interview questions online"""
-    print(f"Searching questions for company: {company_name}")
-    
+WEB_CACHE_NAMESPACE = 'web_search'
+WEB_CACHE_TTL = 24 * 60 * 60  # Scraped questions are refreshed daily
+WEB_EMPTY_TTL = EMPTY_TTL  # A search that found nothing (or failed everywhere) is retried after a minute
+
+GOOGLE_PLATFORMS = {
+    'glassdoor.com': 'Glassdoor',
+    'geeksforgeeks.org': 'GeeksforGeeks',
+    'ambitionbox.com': 'AmbitionBox',
+    'linkedin.com': 'LinkedIn',
+    'naukri.com': 'Naukri',
+    'indeed.com': 'Indeed',
+    'interviewbit.com': 'InterviewBit',
+    'careercup.com': 'CareerCup',
+    'leetcode.com': 'LeetCode'
+}
+
+
+# Multi-platform scrapers. Each function fetches a single page so the scrape
+# engine can run every query of every source concurrently. They return the
+# page's questions, or None when the page could not be fetched or parsed
+# (offline, blocked, timed out), so a failed job is never mistaken for a
+# page without questions.
+
+def google_search_queries(company, role, category):
+    """Different search queries to get varied results, based on category"""
+    if category.lower() == "java coding":
+        search_queries = [
+            f"{company} java coding interview questions",
+            f"{company} java programming interview",
+            f"{company} java algorithms data structures interview",
+            f"{company} java collections interview questions",
+            f"{company} java coding problems interview",
+            f"{company} core java interview coding questions"
+        ]
+    else:
+        search_queries = [
+            f"{company} {role} interview questions {category}",
+            f"{company} automation testing interview experience",
+            f"{company} selenium webdriver interview questions",
+            f"{company} technical interview questions testing",
+            f"{company} software tester interview questions",
+            f"{company} QA automation interview experience"
+        ]
+    return search_queries[:3]  # Limit to 3 queries to avoid rate limiting
+
+
+def search_google_for_questions(query, company, category):
+    """Search Google for interview questions from multiple sources"""
+    all_questions = []
+    try:
+        # Use Google search to find relevant pages
+        search_url = f"https://www.google.com/search?q={quote(query)}"
+        # Extract search results (top 10), reused as long as the page is unchanged
+        http_client, page_parser = scraping_stack()
+        search_results = http_client.get_http_client().get_parsed(
+            search_url, 'google_results',
+            lambda html: page_parser.extract(html, page_parser.GOOGLE_RESULTS._replace(limit=10))
+        )
+
+        if search_results is None:
+            return None
+
+        for result in search_results:
+            try:
+                url = result['link']
+                if url is not None:
+                    title_text = result['title']
+
+                    if title_text is not None:
+                        # Check if URL is from known platforms
+                        source = "Web Search"
+                        for platform, platform_name in GOOGLE_PLATFORMS.items():
+                            if platform in url:
+                                source = platform_name
+                                break
+
+                        # Extract potential questions from title/snippet
+                        if any(keyword in title_text.lower() for keyword in ['interview', 'question', 'experience']):
+                            all_questions.append({
+                                "question": title_text,
+                                "source": source,
+                                "url": url,
+                                "company": company,
+                                "category": category,
+                                "difficulty": "Medium",
+                                "type": "Technical"
+                            })
+            except Exception as e:
+                continue
+    except Exception as e:
+        print(f"Error in Google search: {str(e)}")
+        return None
+
+    return all_questions
+
+
+def scrape_glassdoor(term, company, category):
+    """Enhanced Glassdoor scraping"""
+    questions = []
+    # Keywords based on category
+    if category.lower() == "java coding":
+        relevant_keywords = ['java', 'coding', 'programming', 'algorithm', 'data structure', 'array', 'string', 'hashmap', 'collection']
+    else:
+        relevant_keywords = ['selenium', 'automation', 'testing', 'framework', 'webdriver']
+
+    try:
+        # Search Glassdoor interview section
+        search_url = f"https://www.glassdoor.com/Interview/jobs.htm?suggestCount=0&suggestChosen=false&clickSource=searchBtn&typedKeyword={quote(term)}&sc.keyword={quote(term)}"
+        # Question texts from the interview question elements (several selectors)
+        http_client, page_parser = scraping_stack()
+        question_texts = http_client.get_http_client().get_parsed(
+            search_url, 'glassdoor_questions', lambda html: page_parser.extract(html, page_parser.GLASSDOOR_QUESTIONS)
+        )
+
+        if question_texts is None:
+            return None
+
+        for question_text in question_texts:
+            if len(question_text) > 10 and any(keyword in question_text.lower() for keyword in relevant_keywords):
+                questions.append({
+                    "question": question_text,
+                    "source": "Glassdoor",
+                    "company": company,
+                    "category": "Selenium",
+                    "difficulty": "Medium",
+                    "type": "Technical"
+                })
+    except Exception as e:
+        print(f"Error scraping Glassdoor for {term}: {str(e)}")
+        return None
+
+    return questions
+
+
+def scrape_geeksforgeeks(url, company):
+    """Enhanced GeeksforGeeks scraping"""
+    questions = []
+    try:
+        # Look for article titles and content
+        http_client, page_parser = scraping_stack()
+        texts = http_client.get_http_client().get_parsed(
+            url, 'geeksforgeeks_text', lambda html: page_parser.extract(html, page_parser.GEEKSFORGEEKS_TEXT)
+        )
+        if texts is None:
+            return None
+
+        for text in texts:
+            # Check if it's a question (contains question words)
+            if ('?' in text or any(starter in text.lower() for starter in ['what is', 'how do', 'explain', 'describe', 'why', 'when'])) and len(text) > 20:
+                if any(keyword in text.lower() for keyword in ['selenium', 'automation', 'testing', 'webdriver', 'framework']):
+                    questions.append({
+                        "question": text,
+                        "source": "GeeksforGeeks",
+                        "company": company,
+                        "category": "Selenium",
+                        "difficulty": "Medium",
+                        "type": "Technical"
+                    })
+    except Exception as e:
+        print(f"Error scraping GeeksforGeeks: {str(e)}")
+        return None
+
+    return questions
+
+
+def scrape_ambitionbox(company):
+    """Scrape AmbitionBox for interview questions"""
+    questions = []
+    try:
+        search_url = f"https://www.ambitionbox.com/search?q={quote(company)}"
+        # Look for interview-related content
+        http_client, page_parser = scraping_stack()
+        texts = http_client.get_http_client().get_parsed(
+            search_url, 'ambitionbox_content', lambda html: page_parser.extract(html, page_parser.AMBITIONBOX_CONTENT)
+        )
+
+        if texts is None:
+            return None
+
+        for text in texts:
+            if len(text) > 15 and any(keyword in text.lower() for keyword in ['selenium', 'automation', 'testing']):
+                questions.append({
+                    "question": text,
+                    "source": "AmbitionBox",
+                    "company": company,
+                    "category": "Selenium",
+                    "difficulty": "Medium",
+                    "type": "Technical"
+                })
+    except Exception as e:
+        print(f"Error scraping AmbitionBox: {str(e)}")
+        return None
+
+    return questions
+
+
+def scrape_job_portal(domain, source_name, company):
+    """Scrape a job portal (via Google site search) for interview insights"""
+    questions = []
+    try:
+        search_url = f"https://www.google.com/search?q=site:{domain} {quote(company)} interview questions automation testing"
+        # Extract search result titles and snippets (top 5 per portal)
+        http_client, page_parser = scraping_stack()
+        results = http_client.get_http_client().get_parsed(
+            search_url, 'portal_results',
+            lambda html: page_parser.extract(html, page_parser.GOOGLE_RESULTS._replace(limit=5))
+        )
+
+        if results is None:
+            return None
+
+        for result in results:
+            try:
+                if result['title'] is not None:
+                    title = result['title']
+                    snippet = result['snippet'] or ""
+
+                    combined_text = f"{title}. {snippet}"
+
+                    if any(keyword in combined_text.lower() for keyword in ['interview', 'question', 'selenium', 'automation']):
+                        questions.append({
+                            "question": combined_text[:200] + "..." if len(combined_text) > 200 else combined_text,
+                            "source": source_name,
+                            "company": company,
+                            "category": "Selenium",
+                            "difficulty": "Medium",
+                            "type": "Technical"
+                        })
+            except Exception as e:
+                continue
+    except Exception as e:
+        print(f"Error searching {source_name}: {str(e)}")
+        return None
+
+    return questions
+
+
+def build_scrape_jobs(company, role, category):
+    """Expand every source into one (source, func, args) job per page fetch"""
+    jobs = []
+
+    # 1. Google Search for questions from multiple platforms
+    for query in google_search_queries(company, role, category):
+        jobs.append(("Google search", search_google_for_questions, (query, company, category)))
+
+    # 2. Glassdoor scraping
+    search_terms = [company, f"{company} automation", f"{company} selenium", f"{company} testing"]
+    for term in search_terms[:2]:  # Limit searches
+        jobs.append(("Glassdoor", scrape_glassdoor, (term, company, category)))
+
+    # 3. GeeksforGeeks scraping
+    for url in [
+        f"https://www.geeksforgeeks.org/?s={quote(company + ' interview')}",
+        f"https://www.geeksforgeeks.org/tag/{company.lower()}-interview-experience/",
+        f"https://www.geeksforgeeks.org/?s={quote(company + ' automation testing')}"
+    ]:
+        jobs.append(("GeeksforGeeks", scrape_geeksforgeeks, (url, company)))
+
+    # 4. AmbitionBox scraping
+    jobs.append(("AmbitionBox", scrape_ambitionbox, (company,)))
+
+    # 5. Naukri and Indeed search
+    for domain, source_name in [('naukri.com', 'Naukri'), ('indeed.com', 'Indeed')]:
+        jobs.append(("job portals", scrape_job_portal, (domain, source_name, company)))
+
+    return jobs
+
+
+def web_cache_key(company, role, category):
+    """Normalized cache and single-flight key for one company/role/category search"""
+    return "|".join(" ".join(part.split()).lower() for part in (company, role, category))
+
+
+def web_results_stamp(company, role, category):
+    """When the cached web results for a search last changed (None if not cached)"""
+    return get_scrape_cache().stamp(WEB_CACHE_NAMESPACE, web_cache_key(company, role, category))
+
+
+def _store_web_results(cache, key, job_results):
+    """Cache a search's merged results.
+
+    Only a search that found questions is kept for WEB_CACHE_TTL. When every
+    job failed or none found anything, existing results are left in place
+    (still stale, so the next lookup retries) and a missing entry is only
+    cached as empty for WEB_EMPTY_TTL.
+    """
+    succeeded = [found for _, found in job_results if found is not None]
+    merged = [q for found in succeeded for q in found]
+    if merged:
+        cache.set(WEB_CACHE_NAMESPACE, key, merged, ttl=WEB_CACHE_TTL)
+        return
+    if succeeded:
+        print(f"🔍 No web questions found for {key}")
+    else:
+        print(f"⚠️ Every web source failed for {key}")
+    entry = cache.get(WEB_CACHE_NAMESPACE, key)
+    if entry is None or not entry.value:
+        cache.set(WEB_CACHE_NAMESPACE, key, [], ttl=WEB_EMPTY_TTL)
+
+
+def iter_scraped_questions(company, role, category, deadline_ms=None):
+    """Yield scraped questions for a company, from cache when possible.
+
+    Cached results (fresh or stale) come back immediately; stale ones are
+    re-scraped in the background. On a miss every source is scraped
+    concurrently and each page's questions are yielded as soon as it has
+    been parsed. With `deadline_ms`, iteration stops once the budget is
+    spent; the remaining jobs keep running and the full result set is
+    cached once they finish, ready for the next request. Concurrent
+    searches with the same normalized key share one set of scrape jobs.
+    """
+    cache = get_scrape_cache()
+    key = web_cache_key(company, role, category)
+
+    def store(job_results):
+        _store_web_results(cache, key, job_results)
+
+    def rescrape():
+        # Stores its own results (returning None), so a failed refresh never replaces good ones
+        store(list(get_engine().run(build_scrape_jobs(company, role, category), key=key)))
+
+    entry = cache.get(WEB_CACHE_NAMESPACE, key)
+    if entry is not None:
+        if entry.is_stale:
+            cache.refresh_in_background(WEB_CACHE_NAMESPACE, key, rescrape, ttl=WEB_CACHE_TTL)
+        print(f"📦 Using {len(entry.value)} cached web questions for {company}")
+        yield from entry.value
+        return
+
+    # Identical searches running at the same time share one scrape
+    timeout = None if deadline_ms is None else max(deadline_ms, 0) / 1000
+    for source, found in get_engine().run(build_scrape_jobs(company, role, category),
+                                          timeout=timeout, on_complete=store, key=key):
+        if found:
+            print(f"✅ Found {len(found)} questions from {source}")
+            yield from found
+
+
+def iter_interview_questions(company_name, role="automation tester", category="selenium", deadline_ms=None,
+                             dedup_threshold=NEAR_DUPLICATE_THRESHOLD):
+    """Yield interview questions one at a time as their source page is parsed.
+
+    Scraped questions stream out in completion order and are deduplicated on
+    the fly: rewordings whose word shingles overlap by at least
+    `dedup_threshold` (Jaccard) are dropped along with exact repeats. The
+    generated templates follow once scraping is done, marked as
+    "Generated Template" when no source returned anything.
+    """
+    print(f"🔍 Starting comprehensive search for {company_name} interview questions...")
+    duplicates = NearDuplicateDetector(dedup_threshold)
+
+    def is_new(q):
+        # Remove duplicates and near-duplicates based on question text
+        question_text = q.get('question', '').strip()
+        if len(question_text) <= 10:
+            return False
+        return duplicates.add(question_text)
+
+    real_count = 0
+    for q in iter_scraped_questions(company_name, role, category, deadline_ms=deadline_ms):
+        real_count += 1
+        if is_new(q):
+            yield q
+
+    if real_count:
+        print(f"🎉 Total found: {real_count} real questions from online sources!")
+    else:
+        print("⚠️ No real questions found from online sources, using enhanced templates")
+
+    for q in build_template_questions(company_name, role, category):
+        if not real_count:
+            # Mark template questions clearly
+            q["source"] = "Generated Template"
+        if is_new(q):
+            yield q
+
+
+def build_template_questions(company_name, role="automation tester", category="selenium"):
+    """Generated questions that are always offered alongside scraped ones"""
     # Company-specific questions template
     company_questions = [
         {
@@ -200,10 +577,6 @@ def search_interview_questions(company_name, role="automation tester", category=
                 "type": "Technical"
             }
         ]
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
 
         # Add Java coding questions if category matches
         if category.lower() == "java coding":
@@ -225,324 +598,26 @@ def search_interview_questions(company_name, role="automation tester", category=
             }
             questions.append(question)
 
-        # Enhanced multi-platform search functions
-        def search_google_for_questions(company, role, category):
-            """Search Google for interview questions from multiple sources"""
-            all_questions = []
-            
-            # Different search queries to get varied results
-            # Dynamic search queries based on category
-            if category.lower() == "java coding":
-                search_queries = [
-                    f"{company} java coding interview questions",
-                    f"{company} java programming interview",
-                    f"{company} java algorithms data structures interview",
-                    f"{company} java collections interview questions",
-                    f"{company} java coding problems interview",
-                    f"{company} core java interview coding questions"
-                ]
-            else:
-                search_queries = [
-                    f"{company} {role} interview questions {category}",
-                    f"{company} automation testing interview experience",
-                    f"{company} selenium webdriver interview questions",
-                    f"{company} technical interview questions testing",
-                    f"{company} software tester interview questions",
-                    f"{company} QA automation interview experience"
-                ]
-            
-            platforms = {
-                'glassdoor.com': 'Glassdoor',
-                'geeksforgeeks.org': 'GeeksforGeeks', 
-                'ambitionbox.com': 'AmbitionBox',
-                'linkedin.com': 'LinkedIn',
-                'naukri.com': 'Naukri',
-                'indeed.com': 'Indeed',
-                'interviewbit.com': 'InterviewBit',
-                'careercup.com': 'CareerCup',
-                'leetcode.com': 'LeetCode'
-            }
-            
-            for query in search_queries[:3]:  # Limit to 3 queries to avoid rate limiting
-                try:
-                    # Use Google search to find relevant pages
-                    search_url = f"https://www.google.com/search?q={quote(query)}"
-                    response = requests.get(search_url, headers=headers, timeout=10)
-                    
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # Extract search results
-                        search_results = soup.find_all('div', {'class': 'g'})[:10]  # Top 10 results
-                        
-                        for result in search_results:
-                            try:
-                                link_element = result.find('a')
-                                if link_element and 'href' in link_element.attrs:
-                                    url = link_element['href']
-                                    title = result.find('h3')
-                                    
-                                    if title:
-                                        title_text = title.get_text(strip=True)
-                                        
-                                        # Check if URL is from known platforms
-                                        source = "Web Search"
-                                        for platform, platform_name in platforms.items():
-                                            if platform in url:
-                                                source = platform_name
-                                                break
-                                        
-                                        # Extract potential questions from title/snippet
-                                        if any(keyword in title_text.lower() for keyword in ['interview', 'question', 'experience']):
-                                            all_questions.append({
-                                                "question": title_text,
-                                                "source": source,
-                                                "url": url,
-                                                "company": company,
-                                                "category": category,
-                                                "difficulty": "Medium",
-                                                "type": "Technical"
-                                            })
-                            except Exception as e:
-                                continue
-                    
-                    time.sleep(1)  # Rate limiting
-                except Exception as e:
-                    print(f"Error in Google search: {str(e)}")
-                    continue
-            
-            return all_questions
-
-        def scrape_glassdoor(company):
-            """Enhanced Glassdoor scraping"""
-            questions = []
-            search_terms = [company, f"{company} automation", f"{company} selenium", f"{company} testing"]
-            
-            for term in search_terms[:2]:  # Limit searches
-                try:
-                    # Search Glassdoor interview section
-                    search_url = f"https://www.glassdoor.com/Interview/jobs.htm?suggestCount=0&suggestChosen=false&clickSource=searchBtn&typedKeyword={quote(term)}&sc.keyword={quote(term)}"
-                    response = requests.get(search_url, headers=headers, timeout=10)
-                    
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # Look for interview question elements with various selectors
-                        question_selectors = [
-                            '.questionText',
-                            '[data-test="interview-question"]',
-                            '.interviewQuestion',
-                            '.question-text'
-                        ]
-                        
-                        for selector in question_selectors:
-                            elements = soup.select(selector)
-                            for element in elements:
-                                question_text = element.get_text(strip=True)
-                                # Keywords based on category
-                            if category.lower() == "java coding":
-                                relevant_keywords = ['java', 'coding', 'programming', 'algorithm', 'data structure', 'array', 'string', 'hashmap', 'collection']
-                            else:
-                                relevant_keywords = ['selenium', 'automation', 'testing', 'framework', 'webdriver']
-                            
-                            if len(question_text) > 10 and any(keyword in question_text.lower() for keyword in relevant_keywords):
-                                    questions.append({
-                                        "question": question_text,
-                                        "source": "Glassdoor",
-                                        "company": company,
-                                        "category": "Selenium",
-                                        "difficulty": "Medium",
-                                        "type": "Technical"
-                                    })
-                    
-                    time.sleep(2)  # Rate limiting
-                except Exception as e:
-                    print(f"Error scraping Glassdoor for {term}: {str(e)}")
-                    continue
-            
-            return questions
-
-        def scrape_geeksforgeeks(company):
-            """Enhanced GeeksforGeeks scraping"""
-            questions = []
-            search_urls = [
-                f"https://www.geeksforgeeks.org/?s={quote(company + ' interview')}",
-                f"https://www.geeksforgeeks.org/tag/{company.lower()}-interview-experience/",
-                f"https://www.geeksforgeeks.org/?s={quote(company + ' automation testing')}"
-            ]
-            
-            for url in search_urls:
-                try:
-                    response = requests.get(url, headers=headers, timeout=10)
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # Look for article titles and content
-                        article_elements = soup.find_all(['h2', 'h3', 'h4', 'p', 'li'])
-                        
-                        for element in article_elements:
-                            text = element.get_text(strip=True)
-                            
-                            # Check if it's a question (contains question words)
-                            if ('?' in text or any(starter in text.lower() for starter in ['what is', 'how do', 'explain', 'describe', 'why', 'when'])) and len(text) > 20:
-                                if any(keyword in text.lower() for keyword in ['selenium', 'automation', 'testing', 'webdriver', 'framework']):
-                                    questions.append({
-                                        "question": text,
-                                        "source": "GeeksforGeeks",
-                                        "company": company,
-                                        "category": "Selenium",
-                                        "difficulty": "Medium",
-                                        "type": "Technical"
-                                    })
-                    
-                    time.sleep(1)
-                except Exception as e:
-                    print(f"Error scraping GeeksforGeeks: {str(e)}")
-                    continue
-            
-            return questions
-
-        def scrape_ambitionbox(company):
-            """Scrape AmbitionBox for interview questions"""
-            questions = []
-            try:
-                search_url = f"https://www.ambitionbox.com/search?q={quote(company)}"
-                response = requests.get(search_url, headers=headers, timeout=10)
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # Look for interview-related content
-                    content_elements = soup.find_all(['div', 'p', 'span'], class_=lambda x: x and ('interview' in x.lower() or 'question' in x.lower()))
-                    
-                    for element in content_elements:
-                        text = element.get_text(strip=True)
-                        if len(text) > 15 and any(keyword in text.lower() for keyword in ['selenium', 'automation', 'testing']):
-                            questions.append({
-                                "question": text,
-                                "source": "AmbitionBox",
-                                "company": company,
-                                "category": "Selenium",
-                                "difficulty": "Medium",
-                                "type": "Technical"
-                            })
-            except Exception as e:
-                print(f"Error scraping AmbitionBox: {str(e)}")
-            
-            return questions
-
-        def scrape_naukri_indeed(company):
-            """Scrape job portals for interview insights"""
-            questions = []
-            portals = [
-                ('naukri.com', 'Naukri'),
-                ('indeed.com', 'Indeed')
-            ]
-            
-            for domain, source_name in portals:
-                try:
-                    search_url = f"https://www.google.com/search?q=site:{domain} {quote(company)} interview questions automation testing"
-                    response = requests.get(search_url, headers=headers, timeout=10)
-                    
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # Extract search result titles and snippets
-                        results = soup.find_all('div', {'class': 'g'})
-                        
-                        for result in results[:5]:  # Top 5 results per portal
-                            try:
-                                title_elem = result.find('h3')
-                                snippet_elem = result.find('span', {'class': 'st'}) or result.find('div', {'class': 'VwiC3b'})
-                                
-                                if title_elem:
-                                    title = title_elem.get_text(strip=True)
-                                    snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
-                                    
-                                    combined_text = f"{title}. {snippet}"
-                                    
-                                    if any(keyword in combined_text.lower() for keyword in ['interview', 'question', 'selenium', 'automation']):
-                                        questions.append({
-                                            "question": combined_text[:200] + "..." if len(combined_text) > 200 else combined_text,
-                                            "source": source_name,
-                                            "company": company,
-                                            "category": "Selenium",
-                                            "difficulty": "Medium",
-                                            "type": "Technical"
-                                        })
-                            except Exception as e:
-                                continue
-                    
-                    time.sleep(1)
-                except Exception as e:
-                    print(f"Error searching {source_name}: {str(e)}")
-                    continue
-            
-            return questions
-
-        # Enhanced multi-platform search - Get questions from ALL sources
-        print(f"🔍 Starting comprehensive search for {company_name} interview questions...")
-        all_real_questions = []
-        
-        # 1. Google Search for questions from multiple platforms
-        print("🌐 Searching Google for interview questions...")
-        google_questions = search_google_for_questions(company_name, role, category)
-        if google_questions:
-            all_real_questions.extend(google_questions)
-            print(f"✅ Found {len(google_questions)} questions from Google search")
-
-        # 2. Glassdoor scraping
-        print("💼 Scraping Glassdoor...")
-        glassdoor_questions = scrape_glassdoor(company_name)
-        if glassdoor_questions:
-            all_real_questions.extend(glassdoor_questions)
-            print(f"✅ Found {len(glassdoor_questions)} questions from Glassdoor")
-
-        # 3. GeeksforGeeks scraping
-        print("🎓 Scraping GeeksforGeeks...")
-        geeksforgeeks_questions = scrape_geeksforgeeks(company_name)
-        if geeksforgeeks_questions:
-            all_real_questions.extend(geeksforgeeks_questions)
-            print(f"✅ Found {len(geeksforgeeks_questions)} questions from GeeksforGeeks")
-
-        # 4. AmbitionBox scraping
-        print("💡 Scraping AmbitionBox...")
-        ambitionbox_questions = scrape_ambitionbox(company_name)
-        if ambitionbox_questions:
-            all_real_questions.extend(ambitionbox_questions)
-            print(f"✅ Found {len(ambitionbox_questions)} questions from AmbitionBox")
-
-        # 5. Naukri and Indeed search
-        print("🔍 Searching job portals...")
-        portal_questions = scrape_naukri_indeed(company_name)
-        if portal_questions:
-            all_real_questions.extend(portal_questions)
-            print(f"✅ Found {len(portal_questions)} questions from job portals")
-
-        # Add all real questions found
-        if all_real_questions:
-            print(f"🎉 Total found: {len(all_real_questions)} real questions from online sources!")
-            questions.extend(all_real_questions)
-            
-            # Remove duplicates based on question text
-            seen_questions = set()
-            unique_questions = []
-            for q in questions:
-                question_text = q.get('question', '').lower().strip()
-                if question_text not in seen_questions and len(question_text) > 10:
-                    seen_questions.add(question_text)
-                    unique_questions.append(q)
-            
-            questions = unique_questions
-            print(f"📋 After removing duplicates: {len(questions)} unique questions")
-        else:
-            print("⚠️ No real questions found from online sources, using enhanced templates")
-            # Mark template questions clearly
-            for q in questions:
-                q["source"] = "Generated Template"
+        return questions
+    except Exception as e:
+        print(f"Error building template questions: {str(e)}")
+        return []
 
 
+def search_interview_questions(company_name, role="automation tester", category="selenium", max_questions=50,
+                               deadline_ms=None, dedup_threshold=NEAR_DUPLICATE_THRESHOLD):
+    """Search for interview questions online.
+
+    `deadline_ms` bounds how long to wait for the scrapers; see
+    iter_scraped_questions. Use iter_interview_questions to consume results
+    as they arrive instead of waiting for the full list.
+    """
+    print(f"Searching questions for company: {company_name}")
+    try:
+        questions = list(iter_interview_questions(company_name, role, category, deadline_ms=deadline_ms,
+                                                  dedup_threshold=dedup_threshold))
+        print(f"📋 After removing duplicates: {len(questions)} unique questions")
         return questions
     except Exception as e:
         print(f"Error in search: {str(e)}")
-        return []
\ No newline at end of file
+        return []
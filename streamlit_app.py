@@ -1,7 +1,14 @@
 import streamlit as st
 from interview_bot.bot import InterviewBot
+from interview_bot.pagination import encode_cursor, snapshot_id
 import os
 
+# Latency budget for live web results; slower sources finish in the
+# background and are served from cache on the next search
+WEB_SEARCH_DEADLINE_MS = 3000
+# Questions rendered per page; only the current page is ever drawn
+PAGE_SIZE = 10
+
 # Initialize bot
 if 'bot' not in st.session_state:
     st.session_state.bot = InterviewBot()
@@ -68,87 +75,127 @@ with col2:
         help="Choose the difficulty level of questions"
     )
 
+# Source icons shown next to each question
+SOURCE_ICONS = {
+    'Glassdoor': '💼',
+    'GeeksforGeeks': '🎓', 
+    'AmbitionBox': '💡',
+    'LinkedIn': '💼',
+    'Naukri': '🔍',
+    'Indeed': '🔍',
+    'InterviewBit': '💻',
+    'CareerCup': '👨‍💻',
+    'LeetCode': '🧮',
+    'Web Search': '🌐',
+    'Generated Template': '🤖'
+}
+
+def render_question(i, q):
+    """Render one question as an expander with its source and metadata"""
+    source = q.get('source', 'Generated')
+    icon = SOURCE_ICONS.get(source, '📝')
+    
+    with st.expander(f"Question #{i}: {q.get('question', '')[:80]}... {icon}"):
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            st.markdown(f"**{icon} Source:** {source}")
+            if q.get('url'):
+                st.markdown(f"**🔗 URL:** [View Source]({q.get('url')})")
+        
+        with col2:
+            st.markdown(f"**📂 Category:** {q.get('category', 'General')}")
+            st.markdown(f"**⚡ Difficulty:** {q.get('difficulty', 'Medium')}")
+        
+        st.markdown("---")
+        st.markdown(f"**❓ Question:**")
+        st.write(q.get('question'))
+        
+        if q.get('answer'):
+            st.markdown(f"**✅ Answer:**")
+            st.write(q.get('answer'))
+        
+        if q.get('followup'):
+            st.markdown(f"**🔄 Follow-up:**")
+            st.write(q.get('followup'))
+        
+        if q.get('followup_answer'):
+            st.markdown(f"**✅ Follow-up Answer:**")
+            st.write(q.get('followup_answer'))
+
+def go_to_page(cursor):
+    """Button callback: show the page starting at `cursor` on the next rerun"""
+    st.session_state.page_cursor = cursor
+
+def render_page_controls(prev_cursor, next_cursor):
+    """Previous/next page buttons for the current search"""
+    prev_col, next_col = st.columns(2)
+    with prev_col:
+        if prev_cursor:
+            st.button("⬅️ Previous page", key="prev_page", on_click=go_to_page, args=(prev_cursor,))
+    with next_col:
+        if next_cursor:
+            st.button("Next page ➡️", key="next_page", on_click=go_to_page, args=(next_cursor,))
+
 # Search button
 if st.button("🔍 Get Questions", type="primary", key="search"):
+    st.session_state.page_cursor = None
+    st.session_state.search = {
+        "company": company_name,
+        "years_of_experience": years_exp,
+        "category": None if category == "All" else category,
+        "difficulty": None if difficulty == "All" else difficulty,
+    }
     if company_name:
         with st.spinner(f"Searching questions for {company_name}..."):
             try:
-                # Get questions
-                response = st.session_state.bot.get_interview_questions(
+                # Summary slots sit above the list and are filled in as questions stream in
+                status = st.empty()
+                breakdown = st.empty()
+                results = st.container()
+                
+                # Render each question of the first page as soon as the bot
+                # yields it; the rest are only counted. The bot caches and
+                # pins the finished list, and later pages are cut from it.
+                source_counts = {}
+                streamed = []
+                for q in st.session_state.bot.iter_interview_questions(
                     company_name,
                     years_exp,
                     None if category == "All" else category,
-                    None if difficulty == "All" else difficulty
-                )
+                    None if difficulty == "All" else difficulty,
+                    deadline_ms=WEB_SEARCH_DEADLINE_MS
+                ):
+                    streamed.append(q)
+                    total_questions = len(streamed)
+                    source = q.get('source', 'Unknown')
+                    source_counts[source] = source_counts.get(source, 0) + 1
+                    status.info(f"⏳ {total_questions} questions so far...")
+                    if total_questions <= PAGE_SIZE:
+                        with results:
+                            render_question(total_questions, q)
                 
-                if response.get("questions"):
-                    total_questions = len(response['questions'])
-                    st.success(f"🎉 Found {total_questions} questions from multiple sources!")
+                total_questions = len(streamed)
+                if total_questions:
+                    status.success(f"🎉 Found {total_questions} questions from multiple sources!")
                     
                     # Show source breakdown
-                    source_counts = {}
-                    for q in response['questions']:
-                        source = q.get('source', 'Unknown')
-                        source_counts[source] = source_counts.get(source, 0) + 1
-                    
                     if len(source_counts) > 1:
-                        st.info("📊 **Sources breakdown:** " + " | ".join([f"{source}: {count}" for source, count in source_counts.items()]))
-                    
-                    # Display questions in a clean format with source icons
-                    source_icons = {
-                        'Glassdoor': '💼',
-                        'GeeksforGeeks': '🎓', 
-                        'AmbitionBox': '💡',
-                        'LinkedIn': '💼',
-                        'Naukri': '🔍',
-                        'Indeed': '🔍',
-                        'InterviewBit': '💻',
-                        'CareerCup': '👨‍💻',
-                        'LeetCode': '🧮',
-                        'Web Search': '🌐',
-                        'Generated Template': '🤖'
-                    }
-                    
-                    for i, q in enumerate(response["questions"], 1):
-                        source = q.get('source', 'Generated')
-                        icon = source_icons.get(source, '📝')
-                        
-                        with st.expander(f"Question #{i}: {q.get('question', '')[:80]}... {icon}"):
-                            col1, col2 = st.columns([3, 1])
-                            
-                            with col1:
-                                st.markdown(f"**{icon} Source:** {source}")
-                                if q.get('url'):
-                                    st.markdown(f"**🔗 URL:** [View Source]({q.get('url')})")
-                            
-                            with col2:
-                                st.markdown(f"**📂 Category:** {q.get('category', 'General')}")
-                                st.markdown(f"**⚡ Difficulty:** {q.get('difficulty', 'Medium')}")
-                            
-                            st.markdown("---")
-                            st.markdown(f"**❓ Question:**")
-                            st.write(q.get('question'))
-                            
-                            if q.get('answer'):
-                                st.markdown(f"**✅ Answer:**")
-                                st.write(q.get('answer'))
-                            
-                            if q.get('followup'):
-                                st.markdown(f"**🔄 Follow-up:**")
-                                st.write(q.get('followup'))
-                            
-                            if q.get('followup_answer'):
-                                st.markdown(f"**✅ Follow-up Answer:**")
-                                st.write(q.get('followup_answer'))
+                        breakdown.info("📊 **Sources breakdown:** " + " | ".join([f"{source}: {count}" for source, count in source_counts.items()]))
+                    if total_questions > PAGE_SIZE:
+                        st.caption(f"Showing questions 1-{PAGE_SIZE} of {total_questions}")
+                        render_page_controls(None, encode_cursor(PAGE_SIZE, snapshot_id(streamed)))
                 else:
-                    st.warning("No questions found. Trying without filters...")
-                    # Retry without filters
-                    response = st.session_state.bot.get_interview_questions(
+                    status.warning("No questions found. Trying without filters...")
+                    # Retry without filters, showing the first page
+                    response = st.session_state.bot.get_interview_questions_page(
                         company_name,
-                        years_exp
+                        years_exp,
+                        page_size=PAGE_SIZE,
+                        deadline_ms=WEB_SEARCH_DEADLINE_MS
                     )
                     if response.get("questions"):
-                        st.success(f"Found {len(response['questions'])} general questions!")
+                        st.success(f"Found {response['total']} general questions!")
                         for i, q in enumerate(response["questions"], 1):
                             with st.expander(f"Question #{i}: {q.get('question', '')[:100]}..."):
                                 st.markdown(f"**Category:** {q.get('category', 'General')}")
@@ -162,6 +209,23 @@ if st.button("🔍 Get Questions", type="primary", key="search"):
                 st.info("Please try again with different search criteria.")
     else:
         st.warning("Please enter a company name!")
+elif st.session_state.get("page_cursor") and st.session_state.get("search", {}).get("company"):
+    # A later page of the last search, sliced from the result the first page was
+    # streamed from (the bot pins it; it reports results_changed once that is gone)
+    page = st.session_state.bot.get_interview_questions_page(
+        **st.session_state.search,
+        cursor=st.session_state.page_cursor,
+        page_size=PAGE_SIZE,
+        deadline_ms=WEB_SEARCH_DEADLINE_MS
+    )
+    if page.get("status") == "success":
+        offset = page["offset"]
+        st.caption(f"Showing questions {offset + 1}-{offset + len(page['questions'])} of {page['total']}")
+        for i, q in enumerate(page["questions"], offset + 1):
+            render_question(i, q)
+        render_page_controls(page["prev_cursor"], page["next_cursor"])
+    else:
+        st.error(page.get("message", "Could not load this page."))
 
 # Footer
 st.markdown("---")
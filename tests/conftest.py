@@ -0,0 +1,14 @@
+"""Shared setup for the Python tests (run with ``python -m pytest`` from the repo root)"""
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_DIR = os.path.join(ROOT, 'interview_bot')
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Keep the caches of test runs out of the package directory and the user's cache
+os.environ['INTERVIEW_BOT_CACHE_DIR'] = tempfile.mkdtemp(prefix='interview-bot-tests-')
+os.environ.pop('INTERVIEW_BOT_CACHE_DB', None)
@@ -0,0 +1,143 @@
+"""The package InterviewBot (interview_bot.bot, used by the Streamlit app), with the web search stubbed out"""
+import json
+import os
+import shutil
+
+import pytest
+
+from conftest import PACKAGE_DIR
+from interview_bot import bot as botmod
+from interview_bot.bot import InterviewBot
+
+
+class FakeWeb:
+    """Stands in for web_search: a settable result list and its cache stamp"""
+
+    def __init__(self):
+        self.questions = []
+        self.stamp = 1.0
+        self.searches = 0
+
+    def iter_interview_questions(self, company, role, category, deadline_ms=None, dedup_threshold=None):
+        self.searches += 1
+        return iter([dict(q) for q in self.questions])
+
+    def web_results_stamp(self, company, role, category):
+        return self.stamp
+
+
+@pytest.fixture
+def web(monkeypatch):
+    fake = FakeWeb()
+    monkeypatch.setattr(botmod, 'iter_interview_questions', fake.iter_interview_questions)
+    monkeypatch.setattr(botmod, 'web_results_stamp', fake.web_results_stamp)
+    return fake
+
+
+@pytest.fixture
+def bot(web):
+    bot = InterviewBot()
+    # Caches are shared per store, so start every test from empty ones
+    bot.result_cache.clear()
+    bot.result_snapshots.clear()
+    return bot
+
+
+def web_question(text):
+    return {'question': text, 'answer': 'A', 'category': 'Selenium', 'difficulty': 'Medium',
+            'source': 'https://example.com/' + text.replace(' ', '-')}
+
+
+def texts(response):
+    return [q['question'] for q in response['questions']]
+
+
+def test_repeated_search_is_served_from_cache(bot, web):
+    web.questions = [web_question('How do you locate shadow DOM elements')]
+    first = bot.get_interview_questions('Google', 3)
+    second = bot.get_interview_questions('Google', 3)
+    assert first == second
+    assert web.searches == 1
+    assert bot.get_result_cache_stats()['hits'] == 1
+
+
+def test_new_web_results_invalidate_the_cache(bot, web):
+    web.questions = [web_question('How do you locate shadow DOM elements')]
+    bot.get_interview_questions('Google', 3)
+    web.questions.append(web_question('Explain the page object model pattern'))
+    web.stamp = 2.0
+    assert 'Explain the page object model pattern' in texts(bot.get_interview_questions('Google', 3))
+    assert web.searches == 2
+
+
+def test_deadline_results_are_not_served_without_deadline(bot, web):
+    bot.get_interview_questions('Google', 3, deadline_ms=1)
+    bot.get_interview_questions('Google', 3)
+    assert web.searches == 2
+
+
+def test_changed_database_is_reloaded(bot, web, tmp_path):
+    db_path = tmp_path / 'questions_db.json'
+    shutil.copy(os.path.join(PACKAGE_DIR, 'questions_db.json'), db_path)
+    bot.db_path = str(db_path)
+    before = texts(bot.get_interview_questions('Google', 1))
+
+    db = json.loads(db_path.read_text())
+    db['companies']['Google']['0-2'].append(
+        {'question': 'How would you test a search box?', 'category': 'Selenium', 'difficulty': 'Basic'})
+    db_path.write_text(json.dumps(db))
+    os.utime(db_path, ns=(0, os.stat(db_path).st_mtime_ns + 10 ** 9))
+
+    after = texts(bot.get_interview_questions('Google', 1))
+    assert 'How would you test a search box?' in after
+    assert 'How would you test a search box?' not in before
+
+
+def all_pages(bot, company, years, page_size=2):
+    pages, cursor = [], None
+    while True:
+        page = bot.get_interview_questions_page(company, years, cursor=cursor, page_size=page_size)
+        assert page['status'] == 'success', page
+        pages.append(page)
+        cursor = page['next_cursor']
+        if cursor is None:
+            return pages
+
+
+def test_pages_stay_on_the_first_pages_result(bot, web):
+    web.questions = [web_question('Web question %d' % i) for i in range(6)]
+    first = bot.get_interview_questions_page('Google', 3, page_size=2)
+    expected = texts(bot.get_interview_questions('Google', 3))
+
+    # A background refresh changes the results while the user is paging
+    web.questions = [web_question('Other question %d' % i) for i in range(6)]
+    web.stamp = 2.0
+    seen, cursor = texts(first), first['next_cursor']
+    while cursor:
+        page = bot.get_interview_questions_page('Google', 3, cursor=cursor, page_size=2)
+        seen += texts(page)
+        cursor = page['next_cursor']
+    assert seen == expected
+
+
+def test_expired_snapshot_reports_changed_results(bot, web):
+    web.questions = [web_question('Web question %d' % i) for i in range(6)]
+    cursor = bot.get_interview_questions_page('Google', 3, page_size=2)['next_cursor']
+    web.questions = [web_question('Other question %d' % i) for i in range(6)]
+    web.stamp = 2.0
+    bot.result_snapshots.clear()  # as after PAGE_SNAPSHOT_TTL
+    page = bot.get_interview_questions_page('Google', 3, cursor=cursor, page_size=2)
+    assert page['status'] == 'error'
+    assert page['code'] == 'results_changed'
+
+
+def test_unchanged_results_page_after_snapshot_expiry(bot, web):
+    pages = all_pages(bot, 'Google', 3)
+    bot.result_snapshots.clear()
+    assert bot.get_interview_questions_page('Google', 3, cursor=pages[0]['next_cursor'], page_size=2) == pages[1]
+
+
+def test_tampered_cursor_is_an_error(bot, web):
+    page = bot.get_interview_questions_page('Google', 3, cursor='bogus', page_size=2)
+    assert page['status'] == 'error'
+    assert 'Invalid page cursor' in page['message']
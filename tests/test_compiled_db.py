@@ -0,0 +1,86 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from conftest import PACKAGE_DIR
+from interview_bot import compiled_db
+from interview_bot.compiled_db import compiled_path, open_shards, read_db
+from interview_bot.question_store import CompanyShards
+
+SOURCE_DB = os.path.join(PACKAGE_DIR, 'questions_db.json')
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / 'questions_db.json'
+    shutil.copy(SOURCE_DB, path)
+    return str(path)
+
+
+def load_json(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def test_round_trip_matches_json(db_path):
+    expected = load_json(db_path)
+    assert read_db(db_path) == expected
+    # Second open reads the artifact written by the first
+    assert os.path.exists(compiled_path(db_path))
+    assert read_db(db_path) == expected
+
+
+def test_artifact_goes_to_the_cache_dir(db_path, tmp_path):
+    path = compiled_path(db_path)
+    assert os.path.dirname(path) == os.environ['INTERVIEW_BOT_CACHE_DIR']
+    assert not list(tmp_path.glob('*.qdb'))
+    other = tmp_path / 'other' / 'questions_db.json'
+    other.parent.mkdir()
+    assert compiled_path(str(other)) != path
+
+
+def test_changed_source_is_recompiled(db_path):
+    read_db(db_path)
+    db = load_json(db_path)
+    db['companies']['Newco'] = {'0-2': [{'question': 'Why Newco?', 'category': 'General'}]}
+    with open(db_path, 'w', encoding='utf-8') as file:
+        json.dump(db, file)
+    assert read_db(db_path) == db
+
+
+def test_corrupt_artifact_is_rebuilt(db_path):
+    read_db(db_path)
+    path = compiled_path(db_path)
+    with open(path, 'r+b') as file:
+        file.seek(80)
+        file.write(b'garbage')
+    assert read_db(db_path) == load_json(db_path)
+
+
+def test_unwritable_cache_dir_serves_from_memory(db_path, tmp_path, monkeypatch):
+    blocker = tmp_path / 'file'
+    blocker.write_text('not a directory')
+    monkeypatch.setattr(compiled_db, 'get_cache_dir', lambda: str(blocker))
+    assert read_db(db_path) == load_json(db_path)
+
+
+def test_shards_load_lazily_with_lru(db_path):
+    shard_file = open_shards(db_path)
+    shards = CompanyShards(shard_file, maxsize=2)
+    companies = list(shards)
+    assert len(companies) >= 3
+    assert shards.loaded() == ()
+
+    first, second, third = companies[:3]
+    shards[first], shards[second], shards[first]
+    assert shards.loaded() == (second, first)
+    shards[third]
+    assert shards.loaded() == (first, third)
+    assert shards.loads == 3
+
+    shards[second]
+    assert shards.loads == 4
+    with pytest.raises(KeyError):
+        shards['No Such Company']
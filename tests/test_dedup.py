@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from interview_bot import dedup
+from interview_bot.dedup import NearDuplicateDetector, choose_bands, dedupe, jaccard, shingles
+
+QUESTIONS = [
+    "How do you handle dynamic elements in Selenium WebDriver?",
+    "how do you handle dynamic elements in selenium webdriver",
+    "How do you handle dynamic web elements in Selenium WebDriver?",
+    "What is the difference between implicit and explicit waits?",
+    "Explain the Page Object Model design pattern.",
+    "Explain the difference between implicit and explicit waits in Selenium and Appium.",
+    "?!",
+    "?!",
+]
+
+
+def brute_force(texts, threshold):
+    """dedupe() by comparing every pair, for texts that all have words"""
+    kept = []
+    for i, text in enumerate(texts):
+        if all(jaccard(shingles(text), shingles(texts[j])) < threshold for j in kept):
+            kept.append(i)
+    return kept
+
+
+def test_shingles_ignore_case_and_punctuation():
+    assert shingles("Hello, World!") == frozenset(["hello world"])
+    assert shingles("a b c") == frozenset(["a b", "b c"])
+    assert shingles("...") == frozenset()
+
+
+def test_choose_bands_catches_pairs_at_the_threshold():
+    for threshold in (0.5, 0.8, 0.9):
+        bands, rows = choose_bands(threshold, 64)
+        assert bands * rows <= 64
+        assert 1 - (1 - threshold ** rows) ** bands >= 0.95
+
+
+def test_near_duplicates_are_dropped():
+    kept = [QUESTIONS[i] for i in dedupe(QUESTIONS)]
+    assert kept == [
+        "How do you handle dynamic elements in Selenium WebDriver?",
+        "How do you handle dynamic web elements in Selenium WebDriver?",
+        "What is the difference between implicit and explicit waits?",
+        "Explain the Page Object Model design pattern.",
+        "Explain the difference between implicit and explicit waits in Selenium and Appium.",
+        "?!",
+    ]
+
+
+def test_lower_threshold_merges_rewordings():
+    assert 2 in dedupe(QUESTIONS)
+    assert 2 not in dedupe(QUESTIONS, threshold=0.5)
+
+
+def test_find_reports_the_kept_question():
+    detector = NearDuplicateDetector()
+    for text in QUESTIONS[:4]:
+        detector.add(text)
+    assert detector.find("How do you handle DYNAMIC elements in Selenium WebDriver") == 0
+    assert detector.find("Reverse a linked list") is None
+    assert len(detector) == 3
+
+
+@pytest.mark.parametrize('threshold', [0.5, 0.8])
+def test_agrees_with_brute_force(threshold):
+    rng = random.Random(7)
+    words = ["word%d" % i for i in range(500)]
+    originals = [' '.join(rng.sample(words, 15)) for _ in range(100)]
+    # Each original again with one word appended: Jaccard 14/15 with it
+    texts = originals + [text + ' extra' for text in originals]
+    assert brute_force(texts, threshold) == list(range(100))
+
+    kept = dedupe(texts, threshold)
+    # Every dropped text really is a near-duplicate of one kept before it
+    for i in set(range(len(texts))) - set(kept):
+        assert any(jaccard(shingles(texts[i]), shingles(texts[j])) >= threshold for j in kept if j < i)
+    # LSH finds similar pairs with high probability, not always
+    assert kept[:100] == list(range(100))
+    assert len(kept) <= 105
+
+def test_pure_python_signatures_match_numpy(monkeypatch):
+    pytest.importorskip('numpy')
+    shingle_set = shingles(QUESTIONS[0])
+    with_numpy = NearDuplicateDetector().signature(shingle_set)
+    monkeypatch.setattr(dedup, '_numpy', False)
+    assert NearDuplicateDetector().signature(shingle_set) == with_numpy
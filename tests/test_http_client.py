@@ -0,0 +1,122 @@
+"""HttpClient against a local HTTP server (no network needed)"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('requests')
+
+from interview_bot.http_client import HttpClient  # noqa: E402
+from interview_bot.rate_limiter import RateLimiter  # noqa: E402
+from interview_bot.scrape_cache import ScrapeCache  # noqa: E402
+
+
+class Site:
+    """What the test server answers with; `requests` records each request's headers"""
+
+    def __init__(self):
+        self.body = 'v1'
+        self.etag = '"v1"'
+        self.last_modified = None
+        self.failures = 0  # 503s to answer before succeeding
+        self.requests = []
+
+
+@pytest.fixture
+def site():
+    site = Site()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            site.requests.append(dict(self.headers))
+            if site.failures:
+                site.failures -= 1
+                self.send_response(503)
+                self.end_headers()
+                return
+            if (site.etag and self.headers.get('If-None-Match') == site.etag) or \
+                    (site.last_modified and self.headers.get('If-Modified-Since') == site.last_modified):
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = site.body.encode()
+            self.send_response(200)
+            if site.etag:
+                self.send_header('ETag', site.etag)
+            if site.last_modified:
+                self.send_header('Last-Modified', site.last_modified)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    site.url = f'http://127.0.0.1:{server.server_address[1]}/questions'
+    yield site
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client():
+    client = HttpClient(backoff=0.01, rate_limiter=RateLimiter(default=(1000.0, 100)))
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ScrapeCache(str(tmp_path / 'cache.db'))
+
+
+def fetch(client, site, cache, parses):
+    def parse(text):
+        parses.append(text)
+        return {'body': text}
+    return client.get_parsed(site.url, 'test', parse, cache=cache)
+
+
+def test_unchanged_page_is_not_parsed_again(client, site, cache):
+    parses = []
+    assert fetch(client, site, cache, parses) == {'body': 'v1'}
+    assert fetch(client, site, cache, parses) == {'body': 'v1'}
+    assert parses == ['v1']
+    assert site.requests[1]['If-None-Match'] == '"v1"'
+
+
+def test_changed_page_is_parsed(client, site, cache):
+    parses = []
+    fetch(client, site, cache, parses)
+    site.body, site.etag = 'v2', '"v2"'
+    assert fetch(client, site, cache, parses) == {'body': 'v2'}
+    assert fetch(client, site, cache, parses) == {'body': 'v2'}
+    assert parses == ['v1', 'v2']
+
+
+def test_last_modified_validator(client, site, cache):
+    site.etag, site.last_modified = None, 'Wed, 21 Oct 2026 07:28:00 GMT'
+    parses = []
+    fetch(client, site, cache, parses)
+    assert fetch(client, site, cache, parses) == {'body': 'v1'}
+    assert parses == ['v1']
+    assert site.requests[1]['If-Modified-Since'] == site.last_modified
+
+
+def test_page_without_validators_is_always_parsed(client, site, cache):
+    site.etag = None
+    parses = []
+    fetch(client, site, cache, parses)
+    fetch(client, site, cache, parses)
+    assert parses == ['v1', 'v1']
+    assert 'If-None-Match' not in site.requests[1]
+
+
+def test_retries_then_gives_up(client, site, cache):
+    site.failures = 1
+    assert fetch(client, site, cache, []) == {'body': 'v1'}
+    site.etag, site.failures = '"v3"', client.retries + 1
+    assert fetch(client, site, cache, []) is None
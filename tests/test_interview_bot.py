@@ -0,0 +1,90 @@
+"""The flat interview_bot.InterviewBot (main.py, web_app.py), run in a copy of the package directory.
+
+It imports its siblings as top-level modules and rewrites questions_db_fixed.json
+for unknown companies, so each test runs it in a subprocess on a scratch copy.
+"""
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from conftest import PACKAGE_DIR
+
+BOT_SCRIPT = """
+import json, sys
+from interview_bot import InterviewBot
+bot = InterviewBot()
+bot.search_internet = lambda *args, **kwargs: None  # no network in tests
+args = json.loads(sys.argv[1])
+result = bot.get_interview_questions(*args["args"], **args.get("kwargs", {}))
+print("RESULT " + json.dumps(result, default=str))
+"""
+
+
+@pytest.fixture
+def bot_dir(tmp_path):
+    target = tmp_path / 'interview_bot'
+    shutil.copytree(PACKAGE_DIR, target, ignore=shutil.ignore_patterns(
+        '__pycache__', '*.qdb', 'scrape_cache.db*', 'chat_history', 'templates'))
+    return target
+
+
+def run_script(bot_dir, script, *argv):
+    """Run `script` in the package copy and return the JSON it printed after RESULT"""
+    output = subprocess.run(
+        [sys.executable, '-c', script, *argv],
+        cwd=bot_dir, capture_output=True, text=True, timeout=120, env=dict(os.environ),
+    )
+    lines = [line for line in output.stdout.splitlines() if line.startswith('RESULT ')]
+    assert lines, output.stdout + output.stderr
+    return json.loads(lines[-1][len('RESULT '):])
+
+
+def get_questions(bot_dir, *args, **kwargs):
+    return run_script(bot_dir, BOT_SCRIPT, json.dumps({"args": args, "kwargs": kwargs}))
+
+
+def test_known_company(bot_dir):
+    result = get_questions(bot_dir, 'Google', 1)
+    assert result['status'] == 'success'
+    assert result['company'] == 'Google'
+
+
+def test_unknown_company_gets_fallback_questions(bot_dir):
+    result = get_questions(bot_dir, 'Zzqx Corp', 3)
+    assert result['status'] == 'success', result.get('message')
+    assert result['questions']
+
+
+def test_unknown_company_fallback_respects_category(bot_dir):
+    result = get_questions(bot_dir, 'Zzqx Corp', 1, category='Selenium')
+    assert result['status'] == 'success'
+    assert {q['category'] for q in result['questions']} == {'Selenium'}
+
+
+PARSER_SCRIPT = """
+import importlib.util
+import json
+import web_app
+from chat_interface import ChatBot
+chat = ChatBot()
+parser = web_app.bot.get_message_parser()
+parsed = parser.parse("google questions for 3 years")
+print("RESULT " + json.dumps({
+    "shared": chat.bot.get_message_parser() is parser,
+    "per_store": parser is web_app.bot.store.derived("message_parser", None),
+    "company": parsed.company,
+    "years": parsed.years,
+}))
+"""
+
+
+@pytest.mark.skipif(importlib.util.find_spec('flask') is None, reason="flask is not installed")
+def test_web_app_and_chat_share_the_message_parser(bot_dir):
+    assert run_script(bot_dir, PARSER_SCRIPT) == {
+        "shared": True, "per_store": True, "company": "Google", "years": "3",
+    }
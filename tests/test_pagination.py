@@ -0,0 +1,90 @@
+import base64
+
+import pytest
+
+from interview_bot.pagination import (
+    MAX_PAGE_SIZE, ResultsChanged, clamp_page_size, decode_cursor, encode_cursor, page_footer,
+    paginate_response, snapshot_id,
+)
+
+
+def response(count):
+    return {'status': 'success', 'company': 'Acme',
+            'questions': [{'question': 'Q%d' % i, 'source': 's'} for i in range(count)]}
+
+
+def raw_cursor(payload):
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(None) == (0, None)
+    assert decode_cursor('') == (0, None)
+    assert decode_cursor(encode_cursor(0)) == (0, None)
+    assert decode_cursor(encode_cursor(20, 'abc123')) == (20, 'abc123')
+    assert '=' not in encode_cursor(7, 'abc123')
+
+
+@pytest.mark.parametrize('cursor', [
+    'not base64!',
+    raw_cursor('x:10:abc'),  # unknown prefix
+    raw_cursor('o:-1:abc'),  # negative offset
+    raw_cursor('o:ten:abc'),  # not a number
+    raw_cursor('o:10'),  # later page without its snapshot
+    raw_cursor('o:10:'),
+])
+def test_tampered_cursors_are_rejected(cursor):
+    with pytest.raises(ValueError, match='Invalid page cursor'):
+        decode_cursor(cursor)
+
+
+def test_snapshot_id_depends_on_the_list():
+    questions = response(3)['questions']
+    assert snapshot_id(questions) == snapshot_id([dict(q) for q in questions])
+    assert snapshot_id(questions) != snapshot_id(questions[::-1])
+    assert snapshot_id(questions) != snapshot_id(questions[:2])
+
+
+def test_pages_walk_the_whole_list():
+    full = response(25)
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = paginate_response(full, cursor, page_size=10)
+        seen += page['questions']
+        pages += 1
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+    assert seen == full['questions']
+    assert pages == 3
+    assert page['offset'] == 20 and page['total'] == 25
+    assert paginate_response(full, page['prev_cursor'], 10)['offset'] == 10
+
+
+def test_first_page_has_no_prev_cursor():
+    page = paginate_response(response(5), None, 10)
+    assert page['prev_cursor'] is None and page['next_cursor'] is None
+    assert len(page['questions']) == 5
+
+
+def test_cursor_from_another_result_raises():
+    cursor = paginate_response(response(25), None, 10)['next_cursor']
+    with pytest.raises(ResultsChanged):
+        paginate_response(response(24), cursor, 10)
+
+
+def test_non_question_responses_pass_through():
+    error = {'status': 'error', 'message': 'nope'}
+    assert paginate_response(error, 'garbage') is error
+
+
+def test_page_size_is_clamped():
+    assert clamp_page_size('abc') == 10
+    assert clamp_page_size(0) == 1
+    assert clamp_page_size(10 ** 6) == MAX_PAGE_SIZE
+
+
+def test_page_footer():
+    page = paginate_response(response(25), None, 10)
+    assert page_footer(page) == "Showing questions 1-10 of 25. Say 'more' for the next page.\n"
+    assert page_footer(response(3)) == ""
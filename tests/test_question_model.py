@@ -0,0 +1,54 @@
+import pytest
+
+from interview_bot.question_model import Question, compact_companies, question_dicts
+
+DATA = {'question': 'Why?', 'category': 'General', 'answer': 'Because', 'tags': ['a']}
+
+
+def test_record_reads_like_the_dict():
+    q = Question.from_dict(DATA)
+    assert q.to_dict() == DATA
+    assert q['question'] == 'Why?' and q.get('tags') == ['a']
+    assert 'answer' in q and 'difficulty' not in q
+    assert q.get('difficulty', 'Medium') == 'Medium'
+    assert set(q.keys()) == set(DATA)
+    with pytest.raises(KeyError):
+        q['difficulty']
+
+
+def test_records_are_read_only():
+    q = Question.from_dict(DATA)
+    with pytest.raises(AttributeError):
+        q.answer = 'Changed'
+    with pytest.raises(AttributeError):
+        del q.answer
+    changed = q.replace(answer='Changed')
+    assert changed['answer'] == 'Changed' and q['answer'] == 'Because'
+
+
+def test_metadata_strings_are_shared():
+    a = Question.from_dict({'question': 'A', 'category': ''.join(['Sel', 'enium'])})
+    b = Question.from_dict({'question': 'B', 'category': ''.join(['Seleni', 'um'])})
+    assert a.category is b.category
+
+
+def test_from_dict_and_with_defaults_avoid_copies():
+    q = Question.from_dict(DATA)
+    assert Question.from_dict(q) is q
+    assert q.with_defaults({'category': 'Other'}) is q
+    filled = q.with_defaults({'difficulty': 'Medium'}, experience_range='0-2')
+    assert (filled['difficulty'], filled['experience_range']) == ('Medium', '0-2')
+    assert filled.with_defaults({'difficulty': 'Hard'}, experience_range='0-2') is filled
+
+
+def test_question_dicts_and_compact_companies():
+    companies = compact_companies({'Acme': {'0-2': [DATA]}, 'Meta': 'not a company'})
+    record = companies['Acme']['0-2'][0]
+    assert isinstance(companies['Acme']['0-2'], tuple)
+    assert record['experience_range'] == '0-2'
+    assert companies['Meta'] == 'not a company'
+
+    response = {'status': 'success', 'questions': companies['Acme']['0-2']}
+    assert question_dicts(response)['questions'] == [dict(DATA, experience_range='0-2')]
+    error = {'status': 'error'}
+    assert question_dicts(error) is error
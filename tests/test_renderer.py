@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from interview_bot.pagination import paginate_response
+from interview_bot.question_model import Question
+from interview_bot.renderer import ResponseRenderer
+
+
+def response(*questions, **extra):
+    return dict({'status': 'success', 'company': 'Acme', 'experience_range': '0-2',
+                 'questions': list(questions)}, **extra)
+
+
+QUESTION = {'question': 'What is a <div>?', 'answer': 'A & B', 'category': 'HTML', 'difficulty': 'Basic'}
+
+
+def test_bot_text():
+    text = ResponseRenderer('bot').render(response(
+        QUESTION, {'question': 'Why Acme?', 'source': 'https://example.com', 'followup': 'Why now?'}))
+    assert text == (
+        "\nInterview Questions for Acme (0-2 years experience)\n" + "=" * 80 + "\n\n"
+        "Question #1:\nCategory: HTML\nQ: What is a <div>?\nA: A & B\n" + "-" * 40 + "\n\n"
+        "Question #2:\n[Found from online source]\nCategory: General\nQ: Why Acme?\nFollow-up: Why now?\n"
+        + "-" * 40 + "\n\n"
+    )
+
+
+def test_legacy_text():
+    text = ResponseRenderer('legacy').render(response(dict(QUESTION, type='Theory')))
+    assert text.endswith(
+        "Question #1:\n==========\nTopic: What is a <div>?\nCategory: HTML\nDifficulty: Basic\n"
+        "Asked in: N/A\nType: Theory\n\nAnswer:\n-------\nA & B\n\n" + "=" * 80 + "\n\n"
+    )
+
+
+def test_markdown():
+    text = ResponseRenderer('bot').render(response(QUESTION), 'markdown')
+    assert text.startswith("## Interview Questions for Acme (0-2 years experience)\n\n### Question 1\n\n")
+    assert "**Q:** What is a <div>?\n\n**Category:** HTML | **Difficulty:** Basic\n\n" in text
+    assert "**Answer:**\n\nA & B\n\n---\n\n" in text
+
+
+def test_html_is_escaped():
+    text = ResponseRenderer('bot').render(response(QUESTION, company='<b>Acme</b>'), 'html')
+    assert '<p class="question-text">What is a &lt;div&gt;?</p>' in text
+    assert '<pre class="answer">A &amp; B</pre>' in text
+    assert '&lt;b&gt;Acme&lt;/b&gt;' in text
+    assert text.startswith('<div class="questions">') and text.endswith('</div>')
+
+
+def test_json_round_trip():
+    page = paginate_response(response(*[dict(QUESTION, id=i) for i in range(3)]), None, 2)
+    page['questions'] = [Question.from_dict(q) for q in page['questions']]
+    data = json.loads(ResponseRenderer('bot').render(page, 'json'))
+    assert data['status'] == 'success'
+    assert (data['company'], data['total'], data['offset']) == ('Acme', 3, 0)
+    assert data['next_cursor'] == page['next_cursor']
+    assert data['questions'] == [dict(QUESTION, id=0), dict(QUESTION, id=1)]
+
+
+def test_errors():
+    renderer = ResponseRenderer('bot')
+    error = {'status': 'error', 'message': 'No <data>'}
+    assert renderer.render(error) == 'Error: No <data>'
+    assert renderer.render(error, 'html') == '<p class="error">No &lt;data&gt;</p>'
+    assert json.loads(renderer.render(error, 'json')) == {'status': 'error', 'message': 'No <data>'}
+    with pytest.raises(ValueError):
+        renderer.render(error, 'pdf')
+
+
+def test_pages_are_numbered_from_their_offset():
+    full = response(*[dict(QUESTION, question='Q%d' % i) for i in range(5)])
+    page = paginate_response(full, paginate_response(full, None, 2)['next_cursor'], 2)
+    text = ResponseRenderer('bot').render(page)
+    assert 'Question #3:' in text and 'Question #4:' in text and 'Question #1:' not in text
+    assert text.endswith("Showing questions 3-4 of 5. Say 'more' for the next page.\n")
+
+
+def test_memoized_bodies_follow_changes():
+    renderer = ResponseRenderer('bot')
+    first = renderer.render(response(QUESTION))
+    assert renderer.render(response(dict(QUESTION))) == first
+    changed = renderer.render(response(dict(QUESTION, answer='C')))
+    assert 'A: C\n' in changed and 'A: A & B' not in changed
+
+
+def test_category_listing():
+    categories = {'Selenium': ['Locators', 'Waits']}
+    text = ResponseRenderer('legacy').render(response(QUESTION), categories=categories)
+    assert text.endswith("\nAvailable Categories:\nSelenium: Locators, Waits\n")
+    html = ResponseRenderer('legacy').render(response(QUESTION), 'html', categories=categories)
+    assert '<li><b>Selenium:</b> Locators, Waits</li></ul>\n</div>' in html
@@ -0,0 +1,47 @@
+from interview_bot.result_cache import ResultCache
+
+
+def test_hit_and_miss_counts():
+    cache = ResultCache()
+    assert cache.get('k') is None
+    cache.put('k', 'value')
+    assert cache.get('k') == 'value'
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['size']) == (1, 1, 1)
+    assert stats['hit_rate'] == 0.5
+
+
+def test_least_recently_used_is_evicted():
+    cache = ResultCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert len(cache) == 2
+
+
+def test_expired_entries_are_misses():
+    cache = ResultCache(ttl=0)
+    cache.put('k', 'value')
+    assert cache.get('k') is None
+    assert cache.stats()['invalidations'] == 1
+    assert len(cache) == 0
+
+
+def test_changed_version_invalidates():
+    cache = ResultCache()
+    cache.put('k', 'old', version=(1, None))
+    assert cache.get('k', version=(1, None)) == 'old'
+    assert cache.get('k', version=(2, None)) is None
+    assert cache.stats()['invalidations'] == 1
+    # The stale entry is dropped, not served to a caller on the old version
+    assert cache.get('k', version=(1, None)) is None
+
+
+def test_clear():
+    cache = ResultCache()
+    cache.put('k', 'value')
+    cache.clear()
+    assert cache.get('k') is None
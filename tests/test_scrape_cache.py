@@ -0,0 +1,146 @@
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from interview_bot import scrape_cache
+from interview_bot.scrape_cache import EMPTY_TTL, ScrapeCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ScrapeCache(str(tmp_path / 'cache.db'), default_ttl=60)
+
+
+def ttl_of(entry):
+    return round(entry.expires_at - entry.created_at)
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_set_get_and_ttl(cache):
+    assert cache.get('ns', 'k') is None
+    cache.set('ns', 'k', {'a': [1, 2]})
+    entry = cache.get('ns', 'k')
+    assert entry.value == {'a': [1, 2]}
+    assert ttl_of(entry) == 60
+    assert not entry.is_stale
+    assert cache.stamp('ns', 'k') == entry.created_at
+
+    cache.set('ns', 'k', 'old', ttl=0)
+    assert cache.get('ns', 'k').is_stale
+    assert cache.get('other', 'k') is None
+
+
+def test_entries_persist_across_instances(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    ScrapeCache(path).set('ns', 'k', [1])
+    assert ScrapeCache(path).get('ns', 'k').value == [1]
+
+
+def test_get_or_load_caches_hits(cache):
+    calls = []
+    loader = lambda: calls.append(1) or ['q']
+    assert cache.get_or_load('ns', 'k', loader) == ['q']
+    assert cache.get_or_load('ns', 'k', loader) == ['q']
+    assert len(calls) == 1
+
+
+def test_stale_entry_is_served_while_refreshing(cache):
+    cache.set('ns', 'k', ['old'], ttl=0)
+    refreshed = threading.Event()
+
+    def loader():
+        refreshed.wait(5)
+        return ['new']
+
+    assert cache.get_or_load('ns', 'k', loader, ttl=60) == ['old']
+    refreshed.set()
+    wait_for(lambda: cache.get('ns', 'k').value == ['new'])
+    assert not cache.get('ns', 'k').is_stale
+
+
+def test_concurrent_misses_share_one_load(cache):
+    calls = []
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return ['q']
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load('ns', 'k', loader)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: calls)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert results == [['q']] * 5
+    assert len(calls) == 1
+
+
+def test_failed_loads_are_not_cached(cache):
+    assert cache.get_or_load('ns', 'k', lambda: None) is None
+    assert cache.get('ns', 'k') is None
+
+
+def test_empty_results_use_empty_ttl(cache):
+    assert cache.get_or_load('ns', 'k', lambda: [], ttl=3600, empty_ttl=EMPTY_TTL) == []
+    assert ttl_of(cache.get('ns', 'k')) == EMPTY_TTL
+
+
+def test_empty_refresh_keeps_earlier_results(cache):
+    cache.set('ns', 'k', ['old'], ttl=0)
+    assert cache.get_or_load('ns', 'k', lambda: [], ttl=3600, empty_ttl=EMPTY_TTL) == ['old']
+    wait_for(lambda: not cache._refreshing)
+    assert cache.get('ns', 'k').value == ['old']
+
+
+def test_question_fetcher_caching(cache, monkeypatch):
+    from interview_bot.question_fetcher import CACHE_NAMESPACE, CACHE_TTL, InterviewQuestionsFetcher
+
+    monkeypatch.setattr(scrape_cache, '_default_cache', cache)
+    fetcher = InterviewQuestionsFetcher()
+    found = {'Acme': [{'question': 'Why Acme?'}], 'Empty': [], 'Down': None}
+    monkeypatch.setattr(fetcher, '_fetch_questions', lambda company, category=None: found[company])
+
+    assert fetcher.fetch_questions('Acme') == [{'question': 'Why Acme?'}]
+    assert ttl_of(cache.get(CACHE_NAMESPACE, 'Acme')) == CACHE_TTL
+    assert fetcher.fetch_questions('Empty') == []
+    assert ttl_of(cache.get(CACHE_NAMESPACE, 'Empty')) == EMPTY_TTL
+    assert fetcher.fetch_questions('Down') == []
+    assert cache.get(CACHE_NAMESPACE, 'Down') is None
+
+
+def test_default_path_is_in_the_user_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv('INTERVIEW_BOT_CACHE_DIR', raising=False)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+    assert scrape_cache.default_cache_path() == str(tmp_path / 'xdg' / 'interview_bot' / 'scrape_cache.db')
+
+    monkeypatch.setenv('INTERVIEW_BOT_CACHE_DIR', str(tmp_path / 'dir'))
+    assert ScrapeCache().path == str(tmp_path / 'dir' / 'scrape_cache.db')
+
+    monkeypatch.setenv('INTERVIEW_BOT_CACHE_DB', str(tmp_path / 'custom.db'))
+    assert ScrapeCache().path == str(tmp_path / 'custom.db')
+
+
+def test_unwritable_cache_dir_falls_back(tmp_path, monkeypatch):
+    blocker = tmp_path / 'file'
+    blocker.write_text('not a directory')
+    monkeypatch.setenv('INTERVIEW_BOT_CACHE_DIR', str(blocker / 'cache'))
+    monkeypatch.setattr(tempfile, 'gettempdir', lambda: str(tmp_path / 'tmp'))
+    cache = ScrapeCache()
+    assert cache.path == str(tmp_path / 'tmp' / ('interview_bot-%d' % os.getuid()) / 'scrape_cache.db')
+    cache.set('ns', 'k', 1)
+    assert cache.get('ns', 'k').value == 1
@@ -0,0 +1,73 @@
+import json
+
+from interview_bot.search_index import SearchIndex, stem, tokenize
+
+
+def make_index(*texts):
+    index = SearchIndex()
+    for i, text in enumerate(texts):
+        index.add(text, {'id': i, 'question': text})
+    return index
+
+
+def ids(results):
+    return [doc['id'] for _, doc in results]
+
+
+def test_tokenize_drops_stop_words_and_stems():
+    assert tokenize("What is the difference between Waiting and waits?") == ['difference', 'between', 'wait', 'wait']
+    assert stem('queries') == 'query'
+    assert tokenize("C++ and C#") == ['c++', 'c#']
+
+
+def test_rarer_and_more_terms_rank_higher():
+    index = make_index(
+        "Explain a binary tree",
+        "Reverse a linked list",
+        "Find the height of a binary search tree",
+        "Explain the event loop",
+    )
+    assert ids(index.search("binary search tree")) == [2, 0]
+    assert ids(index.search("explain linked list"))[0] == 1
+
+
+def test_top_k_limits_and_none_returns_all():
+    index = make_index(*["Design a cache number %d" % i for i in range(30)])
+    assert len(index.search("cache", top_k=5)) == 5
+    assert len(index.search("cache")) == 20
+    assert len(index.search("cache", top_k=None)) == 30
+
+
+def test_substring_search_matches_inside_words():
+    index = make_index("Write a paragraph parser", "What is it?", "Sort an array")
+    assert index.search("graph") == []
+    assert [doc['id'] for doc in index.substring_search("graph")] == [0]
+    assert [doc['id'] for doc in index.substring_search("WHAT IS")] == [1]
+    assert index.substring_search("a", top_k=2) == [index.docs[0], index.docs[1]]
+
+
+def test_bot_search_falls_back_to_substring(tmp_path):
+    from interview_bot.bot import InterviewBot
+
+    db = {
+        "companies": {
+            "Acme": {
+                "0-2": [
+                    {"question": "Write a paragraph parser", "category": "Coding"},
+                    {"question": "What is it?", "category": "General"},
+                    {"question": "Implement a graph search", "category": "Coding"},
+                ]
+            }
+        },
+        "categories": {"Coding": {"description": "Coding questions"}},
+    }
+    path = tmp_path / "questions.json"
+    path.write_text(json.dumps(db))
+    bot = InterviewBot()
+    bot.db_path = str(path)  # picked up as a changed database on the next search
+
+    assert [r['question'] for r in bot.search_questions("graph")] == ["Implement a graph search"]
+    assert [r['question'] for r in bot.search_questions("aragr")] == ["Write a paragraph parser"]
+    assert [r['question'] for r in bot.search_questions("what is")] == ["What is it?"]
+    assert bot.search_questions("what is")[0]['company'] == 'Acme'
+    assert len(bot.search_questions("a", top_k=None)) == 3
@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+from interview_bot.single_flight import SingleFlight
+
+
+def run_concurrently(count, target):
+    results, errors = [], []
+
+    def worker():
+        try:
+            results.append(target())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def test_overlapping_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return object()
+
+    threads, results, errors = run_concurrently(5, lambda: flight.do('key', slow))
+    assert started.wait(5)
+    time.sleep(0.05)  # let the other callers join the call in flight
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(calls) == 1
+    assert len(results) == 5 and all(result is results[0] for result in results)
+
+
+def test_errors_reach_every_waiter():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("scrape failed")
+
+    threads, results, errors = run_concurrently(3, lambda: flight.do('key', failing))
+    assert started.wait(5)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert not results
+    assert len(errors) == 3 and all(isinstance(e, RuntimeError) for e in errors)
+
+
+def test_keys_are_independent_and_results_not_reused():
+    flight = SingleFlight()
+    calls = []
+    assert flight.do('a', lambda: calls.append('a') or 1) == 1
+    assert flight.do('b', lambda: calls.append('b') or 2) == 2
+    assert flight.do('a', lambda: calls.append('a') or 3) == 3
+    assert calls == ['a', 'b', 'a']
+
+
+def test_key_is_released_after_an_error():
+    flight = SingleFlight()
+    with pytest.raises(ValueError):
+        flight.do('key', lambda: int('x'))
+    assert flight.do('key', lambda: 'ok') == 'ok'